@@ -0,0 +1,244 @@
+"""페이지 성능 벤치마크 (서버·브라우저 없이 Streamlit AppTest로 실행)
+
+pages/ 폴더의 모든 페이지를 16가지 MBTI 선택값으로 한 번씩 실행하면서 다음을 잽니다.
+
+- cold: 캐시(st.cache_data / st.cache_resource / mbti_core의 shared_resource·그래프 캐시·표 쪽 캐시·
+        데이터셋 해시)를 비우고, 워커 공유 결과 캐시(disk_cache)는 페이지마다 빈 임시 폴더를 쓰게 한 뒤 처음 실행한 시간
+        (디스크의 .cache/ Arrow 파일은 그대로 둠 = 새로 배포한 서버의 첫 워커와 같은 상태)
+- warm: 같은 선택값을 다시 골랐을 때 실행 시간
+- peak_kb: warm 실행 16번 동안 tracemalloc으로 잰 최대 Python 메모리 사용량
+- dataframe_copies: DataFrame.copy() 호출과 unpickle(st.cache_data가 돌려주는 복사본) 횟수
+- phases: 페이지 안 PhaseTimer·span()으로 잰 단계(load/compute/figure/render)별 p50/p95 (mbti_core/metrics.py)
+
+결과는 JSON 파일로 저장하고, 예전 결과(baseline)와 비교해 느려진 페이지를 알려줍니다.
+
+    python bench/bench_pages.py                          # bench/results.json 저장
+    python bench/bench_pages.py --save-baseline          # 지금 결과를 bench/baseline.json으로 저장
+    python bench/bench_pages.py --baseline bench/baseline.json --tolerance 0.25
+    python bench/bench_pages.py --pages 09 12            # 이름에 09, 12가 들어간 페이지만
+    python bench/bench_pages.py --country-csv bench/data/countriesMBTI_16types.csv   # 합성 데이터로
+
+baseline보다 (1 + tolerance)배 넘게 느려진 항목이 있으면 종료 코드 1로 끝납니다.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = ROOT_DIR / "bench"
+
+# 페이지가 mbti_core를 import할 수 있도록 (streamlit run main.py 할 때와 같은 조건)
+sys.path.insert(0, str(ROOT_DIR))
+# 백그라운드 warm-up이 cold 측정을 방해하지 않도록 끔
+os.environ["MBTI_WARMUP"] = "0"
+
+import pandas as pd  # noqa: E402
+import streamlit as st  # noqa: E402
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+MBTI_TYPES = [
+    "INTJ", "INTP", "ENTJ", "ENTP", "INFJ", "INFP", "ENFJ", "ENFP",
+    "ISTJ", "ISFJ", "ESTJ", "ESFJ", "ISTP", "ISFP", "ESTP", "ESFP",
+]
+
+
+@contextmanager
+def count_dataframe_copies():
+    """블록 안에서 일어난 DataFrame 복사 횟수를 센다 (counter["n"])."""
+    counter = {"n": 0}
+    original_copy = pd.DataFrame.copy
+    original_setstate = pd.DataFrame.__setstate__
+
+    def copy(self, *args, **kwargs):
+        counter["n"] += 1
+        return original_copy(self, *args, **kwargs)
+
+    def setstate(self, state):
+        counter["n"] += 1
+        return original_setstate(self, state)
+
+    pd.DataFrame.copy = copy
+    pd.DataFrame.__setstate__ = setstate
+    try:
+        yield counter
+    finally:
+        pd.DataFrame.copy = original_copy
+        pd.DataFrame.__setstate__ = original_setstate
+
+
+def _mbti_selectbox(at):
+    """16가지 MBTI가 모두 들어 있는 selectbox를 찾는다."""
+    for box in at.selectbox:
+        if set(MBTI_TYPES) <= set(box.options):
+            return box
+    return None
+
+
+def _timed_run(at, mbti=None) -> float:
+    started = time.perf_counter()
+    if mbti is None:
+        at.run()
+    else:
+        _mbti_selectbox(at).set_value(mbti).run()
+    elapsed = (time.perf_counter() - started) * 1000
+    if at.exception:
+        raise RuntimeError(f"{at.exception[0].value}")
+    return elapsed
+
+
+def _summary(samples: dict) -> dict:
+    values = list(samples.values())
+    return {
+        "p50_ms": round(statistics.median(values), 2),
+        "max_ms": round(max(values), 2),
+        "mean_ms": round(statistics.fmean(values), 2),
+    }
+
+
+def bench_page(path: Path, timeout: float) -> dict:
+    from mbti_core import data, disk_cache, table
+    from mbti_core.cache import clear_shared
+
+    # 캐시를 모두 비워서 서버를 막 띄운 상태로 만든다
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    clear_shared()
+    table._build_page.cache_clear()
+    data._hashes.clear()
+
+    at = AppTest.from_file(str(path), default_timeout=timeout)
+    # 다른 워커나 예전 실행이 남긴 .cache/results를 읽지 않도록 cold 실행 동안 빈 폴더를 씀
+    results_dir = disk_cache.RESULTS_DIR
+    with tempfile.TemporaryDirectory() as empty_dir, count_dataframe_copies() as cold_copies:
+        disk_cache.RESULTS_DIR = Path(empty_dir)
+        try:
+            first_run = _timed_run(at)
+            box = _mbti_selectbox(at)
+            cold = {mbti: _timed_run(at, mbti) for mbti in MBTI_TYPES} if box else {}
+        finally:
+            disk_cache.RESULTS_DIR = results_dir
+
+    result = {"first_run_ms": round(first_run, 2), "has_mbti_selectbox": box is not None}
+    if not box:
+        return result
+
+    with count_dataframe_copies() as warm_copies:
+        warm = {mbti: _timed_run(at, mbti) for mbti in MBTI_TYPES}
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    for mbti in MBTI_TYPES:
+        _timed_run(at, mbti)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 캐시를 비울 때 측정값도 같이 비워지므로 이 페이지의 cold + warm 실행만 들어 있음
+    from mbti_core.metrics import metrics_registry
+    phases = {phase: stats for (_, phase), stats in metrics_registry().summary().items()}
+
+    result.update({
+        "cold": _summary(cold),
+        "warm": _summary(warm),
+        "cold_ms": {k: round(v, 2) for k, v in cold.items()},
+        "warm_ms": {k: round(v, 2) for k, v in warm.items()},
+        "peak_kb": round(peak / 1024, 1),
+        "dataframe_copies": {"cold": cold_copies["n"], "warm": warm_copies["n"]},
+        "phases": phases,
+    })
+    return result
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    """baseline보다 느려진 (페이지, 항목, 지금, 예전) 목록"""
+    regressions = []
+    for page, now in results["pages"].items():
+        before = baseline.get("pages", {}).get(page)
+        if not before:
+            continue
+        checks = [("first_run_ms", now.get("first_run_ms"), before.get("first_run_ms"))]
+        for phase in ("cold", "warm"):
+            if phase in now and phase in before:
+                checks.append((f"{phase}.p50_ms", now[phase]["p50_ms"], before[phase]["p50_ms"]))
+        for metric, current, previous in checks:
+            if current is not None and previous and current > previous * (1 + tolerance):
+                regressions.append((page, metric, current, previous))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", nargs="*", help="이름에 이 문자열이 들어간 페이지만 실행")
+    parser.add_argument("--output", type=Path, default=BENCH_DIR / "results.json")
+    parser.add_argument("--baseline", type=Path, help="비교할 예전 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용하는 느려짐 비율 (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 bench/baseline.json에도 저장")
+    parser.add_argument("--timeout", type=float, default=60, help="페이지 한 번 실행 제한 시간(초)")
+    parser.add_argument("--country-csv", type=Path, help="국가 CSV 대신 쓸 파일 (bench/make_synthetic.py)")
+    parser.add_argument("--popularity-csv", type=Path, help="언어 인기도 CSV 대신 쓸 파일")
+    args = parser.parse_args()
+
+    # mbti_core.data는 첫 페이지를 실행할 때 import되므로 그 전에 환경 변수를 정해 둔다
+    if args.country_csv:
+        os.environ["MBTI_COUNTRY_CSV"] = str(args.country_csv.resolve())
+    if args.popularity_csv:
+        os.environ["MBTI_POPULARITY_CSV"] = str(args.popularity_csv.resolve())
+
+    # 페이지 안의 상대 경로가 저장소 기준으로 동작하도록
+    os.chdir(ROOT_DIR)
+    pages = sorted((ROOT_DIR / "pages").glob("*.py"))
+    if args.pages:
+        pages = [p for p in pages if any(key in p.name for key in args.pages)]
+
+    results = {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "pandas": pd.__version__,
+            "machine": platform.machine(),
+            "country_csv": os.environ.get("MBTI_COUNTRY_CSV"),
+            "popularity_csv": os.environ.get("MBTI_POPULARITY_CSV"),
+        },
+        "pages": {},
+    }
+    for path in pages:
+        print(f"▶ {path.name}", flush=True)
+        results["pages"][path.name] = page = bench_page(path, args.timeout)
+        if "warm" in page:
+            print(
+                f"   first {page['first_run_ms']:.0f}ms · cold p50 {page['cold']['p50_ms']:.0f}ms"
+                f" · warm p50 {page['warm']['p50_ms']:.0f}ms · peak {page['peak_kb']:.0f}KB"
+                f" · copies {page['dataframe_copies']}",
+                flush=True,
+            )
+    results["meta"]["max_rss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+    print(f"결과 저장: {args.output}")
+    if args.save_baseline:
+        baseline_path = BENCH_DIR / "baseline.json"
+        baseline_path.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+        print(f"baseline 저장: {baseline_path}")
+
+    if args.baseline:
+        regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance)
+        for page, metric, current, previous in regressions:
+            print(f"⚠️ {page} {metric}: {previous:.0f}ms → {current:.0f}ms")
+        if regressions:
+            sys.exit(1)
+        print("baseline 대비 느려진 페이지 없음")
+
+
+if __name__ == "__main__":
+    main()
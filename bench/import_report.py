@@ -0,0 +1,125 @@
+"""페이지별 import 시간 보고서 (워커를 새로 띄웠을 때 첫 실행이 얼마나 걸리는지)
+
+main.py와 pages/의 각 페이지를 새 파이썬 프로세스에서 한 번씩 실행(AppTest)하면서
+`python -X importtime`으로 그 페이지가 처음 불러온 모듈과 걸린 시간을 잽니다.
+streamlit 자체를 불러오는 시간은 모든 페이지에 똑같이 들므로 빼고 봅니다.
+
+- import_ms: 페이지 실행 중 새로 불러온 모듈 전체 시간
+- first_run_ms: 페이지 첫 실행 시간 (import 포함, 캐시 파일은 있는 상태)
+- pandas / numpy / pyarrow / altair / plotly.express: 각 라이브러리를 불러오는 데 든 시간 (안 불러왔으면 -)
+
+    python bench/import_report.py                    # 표 출력
+    python bench/import_report.py --budget-ms 800    # import가 800ms 넘는 페이지가 있으면 종료 코드 1
+    python bench/import_report.py --output bench/imports.json
+
+글만 보여주는 페이지(main.py, 01~02)는 pandas·Plotly·Altair를 불러오면 안 됩니다.
+03은 비교표를 st.dataframe으로 그려서 스트림릿이 안에서 pandas·pyarrow를 불러오므로 목록에서 뺐습니다
+(페이지 코드에서 pandas를 직접 불러오지는 않음).
+이런 페이지가 무거운 라이브러리를 불러오면 --budget-ms와 상관없이 종료 코드 1로 끝납니다.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+HEAVY_MODULES = ("pandas", "numpy", "pyarrow", "altair", "plotly.express")
+# 무거운 라이브러리를 불러오지 않아야 하는 페이지
+TEXT_ONLY_PAGES = ("main.py", "01_mbti_lang_chatgpt.py", "02_mbti_lang_claude.py")
+
+MARKER = "---- page start ----"
+
+# 새 프로세스에서 실행하는 코드: streamlit·AppTest를 먼저 불러온 뒤 표시를 남기고 페이지를 실행
+RUNNER = """
+import json, os, sys, time
+sys.path.insert(0, {root!r})
+os.environ["MBTI_WARMUP"] = "0"
+from streamlit.testing.v1 import AppTest
+print("import time: {marker}", file=sys.stderr, flush=True)
+started = time.perf_counter()
+at = AppTest.from_file({path!r}, default_timeout={timeout}).run()
+print(json.dumps({{
+    "first_run_ms": round((time.perf_counter() - started) * 1000, 1),
+    "error": str(at.exception[0].value) if at.exception else None,
+}}))
+"""
+
+
+def _parse_importtime(stderr: str) -> tuple:
+    """-X importtime 출력 → (표시 이후 전체 import 시간(ms), {모듈: 누적 시간(ms)})"""
+    lines = stderr.splitlines()
+    start = next(i for i, line in enumerate(lines) if MARKER in line)
+    total_us = 0
+    modules = {}
+    for line in lines[start + 1:]:
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        cumulative = int(parts[1])
+        name = parts[2].rstrip()
+        module = name.strip()
+        if name.startswith(" ") and not name.startswith("  "):
+            total_us += cumulative  # 들여쓰기 한 칸 = 페이지(또는 streamlit)가 직접 부른 import
+        modules.setdefault(module, cumulative)
+    heavy = {m: round(modules[m] / 1000, 1) for m in HEAVY_MODULES if m in modules}
+    return round(total_us / 1000, 1), heavy
+
+
+def report_page(path: Path, timeout: float) -> dict:
+    code = RUNNER.format(root=str(ROOT_DIR), marker=MARKER, path=str(path), timeout=timeout)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True, text=True, cwd=ROOT_DIR, env={**os.environ, "PYTHONWARNINGS": "ignore"},
+    )
+    if proc.returncode != 0:
+        return {"error": proc.stderr.strip().splitlines()[-1]}
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["import_ms"], result["heavy"] = _parse_importtime(proc.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", nargs="*", help="이름에 이 문자열이 들어간 페이지만 실행")
+    parser.add_argument("--budget-ms", type=float, help="페이지 하나의 import 시간 상한 (ms)")
+    parser.add_argument("--output", type=Path, help="결과를 저장할 JSON 파일")
+    parser.add_argument("--timeout", type=float, default=60, help="페이지 한 번 실행 제한 시간(초)")
+    args = parser.parse_args()
+
+    pages = [ROOT_DIR / "main.py", *sorted((ROOT_DIR / "pages").glob("*.py"))]
+    if args.pages:
+        pages = [p for p in pages if any(key in p.name for key in args.pages)]
+
+    print(f"{'page':38} {'import':>8} {'first run':>10}  " + " ".join(f"{m:>14}" for m in HEAVY_MODULES))
+    results = {}
+    problems = []
+    for path in pages:
+        results[path.name] = page = report_page(path, args.timeout)
+        if page.get("error"):
+            print(f"{path.name:38} 오류: {page['error']}")
+            problems.append(f"{path.name}: 실행 오류")
+            continue
+        heavy = " ".join(f"{page['heavy'].get(m, '-'):>14}" for m in HEAVY_MODULES)
+        print(f"{path.name:38} {page['import_ms']:>6.0f}ms {page['first_run_ms']:>8.0f}ms  {heavy}")
+
+        if path.name in TEXT_ONLY_PAGES and page["heavy"]:
+            problems.append(f"{path.name}: 글만 있는 페이지가 {', '.join(page['heavy'])}를 불러옴")
+        if args.budget_ms and page["import_ms"] > args.budget_ms:
+            problems.append(f"{path.name}: import {page['import_ms']:.0f}ms > 예산 {args.budget_ms:.0f}ms")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2))
+        print(f"결과 저장: {args.output}")
+    for problem in problems:
+        print(f"⚠️ {problem}")
+    if problems:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""동시 접속 부하 테스트 (수업 시작 때 학생 30~200명이 한꺼번에 들어오는 상황)
+
+실제 브라우저처럼 Streamlit 서버의 웹소켓(/_stcore/stream)에 세션을 N개 열고,
+각 세션이 페이지를 옮겨 다니며 MBTI를 바꿔 고르는 동안 다음을 잽니다.
+
+- 다시 실행(rerun) 지연 시간: 요청을 보낸 뒤 script_finished를 받을 때까지 (p50/p95/p99)
+  - open: 페이지를 처음 열 때 (전체 실행)
+  - select: MBTI 선택 상자를 바꿀 때 (12번처럼 fragment 안의 상자면 그 구역만 다시 실행)
+    선택값은 Streamlit selectbox가 쓰는 WidgetState.string_value(보기 글자 그대로)로 보내고,
+    고른 유형이 다시 그려진 글자(markdown·제목·알림)에 나오지 않으면 선택이 먹지 않은 것으로 보고
+    오류로 셉니다.
+- 처리량: 끝난 rerun 수 / 테스트 시간
+- 서버 메모리(RSS): 0.25초마다 /proc/<pid>/status에서 읽음. 페이지별로는 그 페이지의 rerun이
+  진행 중일 때 잰 값 중 최댓값
+
+학생들은 --ramp초 안에 무작위로 들어오고, 화면을 보고 다음 행동을 하기까지
+중앙값 --think초인 로그정규분포만큼 기다립니다. 한 페이지에서 MBTI를 1~--max-selections번 바꿉니다.
+
+    python bench/load_test.py                                   # 서버를 직접 띄워서 30명, 60초
+    python bench/load_test.py --sessions 200 --duration 120 --output bench/load.json
+    python bench/load_test.py --url ws://127.0.0.1:8501 --server-pid 12345   # 이미 띄운 서버
+
+기본 대상 페이지는 04~12 (이름 일부로 --pages 지정 가능). 외부 서비스는 쓰지 않습니다.
+웹소켓 클라이언트는 Streamlit이 함께 설치하는 websockets 패키지를 씁니다.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from streamlit.proto.BackMsg_pb2 import BackMsg
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from websockets.asyncio.client import connect
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+MBTI_TYPES = {a + b + c + d for a in "EI" for b in "NS" for c in "TF" for d in "JP"}
+
+# pages/ 파일 이름 → 주소(url_pathname): 앞의 번호와 구분자를 뺀 이름 (예: 04_mbti_country_chatgpt → mbti_country_chatgpt)
+DEFAULT_PAGES = tuple(
+    re.sub(r"^\d+[_-]", "", path.stem)
+    for path in sorted((ROOT_DIR / "pages").glob("*.py"))
+    if "04" <= path.name[:2] <= "12"
+)
+
+
+class RssSampler(threading.Thread):
+    """서버 프로세스의 RSS(KB)를 주기적으로 기록 (Linux /proc, 없으면 기록하지 않음)"""
+
+    def __init__(self, pid, interval: float = 0.25):
+        super().__init__(daemon=True)
+        self.pid = pid
+        self.interval = interval
+        self.samples = []  # (time.monotonic(), kb)
+        self._done = threading.Event()
+
+    def read(self):
+        try:
+            with open(f"/proc/{self.pid}/status") as f:
+                for line in f:
+                    if line.startswith("VmRSS:"):
+                        return int(line.split()[1])
+        except (OSError, TypeError):
+            return None
+
+    def run(self):
+        while not self._done.is_set():
+            kb = self.read()
+            if kb is not None:
+                self.samples.append((time.monotonic(), kb))
+            self._done.wait(self.interval)
+
+    def stop(self):
+        self._done.set()
+        self.join()
+
+    def peak_between(self, spans: list):
+        """spans [(시작, 끝)] 동안 잰 RSS 중 최댓값(KB)"""
+        peak = None
+        for start, end in spans:
+            for t, kb in self.samples:
+                if start <= t <= end and (peak is None or kb > peak):
+                    peak = kb
+        return peak
+
+
+# 선택한 MBTI가 화면에 반영됐는지 볼 글자 요소 (그래프·표는 크고 유형 이름이 모두 들어 있어서 제외)
+TEXT_ELEMENTS = ("markdown", "heading", "alert")
+
+
+def _mbti_selectbox(element) -> bool:
+    """16유형만 보기로 가진 선택 상자 (표의 "정렬 기준"처럼 유형 컬럼이 섞인 상자는 제외)"""
+    return element.WhichOneof("type") == "selectbox" and set(element.selectbox.options) == MBTI_TYPES
+
+
+class Session:
+    """웹소켓 세션 하나 (브라우저 탭 하나에 해당)"""
+
+    def __init__(self, ws, timeout: float):
+        self.ws = ws
+        self.timeout = timeout
+        self.pages = {}  # 주소 → {"hash", "url"} (첫 실행의 navigation 메시지에서 채움)
+
+    async def rerun(self, page=None, widget=None, fragment_id=""):
+        """rerun을 보내고 끝날 때까지 기다린다 → (지연 시간(초), 실패 여부, MBTI 선택 상자 정보)
+
+        실패: 예외가 그려졌거나, widget으로 고른 유형이 다시 그려진 글자에 나오지 않음
+        """
+        msg = BackMsg()
+        state = msg.rerun_script
+        if page is not None:
+            state.page_script_hash = page["hash"]
+            state.page_name = page["url"]
+        if widget is not None:
+            widget_id, value = widget
+            w = state.widget_states.widgets.add()
+            w.id = widget_id
+            w.string_value = value
+        state.fragment_id = fragment_id
+
+        started = time.monotonic()
+        await self.ws.send(msg.SerializeToString())
+        failed = False
+        selectbox = None
+        applied = widget is None
+        while True:
+            fm = ForwardMsg()
+            fm.ParseFromString(await asyncio.wait_for(self.ws.recv(), self.timeout))
+            kind = fm.WhichOneof("type")
+            if kind == "navigation":
+                self.pages = {p.url_pathname: {"hash": p.page_script_hash, "url": p.url_pathname}
+                              for p in fm.navigation.app_pages}
+            elif kind == "delta" and fm.delta.WhichOneof("type") == "new_element":
+                element = fm.delta.new_element
+                element_type = element.WhichOneof("type")
+                if element_type == "exception":
+                    failed = True
+                elif selectbox is None and _mbti_selectbox(element):
+                    selectbox = (element.selectbox.id, list(element.selectbox.options), fm.delta.fragment_id)
+                elif not applied and element_type in TEXT_ELEMENTS:
+                    applied = widget[1] in getattr(element, element_type).body
+            elif kind == "script_finished":
+                return time.monotonic() - started, failed or not applied, selectbox
+
+
+async def student(args, url: str, pages: list, records: list, deadline: float, rng: random.Random):
+    """학생 한 명: 들어와서 페이지를 옮겨 다니며 MBTI를 바꿔 고른다."""
+
+    def think():
+        return asyncio.sleep(rng.lognormvariate(math.log(args.think), args.think_sigma))
+
+    await asyncio.sleep(rng.uniform(0, args.ramp))
+    try:
+        async with connect(url, max_size=None, open_timeout=args.timeout) as ws:
+            session = Session(ws, args.timeout)
+            await session.rerun()  # 첫 화면(main.py) + 페이지 목록 받기
+            targets = [session.pages[name] for name in pages if name in session.pages]
+            while time.monotonic() < deadline:
+                page = rng.choice(targets)
+                started = time.monotonic()
+                latency, failed, selectbox = await session.rerun(page)
+                records.append((page["url"], "open", started, latency, failed))
+                if selectbox is not None:
+                    widget_id, options, fragment_id = selectbox
+                    for _ in range(rng.randint(1, args.max_selections)):
+                        await think()
+                        if time.monotonic() >= deadline:
+                            break
+                        started = time.monotonic()
+                        latency, failed, _ = await session.rerun(page, (widget_id, rng.choice(options)), fragment_id)
+                        records.append((page["url"], "select", started, latency, failed))
+                await think()
+    except (OSError, asyncio.TimeoutError) as e:
+        records.append(("(connection)", "error", time.monotonic(), 0.0, True))
+        print(f"⚠️ 세션 오류: {e!r}", file=sys.stderr)
+
+
+def _percentile(values: list, p: float):
+    """nearest-rank 백분위수 (값이 없으면 None)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+def _latency_stats(latencies: list) -> dict:
+    ms = [v * 1000 for v in latencies]
+    return {
+        "count": len(ms),
+        **{f"p{p}_ms": round(_percentile(ms, p), 1) if ms else None for p in (50, 95, 99)},
+        "max_ms": round(max(ms), 1) if ms else None,
+    }
+
+
+def summarize(records: list, sampler: RssSampler, elapsed: float) -> dict:
+    ok = [r for r in records if not r[4]]
+    result = {
+        "elapsed_s": round(elapsed, 1),
+        "reruns": len(ok),
+        "errors": len(records) - len(ok),
+        "throughput_per_s": round(len(ok) / elapsed, 2) if elapsed else None,
+        "latency": _latency_stats([r[3] for r in ok]),
+        "rss_mb": None,
+        "pages": {},
+    }
+    if sampler.samples:
+        kb = [s[1] for s in sampler.samples]
+        result["rss_mb"] = {"start": round(kb[0] / 1024, 1), "peak": round(max(kb) / 1024, 1), "end": round(kb[-1] / 1024, 1)}
+
+    for page in sorted({r[0] for r in records if r[0] != "(connection)"}):
+        rows = [r for r in ok if r[0] == page]
+        peak = sampler.peak_between([(r[2], r[2] + r[3]) for r in rows])
+        result["pages"][page] = {
+            "open": _latency_stats([r[3] for r in rows if r[1] == "open"]),
+            "select": _latency_stats([r[3] for r in rows if r[1] == "select"]),
+            "all": _latency_stats([r[3] for r in rows]),
+            "errors": sum(1 for r in records if r[0] == page and r[4]),
+            "rss_peak_mb": round(peak / 1024, 1) if peak else None,
+        }
+    return result
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """저장소의 main.py로 Streamlit 서버를 띄우고 /_stcore/health가 응답할 때까지 기다린다."""
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "streamlit", "run", "main.py",
+         "--server.headless", "true", "--server.port", str(port), "--browser.gatherUsageStats", "false"],
+        cwd=ROOT_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    for _ in range(120):
+        if proc.poll() is not None:
+            raise RuntimeError(f"Streamlit 서버가 종료되었습니다 (포트 {port}를 다른 프로세스가 쓰고 있는지 확인).")
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{port}/_stcore/health", timeout=1) as r:
+                if r.status == 200 and proc.poll() is None:
+                    return proc
+        except OSError:
+            time.sleep(0.5)
+    proc.terminate()
+    raise RuntimeError("Streamlit 서버가 60초 안에 뜨지 않았습니다.")
+
+
+async def run_load(args, url: str, pages: list) -> tuple:
+    rng = random.Random(args.seed)
+    records = []
+    started = time.monotonic()
+    deadline = started + args.duration
+    await asyncio.gather(*(
+        student(args, url, pages, records, deadline, random.Random(rng.random()))
+        for _ in range(args.sessions)
+    ))
+    return records, time.monotonic() - started
+
+
+def _fmt(value) -> str:
+    return "-" if value is None else f"{value:.0f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sessions", type=int, default=30, help="동시 세션(학생) 수")
+    parser.add_argument("--duration", type=float, default=60, help="테스트 시간(초)")
+    parser.add_argument("--ramp", type=float, default=10, help="학생들이 모두 들어오는 데 걸리는 시간(초)")
+    parser.add_argument("--think", type=float, default=3.0, help="행동 사이 대기 시간 중앙값(초)")
+    parser.add_argument("--think-sigma", type=float, default=0.6, help="대기 시간 로그정규분포의 sigma")
+    parser.add_argument("--max-selections", type=int, default=3, help="한 페이지에서 MBTI를 바꾸는 최대 횟수")
+    parser.add_argument("--pages", nargs="*", help="주소에 이 문자열이 들어간 페이지만 (기본: 04~12)")
+    parser.add_argument("--url", help="이미 떠 있는 서버 주소 (예: ws://127.0.0.1:8501). 없으면 직접 띄움")
+    parser.add_argument("--server-pid", type=int, help="--url 서버의 프로세스 번호 (RSS 측정용)")
+    parser.add_argument("--port", type=int, default=8599, help="직접 띄우는 서버의 포트")
+    parser.add_argument("--timeout", type=float, default=60, help="rerun 한 번 제한 시간(초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    pages = list(DEFAULT_PAGES)
+    if args.pages:
+        pages = [p for p in pages if any(key in p for key in args.pages)]
+
+    server = None
+    if args.url:
+        url, pid = args.url.rstrip("/") + "/_stcore/stream", args.server_pid
+    else:
+        server = start_server(args.port)
+        url, pid = f"ws://127.0.0.1:{args.port}/_stcore/stream", server.pid
+
+    sampler = RssSampler(pid)
+    sampler.start()
+    try:
+        print(f"세션 {args.sessions}개 · {args.duration:.0f}초 · 페이지 {len(pages)}개 → {url}", flush=True)
+        records, elapsed = asyncio.run(run_load(args, url, pages))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+        sampler.stop()
+
+    result = summarize(records, sampler, elapsed)
+    result["config"] = {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()}
+    result["config"]["env"] = {k: v for k, v in os.environ.items() if k.startswith("MBTI_")}
+
+    print(f"\n{'page':28} {'reruns':>7} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} {'RSS':>8}")
+    for page, stats in result["pages"].items():
+        s = stats["all"]
+        print(f"{page:28} {s['count']:>7} {_fmt(s['p50_ms']):>5}ms {_fmt(s['p95_ms']):>5}ms "
+              f"{_fmt(s['p99_ms']):>5}ms {_fmt(s['max_ms']):>5}ms {_fmt(stats['rss_peak_mb']):>6}MB")
+    total = result["latency"]
+    print(f"\n전체: rerun {result['reruns']}회 · 오류 {result['errors']}회 · 처리량 {result['throughput_per_s']}/s"
+          f" · p50 {_fmt(total['p50_ms'])}ms · p95 {_fmt(total['p95_ms'])}ms · p99 {_fmt(total['p99_ms'])}ms")
+    if result["rss_mb"]:
+        rss = result["rss_mb"]
+        print(f"서버 RSS: 시작 {rss['start']}MB · 최대 {rss['peak']}MB · 끝 {rss['end']}MB")
+
+    if args.output:
+        args.output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+        print(f"결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""부하·확장성 테스트용 가짜(합성) 데이터 만들기
+
+저장소의 두 CSV와 같은 모양(컬럼 이름, 값의 범위)의 데이터를 원하는 크기로 만듭니다.
+
+- 국가 MBTI CSV: Country + 16개 유형 컬럼. 각 행의 16개 비율은 소수 넷째 자리까지 정확히 더해서 1
+  (실제 158개 나라의 평균 분포를 중심으로 흩어지도록 Dirichlet 분포에서 뽑음)
+- 언어 인기도 CSV: Date + 언어 컬럼. 각 행은 (소수 둘째 자리로 반올림하기 전) 더해서 100(%)
+  (실제 29개 언어는 2004년 값에서 2024년 값으로 S자 곡선을 그리며 바뀌고, 나머지 언어는
+   무작위로 뜨거나 지는 곡선 + 계절 변동 + 잡음)
+
+    python bench/make_synthetic.py                                  # bench/data/ 에 기본 크기로
+    python bench/make_synthetic.py --regions 1000000 --languages 500 --years 20 --freq daily
+
+만든 CSV는 환경 변수로 앱과 벤치마크에 연결합니다.
+
+    MBTI_COUNTRY_CSV=bench/data/countriesMBTI_16types.csv \\
+    MBTI_POPULARITY_CSV=bench/data/Popularity_of_Programming_Languages.csv \\
+    streamlit run main.py
+
+    python bench/bench_pages.py --country-csv bench/data/countriesMBTI_16types.csv \\
+        --popularity-csv bench/data/Popularity_of_Programming_Languages.csv
+
+--freq monthly는 원본과 같은 'July 2004' 날짜 형식, daily는 '2004-07-01' 형식으로 씁니다.
+"""
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+BENCH_DIR = ROOT_DIR / "bench"
+
+COUNTRY_CSV = ROOT_DIR / "countriesMBTI_16types.csv"
+POPULARITY_CSV = ROOT_DIR / "Popularity_of_Programming_Languages_from_2004_to_2024.csv"
+
+# 실제 데이터에서 유형별 분산으로 추정한 Dirichlet 집중도 (중앙값 ≈ 220)
+CONCENTRATION = 220.0
+# 한 번에 만드는 행 수 (100만 행도 메모리를 많이 쓰지 않도록 나눠서 씀)
+CHUNK_ROWS = 200_000
+
+
+def make_countries(path: Path, regions: int, rng: np.random.Generator):
+    """regions개 지역의 MBTI 비율 CSV를 path에 쓴다."""
+    real = pd.read_csv(COUNTRY_CSV)
+    types = list(real.columns[1:])
+    base = real[types].to_numpy()
+    base = (base / base.sum(axis=1, keepdims=True)).mean(axis=0)
+
+    with open(path, "w", newline="") as f:
+        f.write(",".join(["Country", *types]) + "\n")
+        for start in range(0, regions, CHUNK_ROWS):
+            n = min(CHUNK_ROWS, regions - start)
+            shares = rng.dirichlet(base * CONCENTRATION, size=n)
+            # 0.0001 단위 정수로 나눠 가지면 반올림해도 합이 정확히 1
+            units = rng.multinomial(10_000, shares)
+            chunk = pd.DataFrame(units / 10_000, columns=types)
+            chunk.insert(0, "Country", [f"Region {i:07d}" for i in range(start + 1, start + n + 1)])
+            chunk.to_csv(f, header=False, index=False, float_format="%.4f")
+
+
+def _s_curve(t: np.ndarray, start, end, middle, steepness) -> np.ndarray:
+    """t(0~1)에 따라 start에서 end로 S자로 바뀌는 값 (언어마다 한 열)"""
+    return start + (end - start) / (1 + np.exp(-steepness * (t[:, None] - middle)))
+
+
+def make_popularity(path: Path, languages: int, years: int, freq: str, rng: np.random.Generator):
+    """languages개 언어의 years년치 인기도(%) CSV를 path에 쓴다."""
+    real = pd.read_csv(POPULARITY_CSV)
+    real_names = list(real.columns[1:])
+
+    if freq == "daily":
+        dates = pd.date_range("2004-07-01", periods=years * 365 + years // 4, freq="D")
+        date_text = dates.strftime("%Y-%m-%d")
+    else:
+        dates = pd.date_range("2004-07-01", periods=years * 12, freq="MS")
+        date_text = dates.strftime("%B %Y")
+
+    names = real_names[:languages] + [f"Lang{i:03d}" for i in range(len(real_names) + 1, languages + 1)]
+    n_real = min(languages, len(real_names))
+    n_fake = languages - n_real
+
+    # 시작값/끝값: 실제 언어는 원본의 처음·마지막 값, 가짜 언어는 대부분 작고 가끔 큰 로그정규 분포
+    start = np.concatenate([real.iloc[0, 1:n_real + 1].to_numpy(float), rng.lognormal(-1.5, 1.5, n_fake)])
+    end = np.concatenate([real.iloc[-1, 1:n_real + 1].to_numpy(float), rng.lognormal(-1.5, 1.5, n_fake)])
+    middle = rng.uniform(0.2, 0.8, languages)
+    steepness = rng.uniform(4, 15, languages)
+
+    t = np.linspace(0, 1, len(dates))
+    trend = _s_curve(t, start, end, middle, steepness)
+
+    # 1년 주기 계절 변동 (방학 때 조금 낮아지는 느낌) + 언어마다 다른 잡음
+    day_of_year = dates.dayofyear.to_numpy() / 365.25
+    phase = rng.uniform(0, 1, languages)
+    season = 1 + rng.uniform(0, 0.05, languages) * np.sin(2 * np.pi * (day_of_year[:, None] - phase))
+    noise = rng.normal(1, 0.03, trend.shape)
+    values = np.clip(trend * season * noise, 0, None)
+
+    values = 100 * values / values.sum(axis=1, keepdims=True)
+    df = pd.DataFrame(values, columns=names)
+    df.insert(0, "Date", date_text)
+    df.to_csv(path, index=False, float_format="%.2f")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--regions", type=int, default=10_000, help="국가(지역) 행 수")
+    parser.add_argument("--languages", type=int, default=100, help="언어 컬럼 수 (29개까지는 실제 언어 이름)")
+    parser.add_argument("--years", type=int, default=20, help="인기도 데이터 기간(년)")
+    parser.add_argument("--freq", choices=["monthly", "daily"], default="monthly", help="인기도 데이터 간격")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out-dir", type=Path, default=BENCH_DIR / "data")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    args.out_dir.mkdir(parents=True, exist_ok=True)
+
+    country_path = args.out_dir / "countriesMBTI_16types.csv"
+    started = time.perf_counter()
+    make_countries(country_path, args.regions, rng)
+    print(f"{country_path}: {args.regions:,}행 ({time.perf_counter() - started:.1f}초)")
+
+    popularity_path = args.out_dir / "Popularity_of_Programming_Languages.csv"
+    started = time.perf_counter()
+    make_popularity(popularity_path, args.languages, args.years, args.freq, rng)
+    print(f"{popularity_path}: {args.languages}개 언어, {args.years}년 {args.freq} ({time.perf_counter() - started:.1f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,4 @@
+"""pytest 설정: 저장소 루트를 import 경로에 넣어 tests/에서 mbti_core를 불러올 수 있게 함
+
+    python -m pytest -q
+"""
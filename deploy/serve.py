@@ -0,0 +1,234 @@
+"""여러 워커로 앱 띄우기 (워커 N개 + 세션 고정(affinity) 리버스 프록시)
+
+Streamlit 프로세스 하나는 파이썬 GIL 때문에 CPU 코어 하나만 씁니다. 수업 시작 때 학생들이
+한꺼번에 들어오면 모든 세션이 그 코어 하나를 기다리므로, 같은 앱을 워커 N개로 띄우고
+앞에 작은 리버스 프록시를 둬서 학생(브라우저)마다 워커 하나에 고정해 나눠 보냅니다.
+
+    python deploy/serve.py                       # CPU 수만큼 워커, http://localhost:8501
+    python deploy/serve.py --workers 4 --port 8501 --host 0.0.0.0
+
+- 세션 고정: 쿠키 없이 온 연결은 접속한 주소(IP)의 해시로 워커를 정하고 mbti_worker 쿠키를
+  붙여 주며, 그다음부터는 쿠키에 적힌 워커로 보냅니다. Streamlit 세션(웹소켓), 파일 업로드,
+  다운로드 버튼 파일(/media)은 그 세션을 가진 워커에만 있으므로 한 브라우저의 요청은
+  모두 같은 워커로 가야 합니다. 브라우저가 쿠키를 받기 전에 연결을 여러 개 동시에 열어도
+  IP가 같으니 모두 같은 워커로 갑니다. (교실 망 안에서 띄우면 학생 PC마다 IP가 달라 고루 나뉨)
+- 프록시는 연결의 첫 요청 머리(header)만 읽어 워커를 정하고 X-Forwarded-For(학생 IP)와
+  X-Forwarded-Proto를 붙여 보냅니다. 나머지(웹소켓 포함)는 그대로 전달합니다.
+- 결과 공유: 워커를 띄우기 전에 `python -m mbti_core.api --figures`로 순위표·언어 요약·
+  추천 점수표·그래프 명세를 .cache/results/에 만들어 두고(mbti_core/disk_cache.py),
+  워커들은 그 파일을 읽어서 같은 계산을 반복하지 않습니다. 나중에 한 워커가 새로 만든 결과도
+  다른 워커가 같이 씁니다.
+- 워커가 죽으면 다시 띄웁니다. Ctrl+C(SIGTERM)로 프록시와 워커를 모두 끕니다.
+- 모든 워커는 같은 server.cookieSecret을 씁니다.
+"""
+import argparse
+import asyncio
+import logging
+import os
+import re
+import secrets
+import signal
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+COOKIE = "mbti_worker"
+MAX_HEAD = 64 * 1024
+COOKIE_RE = re.compile(rb"(?im)^cookie:.*?\b" + COOKIE.encode() + rb"=(\d+)")
+
+logger = logging.getLogger("mbti.serve")
+
+
+class Worker:
+    """streamlit run main.py 프로세스 하나"""
+
+    def __init__(self, index: int, port: int, env: dict, extra_args: list):
+        self.index = index
+        self.port = port
+        self.env = env
+        self.extra_args = extra_args
+        self.connections = 0
+        self.proc = None
+
+    def start(self):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-m", "streamlit", "run", "main.py",
+             "--server.port", str(self.port), "--server.address", "127.0.0.1",
+             "--server.headless", "true", "--browser.gatherUsageStats", "false", *self.extra_args],
+            cwd=ROOT_DIR, env=self.env,
+        )
+        logger.info("워커 %d 시작 (pid %d, 포트 %d)", self.index, self.proc.pid, self.port)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.poll() is None
+
+    def stop(self):
+        if self.alive:
+            self.proc.terminate()
+            try:
+                self.proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+class Proxy:
+    """mbti_worker 쿠키로 워커를 고르는 TCP 수준 리버스 프록시"""
+
+    def __init__(self, workers: list):
+        self.workers = workers
+
+    def _choose(self, head: bytes, client_ip: str):
+        """(워커, 쿠키를 새로 붙여야 하는지)
+
+        쿠키가 없으면 client_ip의 해시로 고릅니다. 연결 수로 고르면 한 브라우저가 동시에 연
+        첫 연결들이 서로 다른 워커로 갈 수 있기 때문입니다 (같은 IP → 항상 같은 워커).
+        """
+        match = COOKIE_RE.search(head)
+        if match:
+            index = int(match.group(1))
+            if index < len(self.workers) and self.workers[index].alive:
+                return self.workers[index], False
+        alive = [w for w in self.workers if w.alive] or self.workers
+        return alive[zlib.crc32(client_ip.encode()) % len(alive)], True
+
+    @staticmethod
+    def _forwarded_head(head: bytes, client_ip: str) -> bytes:
+        """요청 머리에 X-Forwarded-For(이미 있으면 뒤에 이어 붙임)와 X-Forwarded-Proto를 넣는다."""
+        lines = head[:-4].split(b"\r\n")
+        forwarded_for = client_ip.encode()
+        proto = b"http"
+        kept = [lines[0]]
+        for line in lines[1:]:
+            field, _, value = line.partition(b":")
+            field = field.strip().lower()
+            if field == b"x-forwarded-for":
+                forwarded_for = value.strip() + b", " + forwarded_for
+            elif field == b"x-forwarded-proto":
+                proto = value.strip()
+            else:
+                kept.append(line)
+        kept.append(b"X-Forwarded-For: " + forwarded_for)
+        kept.append(b"X-Forwarded-Proto: " + proto)
+        return b"\r\n".join(kept) + b"\r\n\r\n"
+
+    async def handle(self, client_reader: asyncio.StreamReader, client_writer: asyncio.StreamWriter):
+        try:
+            head = await client_reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            client_writer.close()
+            return
+
+        peer = client_writer.get_extra_info("peername")
+        client_ip = peer[0] if peer else ""
+        worker, assign = self._choose(head, client_ip)
+        try:
+            upstream_reader, upstream_writer = await asyncio.open_connection("127.0.0.1", worker.port)
+        except OSError:
+            client_writer.write(b"HTTP/1.1 503 Service Unavailable\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            await client_writer.drain()
+            client_writer.close()
+            return
+
+        worker.connections += 1
+        try:
+            upstream_writer.write(self._forwarded_head(head, client_ip))
+            await upstream_writer.drain()
+            if assign:
+                await self._forward_head_with_cookie(upstream_reader, client_writer, worker.index)
+            await asyncio.gather(
+                self._pipe(client_reader, upstream_writer),
+                self._pipe(upstream_reader, client_writer),
+            )
+        finally:
+            worker.connections -= 1
+            for writer in (upstream_writer, client_writer):
+                writer.close()
+
+    @staticmethod
+    async def _forward_head_with_cookie(reader, writer, index: int):
+        """워커의 첫 응답 머리에 Set-Cookie를 넣어 브라우저에 전달"""
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            return
+        cookie = f"Set-Cookie: {COOKIE}={index}; Path=/; HttpOnly; SameSite=Lax\r\n".encode()
+        writer.write(head[:-2] + cookie + b"\r\n")
+        await writer.drain()
+
+    @staticmethod
+    async def _pipe(reader, writer):
+        try:
+            while data := await reader.read(65536):
+                writer.write(data)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            if writer.can_write_eof():
+                try:
+                    writer.write_eof()
+                except OSError:
+                    pass
+
+
+async def supervise(workers: list, interval: float = 2.0):
+    """죽은 워커를 다시 띄운다."""
+    while True:
+        await asyncio.sleep(interval)
+        for worker in workers:
+            if not worker.alive:
+                logger.warning("워커 %d 종료됨 (코드 %s) → 다시 시작", worker.index, worker.proc.returncode)
+                worker.start()
+
+
+async def serve(args, workers: list):
+    proxy = Proxy(workers)
+    server = await asyncio.start_server(proxy.handle, args.host, args.port, limit=MAX_HEAD)
+    logger.info("프록시 http://%s:%d → 워커 %d개 (포트 %d~%d)",
+                args.host, args.port, len(workers), workers[0].port, workers[-1].port)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    watcher = asyncio.create_task(supervise(workers))
+    async with server:
+        await stop.wait()
+    watcher.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--host", default="127.0.0.1", help="프록시 주소 (교실 전체에 열려면 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8501, help="프록시 포트 (학생들이 접속하는 주소)")
+    parser.add_argument("--worker-port", type=int, default=8600, help="첫 워커의 포트 (워커마다 1씩 증가)")
+    parser.add_argument("--no-precompute", action="store_true", help="워커를 띄우기 전 미리 계산을 건너뜀")
+    parser.add_argument("streamlit_args", nargs="*", help="워커의 streamlit run에 넘길 옵션 (-- 뒤에)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(name)s %(message)s")
+
+    if not args.no_precompute:
+        # 모든 워커가 같이 읽을 결과를 한 번만 만들어 둠 (데이터셋 캐시 파일 + 계산 결과 + 그래프 명세)
+        logger.info("미리 계산 중 (python -m mbti_core.api --figures)")
+        subprocess.run([sys.executable, "-m", "mbti_core.api", "--figures"], cwd=ROOT_DIR, check=True)
+
+    env = dict(os.environ)
+    env.setdefault("STREAMLIT_SERVER_COOKIE_SECRET", secrets.token_hex(32))
+    workers = [Worker(i, args.worker_port + i, env, args.streamlit_args) for i in range(args.workers)]
+    for worker in workers:
+        worker.start()
+    try:
+        asyncio.run(serve(args, workers))
+    finally:
+        for worker in workers:
+            worker.stop()
+
+
+if __name__ == "__main__":
+    main()
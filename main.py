@@ -1,4 +1,10 @@
 import streamlit as st
+
+from mbti_core.warmup import start_warmup
+
+# 데이터·그래프 캐시를 백그라운드에서 미리 채워 둠 (프로세스당 한 번, 기다리지 않음)
+start_warmup()
+
 st.title('나의 첫 웹 서비스 만들기!!')
 st.write('함샘과 함께하는 바이브 코딩~ 시작! 헬로 월드?!')
 name = st.text_input('이름을 입력해주세요 : ')
@@ -0,0 +1,5 @@
+"""MBTI 웹앱들이 함께 쓰는 데이터/분석 모듈 모음.
+
+streamlit 없이도 불러올 수 있습니다 (Streamlit이 필요한 것은 profiling, table_view뿐).
+배치 작업·벤치마크에서는 mbti_core.api를 쓰면 됩니다.
+"""
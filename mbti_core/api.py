@@ -0,0 +1,115 @@
+"""Streamlit 없이 쓰는 분석 API (야간 미리 계산 작업, 벤치마크, 테스트용)
+
+페이지가 하는 계산(국가 상위/하위, 언어 통계, 추천)은 모두 mbti_core 안의 함수이고,
+페이지는 그 결과를 그리기만 합니다. 이 모듈은 그 함수들을 한 곳에 모아 둔 입구입니다.
+mbti_core는 streamlit을 불러오지 않으므로(캐시는 mbti_core/cache.py의 shared_resource)
+일반 파이썬 스크립트에서 바로 쓸 수 있습니다. (그래프 함수만 plotly가 필요함)
+
+    from mbti_core import api
+
+    api.top_countries("INFP", 10)          # Country, INFP
+    api.language_stats("Python")           # current, mean, max, min, peak_date, change, rank
+    api.popularity_between("2019-01-01")   # 날짜 구간의 인기도 (정렬된 날짜 인덱스, 이진 탐색)
+    api.top_languages("INTJ", k=5)         # 점수 기반 추천 순위
+    api.recommendation("claude", "INTJ")   # 페이지 추천 카드 항목
+
+    python -m mbti_core.api                # 미리 계산 (캐시 파일 + 계산 결과), 단계별 시간 출력
+    python -m mbti_core.api --figures      # 모든 페이지 그래프까지 (warm-up과 같은 일)
+"""
+import argparse
+import json
+import sys
+import time
+
+from mbti_core.country import bottom_countries, country_rank, load_rank_index, top_countries
+from mbti_core.data import (
+    dataset_versions,
+    load_country_matrix,
+    load_country_mbti,
+    load_language_popularity,
+)
+from mbti_core.language import language_stats, language_summary
+from mbti_core.popularity import latest_date, popularity_between
+from mbti_core.recommender import (
+    MBTI_TYPES,
+    card_mix,
+    dominant_types,
+    recommend_batch,
+    score_matrix,
+    top_languages,
+)
+from mbti_core.registry import load_registry, recommendation, recommendations
+from mbti_core.roster import language_counts, read_roster, recommend_chunk
+
+__all__ = [
+    "MBTI_TYPES",
+    "bottom_countries",
+    "card_mix",
+    "country_rank",
+    "dataset_versions",
+    "dominant_types",
+    "language_counts",
+    "language_stats",
+    "language_summary",
+    "latest_date",
+    "load_country_matrix",
+    "load_country_mbti",
+    "load_language_popularity",
+    "popularity_between",
+    "precompute",
+    "read_roster",
+    "recommend_batch",
+    "recommend_chunk",
+    "recommendation",
+    "recommendations",
+    "score_matrix",
+    "top_countries",
+    "top_languages",
+]
+
+
+def precompute(figures: bool = False) -> dict:
+    """데이터셋 캐시 파일과 모든 계산 결과를 만들어 둔다. {단계: 걸린 시간(ms)}를 돌려준다.
+
+    figures=True면 charts.FIGURES의 모든 그래프도 만든다 (plotly 필요).
+    같은 프로세스에서 나중에 부르는 API는 이 결과를 그대로 씁니다.
+    """
+    steps = [
+        ("country_dataset", load_country_mbti),
+        ("country_matrix", load_country_matrix),
+        ("rank_index", load_rank_index),
+        ("popularity_dataset", load_language_popularity),
+        ("language_summary", language_summary),
+        ("registry", load_registry),
+        ("score_matrix", score_matrix),
+    ]
+    if figures:
+        from mbti_core.warmup import warm_up
+
+        steps.append(("figures", warm_up))
+
+    timings = {}
+    for name, step in steps:
+        started = time.perf_counter()
+        step()
+        timings[name] = round((time.perf_counter() - started) * 1000, 1)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="mbti_core 미리 계산 (Streamlit 없이)")
+    parser.add_argument("--figures", action="store_true", help="모든 페이지 그래프까지 만들기")
+    parser.add_argument("--json", action="store_true", help="단계별 시간을 JSON으로 출력")
+    args = parser.parse_args()
+
+    timings = precompute(figures=args.figures)
+    if args.json:
+        json.dump({"versions": dataset_versions(), "timings_ms": timings}, sys.stdout, indent=2)
+        print()
+        return
+    for name, ms in timings.items():
+        print(f"{name:20} {ms:>9.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
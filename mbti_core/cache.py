@@ -0,0 +1,57 @@
+"""프로세스 전체가 함께 쓰는 계산 결과 캐시 (Streamlit 없이 동작)
+
+mbti_core는 원래 st.cache_resource로 데이터셋·순위표·그래프 캐시를 보관했습니다.
+그러면 야간 미리 계산 작업이나 벤치마크처럼 Streamlit 서버 없이 쓰는 곳에서도
+streamlit을 불러와야 하고, 실행 컨텍스트가 없다는 경고가 쏟아집니다.
+
+shared_resource는 st.cache_resource와 같은 규칙으로 동작하는 작은 데코레이터입니다.
+
+- 인자(해시 가능한 값)마다 처음 한 번만 계산하고, 모든 세션·스레드가 같은 객체를 받습니다 (복사 없음).
+- 같은 인자로 동시에 부르면 한 스레드만 계산하고 나머지는 그 결과를 기다립니다.
+- 예외가 나면 저장하지 않으므로 다음 호출에서 다시 계산합니다.
+
+    @shared_resource
+    def load_something(version: str): ...
+
+    load_something.clear()   # 이 함수의 캐시만 비우기
+    clear_shared()           # 모든 shared_resource 캐시 비우기 (테스트, 데이터 교체 후 등)
+"""
+import functools
+import threading
+
+_registry = []
+
+
+def shared_resource(func):
+    """func(*args)의 결과를 인자별로 프로세스에 한 번만 만들어 보관한다."""
+    results = {}
+    locks = {}
+    guard = threading.Lock()
+
+    @functools.wraps(func)
+    def wrapper(*args):
+        try:
+            return results[args]
+        except KeyError:
+            pass
+        with guard:
+            lock = locks.setdefault(args, threading.Lock())
+        with lock:
+            if args not in results:
+                results[args] = func(*args)
+            return results[args]
+
+    def clear():
+        with guard:
+            results.clear()
+            locks.clear()
+
+    wrapper.clear = clear
+    _registry.append(wrapper)
+    return wrapper
+
+
+def clear_shared():
+    """shared_resource로 감싼 모든 함수의 캐시를 비운다."""
+    for wrapper in _registry:
+        wrapper.clear()
@@ -0,0 +1,364 @@
+"""페이지별 Plotly 그래프 만들기
+
+그래프를 만드는 코드를 페이지 스크립트 밖으로 꺼내 두면, 학생이 페이지를 열기 전에도
+(warmup 모듈에서) 같은 그래프를 미리 만들어 캐시에 넣어 둘 수 있습니다.
+각 그래프는 (페이지, 이름)으로 FIGURES에 등록되고, page_figure()로 가져옵니다.
+
+    fig = page_figure("09_country_plotly_claude", "top", "INFP")
+
+plotly.express는 처음 쓸 때 불러옵니다(그래프 함수 안에서 import). 캐시에 있는 그래프만
+보여주는 요청은 plotly.express를 불러오지 않고, 페이지마다 실제로 쓰는 모듈만 불러옵니다.
+(plotly.graph_objects는 Streamlit이 st.plotly_chart 때문에 이미 불러와 두므로 비용이 거의 없음)
+"""
+from mbti_core.country import bottom_countries, top_countries
+from mbti_core.data import load_language_popularity
+from mbti_core.figures import cached_figure
+from mbti_core.language import language_summary
+from mbti_core.popularity import latest_date, popularity_between, year_bounds, year_span
+
+# 12번 페이지 "최근 5년" 그래프: 마지막 해의 RECENT_YEARS년 전 1월 1일부터 (2024년 데이터면 2019-01-01)
+RECENT_YEARS = 5
+
+
+# =========================
+# 07: 나라별 MBTI 분포 (Plotly, ChatGPT 버전) - 세로 막대
+# =========================
+def _country_07_top(mbti):
+    import plotly.express as px
+
+    # top_countries는 내림차순으로 정렬되어 나옴
+    top10 = top_countries(mbti, 10)
+
+    fig_top = px.bar(
+        top10,
+        x="Country",
+        y=mbti,
+        title=f"{mbti} 비율이 높은 10개 나라",
+        labels={
+            "Country": "Country",
+            mbti: f"{mbti} 비율"
+        },
+        hover_data={
+            "Country": True,
+            mbti: ":.3f"
+        }
+    )
+
+    fig_top.update_layout(
+        xaxis_title="Country",
+        yaxis_title=f"{mbti} 비율",
+        hovermode="x unified"
+    )
+    return fig_top
+
+
+def _country_07_bottom(mbti):
+    import plotly.express as px
+
+    # bottom_countries는 오름차순으로 정렬되어 나옴
+    bottom10 = bottom_countries(mbti, 10)
+
+    fig_bottom = px.bar(
+        bottom10,
+        x="Country",
+        y=mbti,
+        title=f"{mbti} 비율이 낮은 10개 나라",
+        labels={
+            "Country": "Country",
+            mbti: f"{mbti} 비율"
+        },
+        hover_data={
+            "Country": True,
+            mbti: ":.3f"
+        }
+    )
+
+    # 카테고리 정렬 & 약간의 인터랙션 튜닝
+    fig_bottom.update_layout(
+        xaxis_title="Country",
+        yaxis_title=f"{mbti} 비율",
+        xaxis=dict(categoryorder="total ascending"),
+        hovermode="x unified"
+    )
+
+    # 막대에 값 표시 옵션 (원하면 주석 처리 풀어도 됨)
+    fig_bottom.update_traces(
+        hovertemplate="<b>%{x}</b><br>" +
+                      mbti + " 비율: %{y:.3f}<extra></extra>"
+    )
+    return fig_bottom
+
+
+# =========================
+# 08: MBTI 국가별 비율 분석 (Plotly, Gemini 버전) - 가로 막대
+# =========================
+def _country_08_top(mbti):
+    import plotly.express as px
+
+    # Plotly bar(h)는 데이터프레임의 순서대로 아래->위로 그립니다.
+    # 따라서 가장 높은 값이 그래프 상단에 오게 하려면, 값을 오름차순 정렬해야 합니다.
+    top_10 = top_countries(mbti, 10).iloc[::-1]
+
+    fig_top = px.bar(
+        top_10,
+        x=mbti,
+        y='Country',
+        orientation='h',
+        title=f"🏆 {mbti} 비율이 가장 높은 나라 Top 10",
+        text_auto='.3%',  # 막대 끝에 퍼센트 표시
+        color=mbti, # 값에 따라 색상 진하기 변경
+        color_continuous_scale='Blues'
+    )
+    fig_top.update_layout(xaxis_title="비율", yaxis_title="국가", height=500)
+    fig_top.update_traces(textposition='outside') # 텍스트를 막대 바깥으로
+    return fig_top
+
+
+def _country_08_bottom(mbti):
+    import plotly.express as px
+
+    # 가장 낮은 값이 그래프 상단에 오게 하려면, 값을 내림차순 정렬해야 합니다.
+    bottom_10 = bottom_countries(mbti, 10).iloc[::-1]
+
+    fig_bottom = px.bar(
+        bottom_10,
+        x=mbti,
+        y='Country',
+        orientation='h',
+        title=f"📉 {mbti} 비율이 가장 낮은 나라 Bottom 10",
+        text_auto='.3%',
+        color=mbti,
+        color_continuous_scale='Reds' # 하위권은 붉은색 계열
+    )
+    fig_bottom.update_layout(xaxis_title="비율", yaxis_title="국가", height=500)
+    fig_bottom.update_traces(textposition='outside')
+    return fig_bottom
+
+
+# =========================
+# 09: 국가별 MBTI 유형 분포 분석 (Plotly, Claude 버전) - 순위 포함 가로 막대
+# =========================
+def _country_09_bar(table, mbti, title, color_scale):
+    import plotly.express as px
+
+    table = table.copy()
+    table['Rank'] = range(1, len(table) + 1)
+    table = table.sort_values(mbti, ascending=True)  # Plotly 가로 막대를 위해 오름차순
+
+    fig = px.bar(
+        table,
+        x=mbti,
+        y='Country',
+        orientation='h',
+        title=title,
+        labels={mbti: f'{mbti} 비율', 'Country': '국가'},
+        color=mbti,
+        color_continuous_scale=color_scale,
+        hover_data={
+            'Rank': True,
+            'Country': True,
+            mbti: ':.2%'
+        }
+    )
+
+    fig.update_layout(
+        height=500,
+        showlegend=False,
+        xaxis_title=f'{mbti} 비율',
+        yaxis_title='국가',
+        xaxis_tickformat='.0%',
+        hovermode='closest',
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+
+    fig.update_traces(
+        hovertemplate='<b>%{y}</b><br>비율: %{x:.2%}<extra></extra>'
+    )
+    return fig
+
+
+def _country_09_top(mbti):
+    return _country_09_bar(top_countries(mbti, 10), mbti, f'{mbti} 비율 상위 10개 국가', 'Blues')
+
+
+def _country_09_bottom(mbti):
+    return _country_09_bar(
+        bottom_countries(mbti, 10), mbti, f'{mbti} 비율 하위 10개 국가 (인터랙티브)', 'Oranges'
+    )
+
+
+# =========================
+# 10: 언어 추천기 (ChatGPT 버전) - 추천 언어 인기 추이
+# =========================
+def _language_10_trend(lang):
+    import plotly.express as px
+
+    # 제목(이모지 붙은 표시 이름)은 MBTI마다 달라서 페이지에서 따로 씀 → 같은 언어면 그래프 하나를 같이 씀
+    df = popularity_between(columns=[lang]).dropna()
+    fig = px.line(
+        df,
+        x=df.index,
+        y=lang,
+        labels={"Date": "연도", lang: "인기 지수(%)"},
+    )
+    fig.update_layout(
+        hovermode="x unified",
+    )
+    return fig
+
+
+# =========================
+# 11: 언어 추천기 (Gemini 버전) - 추천 언어 인기도 변화
+# =========================
+def _language_11_trend(lang, start=None, end=None):
+    import plotly.express as px
+
+    # 기간은 정렬된 날짜 인덱스에서 이진 탐색으로 잘라냄 (mbti_core/popularity.py)
+    df = popularity_between(start, end, [lang])
+    fig = px.line(
+        df,
+        x=df.index,
+        y=lang,
+        labels={'value': 'Popularity (%)', 'Date': 'Year'},
+        template="plotly_white"
+    )
+    fig.update_traces(line_color='#FF4B4B', line_width=3) # 스트림릿 색상 테마
+    return fig
+
+
+# =========================
+# 12: MBTI 프로그래밍 언어 추천기 (Claude 버전)
+# =========================
+def _language_12_trend(lang, start=None, end=None):
+    import plotly.graph_objects as go
+
+    df = popularity_between(start, end, [lang])
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=df.index,
+        y=df[lang],
+        mode='lines',
+        name=lang,
+        line=dict(color='#667eea', width=3),
+        fill='tozeroy',
+        fillcolor='rgba(102, 126, 234, 0.2)'
+    ))
+
+    fig.update_layout(
+        title=f'{lang} 인기도 변화 ({df.index[0].year}-{df.index[-1].year})',
+        xaxis_title='연도',
+        yaxis_title='인기도 (%)',
+        hovermode='x unified',
+        template='plotly_white',
+        height=500,
+        font=dict(size=14),
+        showlegend=False
+    )
+    return fig
+
+
+def _language_12_recent(lang):
+    import plotly.express as px
+
+    # 전체를 훑는 df[df['Date'] >= '2019-01-01'] 대신 시작 위치만 이진 탐색
+    recent_df = popularity_between(f"{latest_date().year - RECENT_YEARS}-01-01", columns=[lang])
+
+    fig2 = px.line(
+        recent_df,
+        x=recent_df.index,
+        y=lang,
+        title=f'{lang} 최근 5년 상세 트렌드',
+        markers=True
+    )
+
+    fig2.update_traces(
+        line_color='#764ba2',
+        line_width=3,
+        marker=dict(size=6)
+    )
+
+    fig2.update_layout(
+        xaxis_title='날짜',
+        yaxis_title='인기도 (%)',
+        template='plotly_white',
+        height=400
+    )
+    return fig2
+
+
+def _language_12_comparison(count):
+    import plotly.graph_objects as go
+
+    df = load_language_popularity()
+    # 인기도 상위 count개 언어만 표시 (MBTI와 상관없는 그래프라 모든 세션이 하나를 같이 씀)
+    top_languages = language_summary()['language'].head(int(count)).tolist()
+
+    fig3 = go.Figure()
+
+    for lang_name in top_languages:
+        if lang_name in df.columns:
+            fig3.add_trace(go.Scatter(
+                x=df['Date'],
+                y=df[lang_name],
+                mode='lines',
+                name=lang_name,
+                line=dict(width=2),
+            ))
+
+    fig3.update_layout(
+        title=f'상위 {count}개 프로그래밍 언어 트렌드 비교',
+        xaxis_title='연도',
+        yaxis_title='인기도 (%)',
+        hovermode='x unified',
+        template='plotly_white',
+        height=600,
+        legend=dict(
+            orientation="v",
+            yanchor="top",
+            y=1,
+            xanchor="left",
+            x=1.02
+        )
+    )
+    return fig3
+
+
+# (페이지, 그래프 이름) → (데이터셋, 그래프 만드는 함수(선택값))
+# 국가 그래프의 선택값은 MBTI 유형, 언어 그래프의 선택값은 언어(컬럼) 이름입니다.
+# 선택값이 따로 정해진 그래프는 FIXED_SELECTIONS에 적어 둡니다 (warm-up이 그 값으로만 만듦).
+FIGURES = {
+    ("07_country_plotly_chatgpt", "top"): ("country", _country_07_top),
+    ("07_country_plotly_chatgpt", "bottom"): ("country", _country_07_bottom),
+    ("08_country_plotly_gemini", "top"): ("country", _country_08_top),
+    ("08_country_plotly_gemini", "bottom"): ("country", _country_08_bottom),
+    ("09_country_plotly_claude", "top"): ("country", _country_09_top),
+    ("09_country_plotly_claude", "bottom"): ("country", _country_09_bottom),
+    ("10_lang_chatgpt", "trend"): ("popularity", _language_10_trend),
+    ("11_lang_gemini", "trend"): ("popularity", _language_11_trend),
+    ("12_lang_claude", "trend"): ("popularity", _language_12_trend),
+    ("12_lang_claude", "recent"): ("popularity", _language_12_recent),
+    ("12_lang_claude", "comparison"): ("popularity", _language_12_comparison),
+}
+
+# 12 comparison의 선택값은 상위 언어 수
+FIXED_SELECTIONS = {
+    ("12_lang_claude", "comparison"): ["10"],
+}
+
+
+def page_figure(page: str, name: str, selection: str, years=None):
+    """page 페이지의 name 그래프를 selection(MBTI 유형 또는 언어)으로 만들어 (캐시해서) 돌려준다.
+
+    years: (첫 해, 마지막 해) 기간 슬라이더 값. 인기도 추이 그래프(11·12 trend)만 받습니다.
+    전체 기간이면 None과 같고, 좁힌 기간의 그래프는 메모리 캐시에만 보관합니다.
+    """
+    dataset, build = FIGURES[(page, name)]
+    if years is None or tuple(years) == year_bounds():
+        return cached_figure(page, name, selection, dataset, lambda: build(selection))
+    start, end = year_span(*years)
+    return cached_figure(
+        page, name, f"{selection}|{years[0]}-{years[1]}", dataset,
+        lambda: build(selection, start, end), persist=False,
+    )
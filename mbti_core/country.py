@@ -0,0 +1,82 @@
+"""국가별 MBTI 비율 조회 (상위/하위 N개 나라, 나라별 순위)
+
+pandas의 nlargest/nsmallest 대신 load_country_matrix()의 float32 행렬에서 바로 계산합니다.
+정렬 순서만은 CSV의 float64 값 순서(load_country_matrix()의 rank_key)로 구해서,
+같은 값이 있을 때의 순서까지 원래 페이지의 nlargest/nsmallest(keep="first")와 같습니다.
+유형마다 정렬 순서를 처음 한 번만 구해 두기 때문에(load_rank_index),
+"T 유형 상위 k개 나라" 같은 질문은 매번 정렬하지 않고 앞에서 k개를 잘라 오기만 하면 됩니다.
+"""
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions, load_country_matrix
+from mbti_core.disk_cache import disk_cached
+
+
+@dataclass(frozen=True)
+class RankIndex:
+    """MBTI 유형(열)마다 미리 정렬해 둔 국가 순서와 순위표"""
+
+    descending: np.ndarray  # (국가 수, 16) 각 열: 비율이 높은 나라부터의 행 번호
+    ascending: np.ndarray   # (국가 수, 16) 각 열: 비율이 낮은 나라부터의 행 번호
+    ranks: np.ndarray       # (국가 수, 16) 비율이 높은 순 순위 (1위부터)
+    row_of: dict            # 국가 이름 → 행 번호
+
+
+def _build_rank_index() -> RankIndex:
+    matrix = load_country_matrix()
+    # 정렬은 float32 값이 아니라 CSV float64 값의 순위 키로 함. 0.0752999999999999와
+    # 0.0752999999999998처럼 끝자리만 다른 값은 float32에서 같은 값이 되어, 원래 pandas
+    # nlargest와 순서가 달라짐 (순위 키는 데이터를 처음 변환할 때 mbti_core/data.py가 만들어 둠)
+    values = matrix.rank_key
+    n = values.shape[0]
+
+    # stable 정렬이라 값이 같으면 원래 순서가 빠른 나라가 먼저 (nlargest/nsmallest와 같은 규칙)
+    descending = np.argsort(-values, axis=0, kind="stable")
+    ascending = np.argsort(values, axis=0, kind="stable")
+
+    ranks = np.empty_like(descending)
+    np.put_along_axis(ranks, descending, np.arange(1, n + 1)[:, None], axis=0)
+
+    row_of = {name: i for i, name in enumerate(matrix.countries.tolist())}
+    return RankIndex(descending, ascending, ranks, row_of)
+
+
+@shared_resource
+def load_rank_index() -> RankIndex:
+    """국가 행렬의 모든 유형 열을 한 번에 정렬해서 RankIndex를 만든다.
+
+    다른 워커 프로세스가 이미 만들어 두었으면 디스크(mbti_core/disk_cache.py)에서 읽습니다.
+    """
+    index = disk_cached("rank_index", dataset_versions()["country"], _build_rank_index)
+    for arr in (index.descending, index.ascending, index.ranks):
+        arr.setflags(write=False)
+    return index
+
+
+def _pick(mbti: str, k: int, descending: bool) -> pd.DataFrame:
+    matrix = load_country_matrix()
+    index = load_rank_index()
+    j = matrix.types.index(mbti)
+    order = (index.descending if descending else index.ascending)[:k, j]
+    return pd.DataFrame({"Country": matrix.countries[order], mbti: matrix.values[order, j]})
+
+
+def top_countries(mbti: str, k: int = 10) -> pd.DataFrame:
+    """mbti 비율이 가장 높은 k개 나라 (Country, mbti 컬럼 / 내림차순)"""
+    return _pick(mbti, k, descending=True)
+
+
+def bottom_countries(mbti: str, k: int = 10) -> pd.DataFrame:
+    """mbti 비율이 가장 낮은 k개 나라 (Country, mbti 컬럼 / 오름차순)"""
+    return _pick(mbti, k, descending=False)
+
+
+def country_rank(country: str, mbti: str) -> int:
+    """country 나라의 mbti 비율 순위 (높은 순 1위부터). 없는 나라면 KeyError"""
+    matrix = load_country_matrix()
+    index = load_rank_index()
+    return int(index.ranks[index.row_of[country], matrix.types.index(mbti)])
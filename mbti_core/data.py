@@ -0,0 +1,253 @@
+"""두 CSV 데이터셋(국가별 MBTI 분포, 프로그래밍 언어 인기도)을 한 곳에서 불러오는 모듈.
+
+각 페이지가 따로 load_data()를 만들면 같은 파일이 페이지 수만큼 다시 읽히고
+캐시도 따로 잡히기 때문에, 모든 페이지는 여기 있는 함수만 사용합니다.
+
+st.cache_data는 호출할 때마다 캐시된 값을 복사(unpickle)해서 돌려주므로,
+여기서는 shared_resource(mbti_core/cache.py, st.cache_resource와 같은 방식)로
+모든 세션이 같은 DataFrame을 공유합니다. Streamlit 없이 불러와도 그대로 동작합니다.
+대신 공유 데이터가 실수로 바뀌지 않도록 내부 NumPy 배열을 읽기 전용으로 잠가 둡니다.
+(값을 바꾸려고 하면 ValueError: assignment destination is read-only)
+
+CSV는 처음 한 번만 파싱해서 타입이 정해진 Arrow IPC(Feather) 파일로 저장해 두고,
+다음부터는 그 파일을 메모리 맵으로 읽습니다. 캐시 파일 이름에 CSV 내용의 해시가
+들어가므로 CSV가 바뀌면 자동으로 새로 만들어집니다.
+
+국가 데이터는 (국가 × 유형) float32 행렬 .npy 파일로도 저장해서 np.load(mmap_mode="r")로
+엽니다. 같은 서버의 여러 워커 프로세스가 운영체제 페이지 캐시의 한 벌을 같이 읽게 됩니다.
+float32로 줄이면 끝자리만 다른 값이 같아지므로, CSV의 float64 값 순서(순위 키)도 이때
+한 번 구해서 옆에 같이 저장합니다 (mbti_core/country.py의 순위표가 씀).
+
+    python -m mbti_core.data   # 캐시 파일 미리 만들기 (배포 직후 등)
+"""
+import hashlib
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from mbti_core.cache import shared_resource
+from mbti_core.paths import CACHE_DIR, COUNTRY_CSV, POPULARITY_CSV
+
+
+# (경로, 수정 시각, 크기) → 해시. 파일이 바뀌지 않았으면 다시 읽지 않음
+_hashes = {}
+
+
+def file_hash(path: Path) -> str:
+    """파일 내용의 SHA-256 해시 앞 16자리 (캐시 무효화 키로 사용)
+
+    수정 시각(ns)과 크기가 그대로면 프로세스 안에서 한 번 계산한 값을 돌려줍니다.
+    """
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+    if key in _hashes:
+        return _hashes[key]
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    _hashes[key] = digest.hexdigest()[:16]
+    return _hashes[key]
+
+
+# CSV를 읽는 방법(_parse_*_csv)이 바뀌면 올림: 캐시 파일과 계산 결과 캐시가 모두 새로 만들어짐
+PARSE_VERSION = 1
+
+
+def _dataset_key(csv_path: Path) -> str:
+    """CSV 내용 해시 + PARSE_VERSION → 캐시 키 (16자리)"""
+    return hashlib.sha256(f"{file_hash(csv_path)}:{PARSE_VERSION}".encode()).hexdigest()[:16]
+
+
+@shared_resource
+def dataset_versions() -> dict:
+    """데이터셋별 버전 {"country": 해시, "popularity": 해시} (계산 결과 캐시의 키로 사용)"""
+    return {"country": _dataset_key(COUNTRY_CSV), "popularity": _dataset_key(POPULARITY_CSV)}
+
+
+def _parse_country_csv(path: Path, df: pd.DataFrame = None) -> pd.DataFrame:
+    """국가 CSV → Country + float32 유형 컬럼 (df: 이미 읽어 둔 float64 표가 있으면 그것을 씀)"""
+    df = pd.read_csv(path) if df is None else df.copy()
+    types = df.columns[1:]
+    # float32로 저장 (반올림은 하지 않음: 다른 값이 같은 값이 되면 순위가 원래 pandas 결과와 달라짐)
+    df[types] = df[types].astype("float32")
+    return df
+
+
+def _parse_popularity_csv(path: Path) -> pd.DataFrame:
+    df = pd.read_csv(path)
+    # 'July 2004' 같은 형식 → datetime (형식을 지정해서 매번 추론하지 않도록)
+    # 일별 데이터처럼 '2004-07-01' 형식이면 ISO 형식으로 읽음
+    try:
+        df["Date"] = pd.to_datetime(df["Date"], format="%B %Y")
+    except ValueError:
+        df["Date"] = pd.to_datetime(df["Date"], format="ISO8601")
+    return df.sort_values("Date").reset_index(drop=True)
+
+
+def _artifact(csv_path: Path, suffix: str) -> Path:
+    """CSV 내용 해시가 들어간 캐시 파일 경로 (예: countriesMBTI_16types-1a2b….arrow)"""
+    return CACHE_DIR / f"{csv_path.stem}-{_dataset_key(csv_path)}{suffix}"
+
+
+def _publish(artifact: Path, write) -> bool:
+    """write(임시 경로)로 파일을 만든 뒤 artifact 이름으로 옮기고, 예전 버전은 지운다.
+
+    캐시 폴더에 쓸 수 없으면(읽기 전용 배포 환경 등) False를 돌려준다.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # 다른 프로세스가 반쯤 쓰인 파일을 읽지 않도록 임시 파일에 쓰고 이름을 바꾼다
+        tmp = artifact.with_name(f"{artifact.name}.{os.getpid()}.tmp")
+        write(tmp)
+        os.replace(tmp, artifact)
+        stem, key = artifact.name.split(".", 1)[0].rsplit("-", 1)
+        for stale in CACHE_DIR.glob(f"{stem}-*"):
+            if not stale.name.startswith(f"{stem}-{key}"):
+                stale.unlink(missing_ok=True)
+    except OSError:
+        return False
+    return True
+
+
+def _arrow_frame(table) -> pd.DataFrame:
+    """Arrow 표 → DataFrame. 숫자·날짜 컬럼은 메모리 맵을 그대로 가리키는 배열 (복사 없음)
+
+    to_pandas()는 컬럼을 한 덩어리로 모으면서 프로세스마다 힙에 복사하므로 컬럼별로 바꿉니다.
+    문자열 컬럼(국가 이름)은 파이썬 객체가 필요해서 복사합니다.
+    """
+    columns = {}
+    for name, column in zip(table.column_names, table.columns):
+        try:
+            if column.num_chunks != 1:
+                raise pa.ArrowInvalid("chunked")
+            columns[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            columns[name] = column.to_pandas()
+    return pd.DataFrame(columns, copy=False)
+
+
+def _load_columnar(csv_path: Path, parse) -> pd.DataFrame:
+    """CSV 내용 해시에 맞는 Arrow 캐시가 있으면 읽고, 없으면 파싱해서 만든다."""
+    artifact = _artifact(csv_path, ".arrow")
+    if artifact.exists():
+        return _arrow_frame(feather.read_table(artifact, memory_map=True))
+
+    df = parse(csv_path)
+    _publish(artifact, lambda tmp: feather.write_feather(df, tmp, compression="uncompressed"))
+    return df
+
+
+def _freeze(df: pd.DataFrame) -> pd.DataFrame:
+    """숫자·날짜 컬럼의 배열을 읽기 전용으로 잠근 DataFrame을 돌려준다.
+
+    복사하지 않고 읽기 전용 뷰만 만들므로, 메모리 맵에서 읽은 컬럼은 계속 메모리 맵을 가리킵니다.
+    """
+    columns = {}
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_datetime64_any_dtype(s):
+            arr = s.to_numpy().view()
+            arr.setflags(write=False)
+            columns[col] = arr
+        else:
+            columns[col] = s
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+@shared_resource
+def load_country_mbti() -> pd.DataFrame:
+    """국가별 MBTI 16유형 비율 (Country + 16개 float32 유형 컬럼, 읽기 전용)"""
+    return _freeze(_load_columnar(COUNTRY_CSV, _parse_country_csv))
+
+
+@shared_resource
+def load_language_popularity() -> pd.DataFrame:
+    """월별 프로그래밍 언어 인기도 (Date + 언어별 컬럼, 날짜 오름차순, 읽기 전용)"""
+    return _freeze(_load_columnar(POPULARITY_CSV, _parse_popularity_csv))
+
+
+@dataclass(frozen=True)
+class CountryMatrix:
+    """국가 × MBTI 유형 비율 행렬과 행/열 이름표
+
+    values[i, j]는 countries[i] 나라의 types[j] 유형 비율입니다.
+    """
+
+    values: np.ndarray     # (국가 수, 16) float32, 읽기 전용 메모리 맵
+    countries: np.ndarray  # 행 순서대로 국가 이름
+    types: tuple           # 열 순서대로 MBTI 유형
+    rank_key: np.ndarray   # (국가 수, 16) int32, 열마다 CSV float64 값의 작은 순 번호 (같은 값은 같은 번호)
+
+    def column(self, mbti: str) -> np.ndarray:
+        """한 MBTI 유형의 국가별 비율 (values의 열 뷰, 복사 없음)"""
+        return self.values[:, self.types.index(mbti)]
+
+
+def _save_npy(array: np.ndarray):
+    def write(tmp: Path):
+        # np.save는 확장자가 없으면 .npy를 붙이므로 파일 객체로 쓴다
+        with open(tmp, "wb") as f:
+            np.save(f, array, allow_pickle=False)
+    return write
+
+
+def _rank_key(values: np.ndarray) -> np.ndarray:
+    """열마다 값의 작은 순 번호 (0부터, 같은 값은 같은 번호) → float64 순서를 정수로 보관"""
+    key = np.empty(values.shape, dtype=np.int32)
+    for j in range(values.shape[1]):
+        key[:, j] = np.unique(values[:, j], return_inverse=True)[1].reshape(-1)
+    return key
+
+
+def _country_arrays(csv_path: Path) -> dict:
+    """CSV를 float64로 한 번 읽어 행렬 파일에 넣을 배열들을 만든다 (Arrow 캐시가 없으면 같이 만듦)."""
+    raw = pd.read_csv(csv_path)
+    artifact = _artifact(csv_path, ".arrow")
+    if not artifact.exists():
+        df = _parse_country_csv(csv_path, raw)
+        _publish(artifact, lambda tmp: feather.write_feather(df, tmp, compression="uncompressed"))
+    values = raw.iloc[:, 1:].to_numpy(dtype=np.float64)
+    return {
+        "values": values.astype(np.float32),
+        "countries": raw["Country"].to_numpy(dtype=str),
+        "types": raw.columns[1:].to_numpy(dtype=str),
+        "rank_key": _rank_key(values),
+    }
+
+
+@shared_resource
+def load_country_matrix() -> CountryMatrix:
+    """국가 데이터를 메모리 맵 float32 행렬 + 국가/유형 이름표 + 순위 키로 불러온다."""
+    paths = {
+        name: _artifact(COUNTRY_CSV, f".{name}.npy")
+        for name in ("values", "countries", "types", "rank_key")
+    }
+    if not all(p.exists() for p in paths.values()):
+        arrays = _country_arrays(COUNTRY_CSV)
+        published = [_publish(paths[name], _save_npy(arr)) for name, arr in arrays.items()]
+        if not all(published):
+            # 캐시 폴더에 쓸 수 없으면 메모리에 있는 배열을 그대로 사용
+            for name in ("values", "rank_key"):
+                arrays[name].setflags(write=False)
+            return CountryMatrix(arrays["values"], arrays["countries"], tuple(arrays["types"]), arrays["rank_key"])
+
+    return CountryMatrix(
+        values=np.load(paths["values"], mmap_mode="r"),
+        countries=np.load(paths["countries"]),
+        types=tuple(np.load(paths["types"]).tolist()),
+        rank_key=np.load(paths["rank_key"], mmap_mode="r"),
+    )
+
+
+if __name__ == "__main__":
+    for csv_path, parse in [(COUNTRY_CSV, _parse_country_csv), (POPULARITY_CSV, _parse_popularity_csv)]:
+        _load_columnar(csv_path, parse)
+        print(f"{csv_path.name} → {_artifact(csv_path, '.arrow')}")
+    load_country_matrix()
+    print(f"{COUNTRY_CSV.name} → {_artifact(COUNTRY_CSV, '.values.npy')}")
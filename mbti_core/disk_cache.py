@@ -0,0 +1,119 @@
+"""여러 워커 프로세스가 함께 쓰는 디스크 결과 캐시
+
+shared_resource(mbti_core/cache.py)는 프로세스 하나 안에서만 공유됩니다. 워커를 여러 개 띄우면
+(deploy/serve.py) 순위표·언어 요약·추천 점수표·그래프를 워커마다 다시 만들게 되므로,
+한 워커가 만든 결과를 CACHE_DIR/results/ 에 파일로 남겨 다른 워커가 읽어 쓰게 합니다.
+
+    value = disk_cached("rank_index", version, build)   # 있으면 읽고, 없으면 build()로 만들어 저장
+
+- 파일 이름: <name>-<version><suffix>. version(데이터셋 해시 등)이 바뀌면 새 파일을 만들고 예전 파일은 지웁니다.
+- 같은 결과를 여러 워커가 동시에 만들지 않도록 파일 잠금(fcntl.flock)을 겁니다.
+  먼저 잠근 워커가 만드는 동안 나머지는 기다렸다가 그 파일을 읽습니다. (fcntl이 없는 OS는 잠금 없이 동작)
+  잠금 파일(<파일>.lock)은 만드는 동안에만 있고, 잠금을 풀기 전에 지웁니다. (지워진 파일을 잠근
+  쪽은 다시 잠그므로 만드는 워커는 언제나 하나)
+  (결과마다 다른 잠금 파일을 쓰는 이유: 그래프를 만들다가 순위표 같은 다른 결과를 부르는 식으로
+  겹쳐 불러도 서로 기다리며 멈추지 않도록)
+- 파일은 임시 파일에 다 쓴 뒤 os.replace로 옮기므로 반쯤 쓰인 파일을 읽는 일은 없습니다.
+- 캐시 폴더에 쓸 수 없거나 MBTI_SHARED_CACHE=0 이면 그냥 build()한 값을 돌려줍니다.
+- 기본 저장 형식은 pickle입니다. 배열은 읽은 뒤 다시 쓰기 가능해지므로, 공유 객체라면
+  부르는 쪽에서 읽기 전용으로 잠가 주세요.
+"""
+import contextlib
+import os
+import pickle
+from pathlib import Path
+
+from mbti_core.paths import CACHE_DIR
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+RESULTS_DIR = CACHE_DIR / "results"
+
+
+def _enabled() -> bool:
+    return os.environ.get("MBTI_SHARED_CACHE", "1") != "0"
+
+
+@contextlib.contextmanager
+def _file_lock(path: Path):
+    """path.lock 파일에 배타적 잠금 (다른 프로세스가 잡고 있으면 기다림)
+
+    잠금을 쥔 채로 잠금 파일을 지우고 나서 푼다. 기다리던 쪽은 지워진 파일의 잠금을 받게 되므로,
+    잠근 뒤 그 파일이 아직 lock_path에 있는지(inode가 같은지) 확인하고 아니면 새 파일로 다시 잠근다.
+    이렇게 해야 지워진 파일과 새로 만든 파일을 두 워커가 따로 잠그고 동시에 만드는 일이 없음.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.with_name(path.name + ".lock")
+    while True:
+        f = open(lock_path, "a")
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            current = os.stat(lock_path).st_ino == os.fstat(f.fileno()).st_ino
+        except FileNotFoundError:
+            current = False
+        if current:
+            break
+        f.close()
+    try:
+        yield
+    finally:
+        lock_path.unlink(missing_ok=True)
+        fcntl.flock(f, fcntl.LOCK_UN)
+        f.close()
+
+
+def _read(path: Path):
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+def _write(path: Path, data: bytes):
+    """임시 파일에 쓰고 path로 옮긴 뒤, 같은 name의 예전 version 파일(과 남은 잠금 파일)을 지운다."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+    name = path.name.rsplit("-", 1)[0]
+    for stale in path.parent.glob(f"{name}-*"):
+        if stale.name != path.name and stale.name != f"{path.name}.lock" and not stale.name.endswith(".tmp"):
+            stale.unlink(missing_ok=True)
+
+
+def disk_cached(name: str, version: str, build, encode=pickle.dumps, decode=pickle.loads, suffix: str = ".pkl"):
+    """name·version 결과를 디스크에서 읽거나, 없으면 build()로 만들어 저장하고 돌려준다.
+
+    name에는 '-'를 쓰지 마세요 (예전 version 파일을 찾을 때 구분자로 씀).
+    encode/decode: 값 ↔ bytes (기본 pickle)
+    """
+    if not _enabled():
+        return build()
+    path = RESULTS_DIR / f"{name}-{version}{suffix}"
+    data = _read(path)
+    if data is not None:
+        return decode(data)
+
+    try:
+        RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+        lock = _file_lock(path)
+        lock.__enter__()
+    except OSError:
+        # 읽기 전용 배포 환경 등: 이 프로세스에서만 만들어 씀
+        return build()
+    try:
+        data = _read(path)  # 기다리는 동안 다른 워커가 만들었으면 그것을 씀
+        if data is not None:
+            return decode(data)
+        value = build()
+        try:
+            _write(path, encode(value))
+        except OSError:
+            pass
+        return value
+    finally:
+        lock.__exit__(None, None, None)
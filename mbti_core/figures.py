@@ -0,0 +1,115 @@
+"""Plotly 그래프 캐시
+
+MBTI는 16가지뿐이라 학생들이 고르는 그래프도 페이지마다 몇십 개를 넘지 않습니다.
+한 번 만든 Figure를 (페이지, 그래프 이름, 선택값, 데이터셋 버전) 키로 보관해 두면
+다른 학생이 같은 유형을 골랐을 때 pandas 계산과 Plotly 검증(px.bar, add_trace 등)을 건너뜁니다.
+
+st.plotly_chart는 dict를 받으면 Figure(**dict)로 다시 검증하지만 Figure 객체를 받으면
+to_dict()만 하므로, 직렬화한 dict가 아니라 만들어진 Figure 객체를 그대로 보관합니다.
+캐시에서 꺼낸 Figure는 모든 세션이 같이 쓰므로 update_layout 등으로 고치면 안 됩니다.
+그래프 설정은 build 함수 안에서 모두 끝내 주세요.
+
+워커 프로세스를 여러 개 띄운 경우(deploy/serve.py), 한 워커가 만든 그래프는
+명세(JSON)로 디스크에도 저장해서 다른 워커는 메모리 캐시에 없을 때 그 파일에서 다시 만듭니다.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions
+from mbti_core.disk_cache import disk_cached
+from mbti_core.metrics import span
+
+
+class FigureCache:
+    """최근에 쓴 순서대로 maxsize개까지 보관하는 LRU 캐시 (스레드 안전)"""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._figures = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """key에 해당하는 Figure를 돌려준다. 없으면 build()로 만들어 보관한다."""
+        with self._lock:
+            if key in self._figures:
+                self._figures.move_to_end(key)
+                self.hits += 1
+                return self._figures[key]
+            self.misses += 1
+
+        # 그래프 생성은 잠금 밖에서 (다른 세션이 기다리지 않도록)
+        fig = build()
+        with self._lock:
+            self._figures[key] = fig
+            self._figures.move_to_end(key)
+            while len(self._figures) > self.maxsize:
+                self._figures.popitem(last=False)
+        return fig
+
+    def stats(self) -> dict:
+        """{"hits", "misses", "size", "maxsize"} 현재 캐시 상태"""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._figures),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._figures.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+def _figure_id(page: str, name: str, selection: str) -> str:
+    """파일 이름에 쓸 그래프 구분자 (선택값에 'C/C++' 같은 글자가 있어서 해시로)"""
+    return hashlib.sha256(f"{page}|{name}|{selection}".encode()).hexdigest()[:16]
+
+
+def _encode_figure(fig) -> bytes:
+    return fig.to_json().encode()
+
+
+def _decode_figure(data: bytes):
+    import plotly.io as pio
+
+    # px로 새로 만드는 것보다 2~3배 빠름 (검증은 하지만 pandas 계산·px 처리가 없음)
+    return pio.from_json(data.decode())
+
+
+@shared_resource
+def figure_cache() -> FigureCache:
+    """서버 프로세스 전체가 함께 쓰는 그래프 캐시"""
+    return FigureCache()
+
+
+def cached_figure(page: str, name: str, selection: str, dataset: str, build, persist: bool = True):
+    """(page, name, selection, dataset 버전) 키로 캐시된 Figure를 돌려준다.
+
+    page: 페이지 구분용 이름 (예: "09_country_plotly_claude")
+    name: 한 페이지 안의 그래프 이름 (예: "top")
+    selection: 그래프가 달라지는 선택값 (MBTI 유형, 언어 이름 등)
+    dataset: "country" 또는 "popularity" (데이터가 바뀌면 자동으로 새로 만들도록)
+    build: 캐시에 없을 때 Figure를 만드는 인자 없는 함수
+    persist: False면 디스크에 저장하지 않고 메모리 캐시에만 (기간 슬라이더처럼 조합이 많은 그래프)
+    """
+    version = dataset_versions()[dataset]
+    key = (page, name, selection, version)
+
+    def timed_build():
+        with span(page, "figure_build"):
+            if not persist:
+                return build()
+            # 다른 워커 프로세스가 만든 그래프가 있으면 디스크의 JSON(그래프 명세)에서 다시 만듦
+            return disk_cached(
+                f"figure_{_figure_id(page, name, selection)}", version, build,
+                encode=_encode_figure, decode=_decode_figure, suffix=".json",
+            )
+
+    return figure_cache().get(key, timed_build)
@@ -0,0 +1,59 @@
+"""프로그래밍 언어 인기도 요약 (현재/평균/최고/최저/20년 변화/순위)
+
+언어마다 반복문을 돌며 mean()/max()/min()을 부르지 않고, 인기도 표 전체를
+NumPy 배열 하나로 보고 열 방향으로 한 번에 계산합니다.
+결과는 숫자 그대로 두고, 퍼센트 표시 같은 꾸미기는 화면에 그릴 때만 합니다.
+"""
+import numpy as np
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions, load_language_popularity
+from mbti_core.disk_cache import disk_cached
+
+
+def _build_summary() -> pd.DataFrame:
+    df = load_language_popularity()
+    languages = df.columns.drop("Date")
+    values = df[languages].to_numpy()
+
+    current = values[-1]
+    summary = pd.DataFrame({
+        "language": languages,
+        "current": current,
+        "mean": values.mean(axis=0),
+        "max": values.max(axis=0),
+        "min": values.min(axis=0),
+        "peak_date": df["Date"].to_numpy()[values.argmax(axis=0)],
+        "change": current - values[0],
+    })
+    summary = summary.sort_values("current", ascending=False, kind="stable").reset_index(drop=True)
+    summary["rank"] = np.arange(1, len(summary) + 1)
+    return summary
+
+
+@shared_resource
+def _summarize(version: str) -> pd.DataFrame:
+    # 다른 워커 프로세스가 이미 계산했으면 디스크(mbti_core/disk_cache.py)에서 읽음
+    return disk_cached("language_summary", version, _build_summary)
+
+
+def language_summary() -> pd.DataFrame:
+    """모든 언어의 요약 통계 (현재 인기도 높은 순, rank는 1위부터)
+
+    컬럼: language, current, mean, max, min, peak_date, change, rank
+    데이터셋 버전(CSV 해시)마다 한 번만 계산됩니다.
+    """
+    return _summarize(dataset_versions()["popularity"])
+
+
+def language_stats(language: str) -> dict:
+    """한 언어의 요약 통계 (language_summary()의 한 행). 없는 언어면 KeyError
+
+    키: language, current, mean, max, min, peak_date, change, rank
+    """
+    summary = language_summary()
+    rows = summary.index[summary["language"] == language]
+    if len(rows) == 0:
+        raise KeyError(language)
+    return summary.loc[rows[0]].to_dict()
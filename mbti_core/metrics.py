@@ -0,0 +1,219 @@
+"""페이지 단계별 실행 시간 측정 (Prometheus 히스토그램)
+
+페이지가 느릴 때 CSV 로드, pandas 계산, 그래프 생성, 화면 출력(st.plotly_chart /
+st.dataframe이 데이터를 직렬화하는 시간) 중 어디에서 시간이 드는지 알 수 있도록
+각 단계의 시간을 잽니다.
+
+페이지 스크립트는 맨 위에서 PhaseTimer를 한 번 만들고 구간 앞뒤에 begin/end를 넣습니다
+(페이지 본문을 with 블록으로 들여쓰지 않도록). mbti_core 안의 함수는 span()으로 감쌉니다.
+
+    timer = PhaseTimer("09_country_plotly_claude")
+    timer.begin("compute")
+    top_10 = top_countries(selected_mbti, 10)
+    timer.end()
+
+    with span("09_country_plotly_claude", "compute"):
+        top_10 = top_countries(selected_mbti, 10)
+
+단계 이름은 load / compute / figure / render 를 씁니다.
+(figures.cached_figure는 캐시에 없어 그래프를 새로 만든 경우를 figure_build로 따로 기록)
+
+측정값은 (페이지, 단계)마다 누적 히스토그램으로 모아 두고, 환경 변수에 따라 내보냅니다.
+
+- MBTI_METRICS_PORT=9464  → http://127.0.0.1:9464/metrics 에서 Prometheus 텍스트 형식으로 제공
+- MBTI_METRICS_FILE=/var/lib/node_exporter/mbti.prom → MBTI_METRICS_INTERVAL초(기본 15)마다 파일로 저장
+  (node_exporter textfile collector 등에서 읽음)
+
+p50/p95는 Prometheus에서 histogram_quantile(0.95, rate(mbti_phase_seconds_bucket[5m]))로 그립니다.
+"""
+import bisect
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from mbti_core.cache import shared_resource
+
+logger = logging.getLogger(__name__)
+
+METRIC_NAME = "mbti_phase_seconds"
+# 히스토그램 구간 경계(초): 0.5ms ~ 10초
+BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """한 (페이지, 단계)의 실행 시간 분포 (구간별 개수, 합계, 횟수)"""
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)  # 마지막 칸은 10초 초과
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """구간 안에서 선형 보간한 q 분위수(초). histogram_quantile과 같은 방식의 근삿값"""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if seen + n >= target and n:
+                if i == len(BUCKETS):
+                    return BUCKETS[-1]
+                lower = BUCKETS[i - 1] if i else 0.0
+                return lower + (BUCKETS[i] - lower) * (target - seen) / n
+            seen += n
+        return BUCKETS[-1]
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """(페이지, 단계) → Histogram 모음 (스레드 안전)"""
+
+    def __init__(self):
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def observe(self, page: str, phase: str, seconds: float):
+        with self._lock:
+            histogram = self._histograms.get((page, phase))
+            if histogram is None:
+                histogram = self._histograms[(page, phase)] = Histogram()
+            histogram.observe(seconds)
+
+    def summary(self) -> dict:
+        """{(page, phase): {"count", "p50_ms", "p95_ms", "mean_ms"}} 앱이나 벤치마크에서 보기 쉬운 요약"""
+        with self._lock:
+            return {
+                key: {
+                    "count": h.count,
+                    "p50_ms": round(h.quantile(0.5) * 1000, 2),
+                    "p95_ms": round(h.quantile(0.95) * 1000, 2),
+                    "mean_ms": round(h.total / h.count * 1000, 2),
+                }
+                for key, h in sorted(self._histograms.items())
+            }
+
+    def prometheus_text(self) -> str:
+        """Prometheus 텍스트 노출 형식 (구간 개수는 누적)"""
+        lines = [
+            f"# HELP {METRIC_NAME} MBTI 페이지 단계(load/compute/figure/render)별 실행 시간",
+            f"# TYPE {METRIC_NAME} histogram",
+        ]
+        with self._lock:
+            for (page, phase), h in sorted(self._histograms.items()):
+                labels = f'page="{_label(page)}",phase="{_label(phase)}"'
+                cumulative = 0
+                for bound, n in zip(BUCKETS, h.counts):
+                    cumulative += n
+                    lines.append(f'{METRIC_NAME}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{METRIC_NAME}_bucket{{{labels},le="+Inf"}} {h.count}')
+                lines.append(f"{METRIC_NAME}_sum{{{labels}}} {h.total:.6f}")
+                lines.append(f"{METRIC_NAME}_count{{{labels}}} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def clear(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+def _serve_http(registry: MetricsRegistry, port: int):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = registry.prometheus_text().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass  # 수집기가 몇 초마다 부르므로 접속 로그는 남기지 않음
+
+    host = os.environ.get("MBTI_METRICS_HOST", "127.0.0.1")
+    try:
+        server = ThreadingHTTPServer((host, port), Handler)
+    except OSError:
+        logger.warning("metrics 포트 %d를 열 수 없습니다 (이미 사용 중?)", port)
+        return
+    threading.Thread(target=server.serve_forever, name="mbti-metrics-http", daemon=True).start()
+
+
+def _write_file_forever(registry: MetricsRegistry, path: Path, interval: float):
+    while True:
+        time.sleep(interval)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(registry.prometheus_text())
+            os.replace(tmp, path)  # 수집기가 반쯤 쓴 파일을 읽지 않도록
+        except OSError:
+            logger.exception("metrics 파일 저장 실패: %s", path)
+
+
+@shared_resource
+def metrics_registry() -> MetricsRegistry:
+    """서버 프로세스 전체가 함께 쓰는 측정값 모음. 처음 만들 때 환경 변수에 따라 내보내기를 시작한다."""
+    registry = MetricsRegistry()
+    port = os.environ.get("MBTI_METRICS_PORT")
+    if port:
+        _serve_http(registry, int(port))
+    path = os.environ.get("MBTI_METRICS_FILE")
+    if path:
+        interval = float(os.environ.get("MBTI_METRICS_INTERVAL", "15"))
+        threading.Thread(
+            target=_write_file_forever, args=(registry, Path(path), interval),
+            name="mbti-metrics-file", daemon=True,
+        ).start()
+    return registry
+
+
+@contextmanager
+def span(page: str, phase: str):
+    """블록 실행 시간을 (page, phase) 히스토그램에 기록한다 (예외가 나도 기록)."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics_registry().observe(page, phase, time.perf_counter() - started)
+
+
+class PhaseTimer:
+    """페이지 스크립트용 단계 시간 재기 (본문을 with 블록으로 들여쓰지 않고 begin/end로 구간을 표시)
+
+    페이지 맨 위에서 한 번 만들고, 재고 싶은 구간 앞뒤에 begin/end를 넣습니다.
+
+        timer = PhaseTimer(PAGE)
+        timer.begin("load")
+        matrix = load_country_matrix()
+        timer.end()
+
+    end()를 만나지 못한 구간(예외, st.stop 등)은 기록하지 않고, 다음 begin()이 버립니다.
+    """
+
+    def __init__(self, page: str):
+        self.page = page
+        self._phase = None
+        self._started = 0.0
+
+    def begin(self, phase: str):
+        self._phase = phase
+        self._started = time.perf_counter()
+
+    def end(self):
+        if self._phase is None:
+            return
+        metrics_registry().observe(self.page, self._phase, time.perf_counter() - self._started)
+        self._phase = None
@@ -0,0 +1,19 @@
+"""데이터 파일 위치 (pandas 없이 불러올 수 있도록 mbti_core.data에서 분리)
+
+글만 보여주는 페이지도 추천 목록(mbti_core.registry)에서 언어 컬럼 이름을 확인하려면
+CSV 위치가 필요하므로, 경로 설정만 이 가벼운 모듈에 둡니다.
+"""
+import os
+from pathlib import Path
+
+# 저장소 최상위 폴더 (실행 위치와 상관없이 CSV를 찾을 수 있도록)
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# 환경 변수로 다른 CSV(예: bench/make_synthetic.py로 만든 대용량 데이터)를 쓸 수 있음
+COUNTRY_CSV = Path(os.environ.get("MBTI_COUNTRY_CSV", ROOT_DIR / "countriesMBTI_16types.csv"))
+POPULARITY_CSV = Path(os.environ.get(
+    "MBTI_POPULARITY_CSV", ROOT_DIR / "Popularity_of_Programming_Languages_from_2004_to_2024.csv"
+))
+
+# 변환된 캐시 파일을 두는 폴더 (환경 변수로 바꿀 수 있음)
+CACHE_DIR = Path(os.environ.get("MBTI_CACHE_DIR", ROOT_DIR / ".cache"))
@@ -0,0 +1,61 @@
+"""언어 인기도 시계열을 날짜 구간으로 잘라 보기
+
+인기도 표에서 "2019년 이후"나 "가장 최근 날짜"를 찾을 때 df[df['Date'] >= ...]나
+df['Date'].max()를 쓰면 매번 모든 행을 훑습니다. 지금은 월별 20년치(약 250행)라 괜찮지만
+주별·일별 데이터가 수십 년 쌓이면 다시 실행할 때마다 그만큼 느려집니다.
+
+여기서는 인기도 표를 날짜 오름차순 DatetimeIndex로 한 번만 만들어 두고,
+구간은 이진 탐색(searchsorted)으로 시작·끝 위치를 찾아 잘라냅니다 (복사 없는 행 구간 뷰).
+
+    popularity_between("2019-01-01")               # 2019-01-01 이후 전체
+    popularity_between("2010", "2014-12-31", ["Python", "Java"])
+    latest_date()                                  # 가장 최근 날짜 (마지막 행)
+    year_bounds()                                  # (첫 해, 마지막 해) 기간 슬라이더용
+"""
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions, load_language_popularity
+
+
+@shared_resource
+def _series(version: str) -> pd.DataFrame:
+    df = load_language_popularity().set_index("Date")
+    if not df.index.is_monotonic_increasing:
+        df = df.sort_index(kind="stable")
+    return df
+
+
+def popularity_series() -> pd.DataFrame:
+    """날짜 오름차순 DatetimeIndex + 언어별 컬럼 (공유 DataFrame이므로 고치면 안 됨)"""
+    return _series(dataset_versions()["popularity"])
+
+
+def popularity_between(start=None, end=None, columns=None) -> pd.DataFrame:
+    """start 이상 end 이하 날짜의 행 (양쪽 포함, None이면 처음/끝까지)
+
+    start, end: pd.Timestamp가 받는 값 ("2019-01-01", datetime 등)
+    columns: 가져올 언어 컬럼 목록 (None이면 전체)
+    """
+    df = popularity_series()
+    index = df.index
+    first = 0 if start is None else index.searchsorted(pd.Timestamp(start), side="left")
+    last = len(index) if end is None else index.searchsorted(pd.Timestamp(end), side="right")
+    rows = df.iloc[first:last]
+    return rows if columns is None else rows[columns]
+
+
+def latest_date() -> pd.Timestamp:
+    """데이터의 가장 최근 날짜"""
+    return popularity_series().index[-1]
+
+
+def year_bounds() -> tuple:
+    """(첫 해, 마지막 해)"""
+    index = popularity_series().index
+    return index[0].year, index[-1].year
+
+
+def year_span(start_year: int, end_year: int) -> tuple:
+    """start_year 1월 1일 ~ end_year 12월 31일 (popularity_between에 넘길 구간)"""
+    return pd.Timestamp(year=start_year, month=1, day=1), pd.Timestamp(year=end_year, month=12, day=31)
@@ -0,0 +1,158 @@
+"""한 세션의 페이지 실행을 cProfile로 들여다보는 프로파일 모드
+
+선생님이 "12번 페이지가 느려요"라고 할 때, 주소 끝에 ?profile=1 을 붙여 그 페이지를 열면
+그 세션의 실행만 cProfile로 감싸서 돌리고, 페이지 아래에 오래 걸린 함수 표를 보여줍니다.
+
+    http://localhost:8501/mbtilang-claude?profile=1
+
+각 페이지는 맨 위에서 profile_page(__file__)을 부릅니다. 프로파일 모드가 아니면 아무 일도
+하지 않고, 프로파일 모드면 같은 페이지 파일을 cProfile 안에서 한 번 더 실행한 뒤
+(화면은 평소와 똑같이 그려짐) 결과 표를 그리고 바깥 실행은 st.stop()으로 끝냅니다.
+
+- 결과는 st.session_state에 페이지별로 보관합니다 (다른 세션과 섞이지 않음).
+- cProfile은 실행 중인 스레드만 측정하므로 다른 세션은 느려지지 않습니다.
+  다만 한 프로세스에서 동시에 하나만 켤 수 있어서, 다른 세션이 프로파일 중이면 평소처럼 실행합니다.
+- fragment 안의 위젯만 바뀌어 그 구역만 다시 실행될 때는 측정하지 않습니다 (전체 실행만).
+  결과 표도 fragment라서 정렬 기준을 바꾸거나 .prof 파일을 받으면 표만 다시 그립니다.
+- 한 번 측정한 페이지는 결과 표의 "다시 측정" 버튼을 누를 때만 다시 측정합니다. 다른 위젯으로
+  페이지 전체가 다시 실행돼도 보고 있던 결과를 덮어쓰지 않습니다.
+- 결과를 .prof 파일로 받아 snakeviz 등으로 플레임 그래프를 볼 수 있습니다.
+- 운영 서버에서 끄려면 환경 변수 MBTI_PROFILING=0
+- 페이지 맨 위의 profile_page()가 st.set_page_config보다 먼저 st.toast 등을 부를 수 있고,
+  프로파일 모드에서는 같은 페이지를 한 번 더 실행하므로 st.set_page_config가 두 번 불립니다.
+  둘 다 Streamlit 1.46부터 허용되므로 requirements.txt는 streamlit>=1.46.0 입니다.
+"""
+import cProfile
+import marshal
+import os
+import pstats
+import runpy
+import sysconfig
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from mbti_core.paths import ROOT_DIR
+
+QUERY_PARAM = "profile"
+TOP_FUNCTIONS = 40
+
+# cProfile은 프로세스에서 한 번에 하나만 켤 수 있음
+_profile_lock = threading.Lock()
+# 지금 스레드가 이미 프로파일 안에서 페이지를 실행 중인지 (안쪽 실행에서 다시 감싸지 않도록)
+_running = threading.local()
+
+_SHORT_PREFIXES = [
+    (sysconfig.get_paths()["purelib"], "site-packages"),
+    (sysconfig.get_paths()["stdlib"], "stdlib"),
+    (str(ROOT_DIR), "."),
+]
+
+
+def _short_path(filename: str) -> str:
+    for prefix, label in _SHORT_PREFIXES:
+        if filename.startswith(prefix):
+            return label + filename[len(prefix):]
+    return filename
+
+
+def _hot_functions(stats: pstats.Stats, sort: str) -> list:
+    """pstats 결과 → 표에 넣을 행 목록 (sort 기준 내림차순 상위 TOP_FUNCTIONS개)"""
+    rows = []
+    for (filename, line, name), (_, calls, self_time, total_time, _) in stats.stats.items():
+        rows.append({
+            "함수": name,
+            "위치": f"{_short_path(filename)}:{line}" if line else filename,
+            "호출 수": calls,
+            "자체 시간(ms)": round(self_time * 1000, 2),
+            "누적 시간(ms)": round(total_time * 1000, 2),
+        })
+    rows.sort(key=lambda row: row[sort], reverse=True)
+    return rows[:TOP_FUNCTIONS]
+
+
+def _enabled() -> bool:
+    return (
+        os.environ.get("MBTI_PROFILING", "1") != "0"
+        and st.query_params.get(QUERY_PARAM) == "1"
+        and not getattr(_running, "active", False)
+    )
+
+
+def _again_key(page_name: str) -> str:
+    """"다시 측정" 요청을 적어 두는 세션 키 (페이지마다 따로: 다른 페이지로 옮겨 가도 새지 않도록)"""
+    return f"_profile_again_{page_name}"
+
+
+def profile_page(page_file: str):
+    """?profile=1 이면 page_file을 cProfile 안에서 실행하고 결과 표를 그린 뒤 멈춘다.
+
+    이미 측정한 페이지는 "다시 측정"을 누를 때만 다시 측정하고, 그 밖의 실행은 평소처럼 돌린 뒤
+    보관한 결과를 그대로 보여줍니다.
+    """
+    if not _enabled():
+        return
+    page_name = Path(page_file).name
+    measure = (
+        page_name not in st.session_state.get("profiles", {})
+        or st.session_state.pop(_again_key(page_name), False)
+    )
+    if measure and not _profile_lock.acquire(blocking=False):
+        st.toast("다른 세션이 프로파일 중이라 이번 실행은 측정하지 않습니다.")
+        return
+
+    _running.active = True
+    try:
+        if measure:
+            _run_profiled(page_file, page_name)
+        else:
+            runpy.run_path(page_file, run_name="__main__")
+    finally:
+        _running.active = False
+        if measure:
+            _profile_lock.release()
+
+    render_profile(page_name)
+    st.stop()
+
+
+def _run_profiled(page_file: str, page_name: str):
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        runpy.run_path(page_file, run_name="__main__")
+    finally:
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+        st.session_state.setdefault("profiles", {})[page_name] = {
+            "total_ms": round(stats.total_tt * 1000, 1),
+            "stats": stats,
+        }
+
+
+@st.fragment
+def render_profile(page_name: str):
+    """세션에 보관한 page_name 페이지의 마지막 프로파일 결과를 표로 그린다.
+
+    fragment라서 표 안의 정렬 기준·다운로드는 이 함수만 다시 실행합니다.
+    "다시 측정"은 페이지 전체를 다시 실행해서 profile_page가 새로 측정하게 합니다.
+    """
+    profile = st.session_state.get("profiles", {}).get(page_name)
+    if profile is None:
+        return
+    st.divider()
+    with st.expander(f"🔬 프로파일 결과 (이번 실행 {profile['total_ms']:.0f}ms)", expanded=True):
+        sort = st.radio(
+            "정렬 기준", ["누적 시간(ms)", "자체 시간(ms)", "호출 수"], horizontal=True, key="_profile_sort"
+        )
+        st.dataframe(_hot_functions(profile["stats"], sort), hide_index=True, use_container_width=True)
+        if st.button("🔁 다시 측정", help="지금 화면 상태로 페이지를 한 번 더 실행해서 측정합니다."):
+            st.session_state[_again_key(page_name)] = True
+            st.rerun()
+        st.download_button(
+            "📥 .prof 파일 받기 (snakeviz 등으로 플레임 그래프 보기)",
+            data=marshal.dumps(profile["stats"].stats),
+            file_name=f"{Path(page_name).stem}.prof",
+            mime="application/octet-stream",
+        )
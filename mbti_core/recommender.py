@@ -0,0 +1,203 @@
+"""점수 기반 언어 추천 (MBTI 16유형 × 인기도 CSV의 모든 언어)
+
+recommendations.json은 유형마다 언어를 하나씩만 정해 둡니다. 여기서는
+MBTI 네 축과 언어를 같은 4차원 벡터로 나타내고, 16 × 언어 수 점수표 전체를
+행렬 곱 한 번으로 계산해서 유형마다 순위가 매겨진 추천 목록을 만듭니다.
+
+- 유형 벡터: 각 축에서 앞 글자(E, N, T, J)면 +1, 뒷 글자(I, S, F, P)면 -1
+- 언어 벡터: 여러 페이지(registry의 6개 variant)에서 그 언어를 추천한 유형 벡터들의 평균
+  (아무 페이지도 추천하지 않은 언어는 0 벡터 → 인기도와 성장세만으로 순위가 정해짐)
+- 점수 = 궁합(유형·언어 벡터의 내적 / 4, -1~1) × 0.6
+        + 현재 인기도(최댓값 = 1) × 0.25
+        + 최근 GROWTH_YEARS년 변화량(절댓값 최댓값 = 1) × 0.15
+
+CSV에 언어 컬럼이 늘어나도 코드를 고칠 필요가 없고, 점수표와 순위는
+데이터셋 버전(CSV 해시)마다 한 번만 계산하므로 추천은 표에서 꺼내 오기만 합니다.
+
+    top_languages("INTJ", k=5)   # language, score, affinity, popularity, growth, rank
+
+축 비율(%) 입력: 학생마다 네 축의 앞 글자(E, N, T, J) 비율을 0~100으로 받아
+16유형 가중치(축별 비율의 곱, 합 1)로 바꾸고, 점수표를 그 가중치로 섞어서 추천합니다.
+예를 들어 E 52%면 E 유형과 I 유형이 거의 반반 섞입니다. 여러 명도 한 번에 계산합니다.
+
+    recommend_batch([[52, 80, 30, 65], [10, 45, 90, 20]], k=3)   # 한 행에 한 명
+    card_mix([52, 80, 30, 65])   # 10·12번 페이지 추천 카드 언어의 비중
+"""
+import hashlib
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions, file_hash, load_language_popularity
+from mbti_core.disk_cache import disk_cached
+from mbti_core.registry import REGISTRY_JSON, load_registry
+
+AXES = ("EI", "NS", "TF", "JP")  # 각 축의 앞 글자 = +1
+MBTI_TYPES = tuple(
+    a + b + c + d for a in "EI" for b in "NS" for c in "TF" for d in "JP"
+)
+
+WEIGHTS = {"affinity": 0.6, "popularity": 0.25, "growth": 0.15}
+GROWTH_YEARS = 5
+
+
+def mbti_vector(mbti: str) -> np.ndarray:
+    """'INTJ' → [-1, +1, +1, +1] (AXES 순서)"""
+    return np.array([1.0 if letter == axis[0] else -1.0 for letter, axis in zip(mbti, AXES)])
+
+
+@dataclass(frozen=True)
+class ScoreMatrix:
+    """유형 × 언어 추천 점수표와 유형별 순위 (모든 배열 읽기 전용)
+
+    scores[i, j]는 types[i] 유형에 languages[j] 언어를 추천하는 점수입니다.
+    """
+
+    types: tuple             # 행 순서대로 MBTI 유형 (MBTI_TYPES)
+    languages: np.ndarray    # 열 순서대로 언어 (인기도 CSV 컬럼 이름)
+    scores: np.ndarray       # (16, 언어 수) 최종 점수
+    affinity: np.ndarray     # (16, 언어 수) 궁합 점수 (-1~1)
+    popularity: np.ndarray   # (언어 수,) 현재 인기도 (0~1)
+    growth: np.ndarray       # (언어 수,) 최근 변화량 (-1~1)
+    order: np.ndarray        # (16, 언어 수) 각 행: 점수가 높은 언어부터의 열 번호
+
+
+def _language_vectors(languages: list) -> np.ndarray:
+    """registry에서 각 언어를 추천한 유형 벡터의 평균 → (언어 수, 4)"""
+    column_of = {name: j for j, name in enumerate(languages)}
+    votes = np.zeros((len(languages), len(MBTI_TYPES)))
+    for (_, mbti), entry in load_registry().items():
+        if entry["column"] in column_of:
+            votes[column_of[entry["column"]], MBTI_TYPES.index(mbti)] += 1
+
+    type_vectors = np.stack([mbti_vector(t) for t in MBTI_TYPES])
+    counts = votes.sum(axis=1, keepdims=True)
+    return np.divide(votes @ type_vectors, counts, out=np.zeros((len(languages), len(AXES))), where=counts > 0)
+
+
+def _scale(values: np.ndarray) -> np.ndarray:
+    """절댓값 최댓값이 1이 되도록 나눔 (전부 0이면 그대로)"""
+    peak = np.abs(values).max()
+    return values / peak if peak > 0 else values
+
+
+def _compute() -> ScoreMatrix:
+    df = load_language_popularity()
+    languages = df.columns.drop("Date")
+    values = df[languages].to_numpy(dtype=float)
+    dates = df["Date"].to_numpy()
+
+    # GROWTH_YEARS년 전(또는 그 직후) 값과 최신 값의 차이 (월별·일별 데이터 모두 같은 방식)
+    past = np.searchsorted(dates, dates[-1] - np.timedelta64(365 * GROWTH_YEARS, "D"))
+    popularity = _scale(values[-1])
+    growth = _scale(values[-1] - values[past])
+
+    type_vectors = np.stack([mbti_vector(t) for t in MBTI_TYPES])
+    affinity = type_vectors @ _language_vectors(list(languages)).T / len(AXES)
+    scores = (
+        WEIGHTS["affinity"] * affinity
+        + WEIGHTS["popularity"] * popularity
+        + WEIGHTS["growth"] * growth
+    )
+    order = np.argsort(-scores, axis=1, kind="stable")
+    return ScoreMatrix(MBTI_TYPES, languages.to_numpy(dtype=str), scores, affinity, popularity, growth, order)
+
+
+@shared_resource
+def _build(version: str) -> ScoreMatrix:
+    # 점수표는 인기도 CSV뿐 아니라 추천 JSON·가중치에도 달라지므로 모두 키에 넣음
+    key = hashlib.sha256(
+        f"{version}|{file_hash(REGISTRY_JSON)}|{sorted(WEIGHTS.items())}|{GROWTH_YEARS}".encode()
+    ).hexdigest()[:16]
+    # 다른 워커 프로세스가 이미 계산했으면 디스크(mbti_core/disk_cache.py)에서 읽음
+    matrix = disk_cached("score_matrix", key, _compute)
+    for arr in (matrix.affinity, matrix.popularity, matrix.growth, matrix.scores, matrix.order):
+        arr.setflags(write=False)
+    return matrix
+
+
+def score_matrix() -> ScoreMatrix:
+    """현재 인기도 데이터셋의 점수표 (데이터셋 버전마다 한 번만 계산)"""
+    return _build(dataset_versions()["popularity"])
+
+
+def top_languages(mbti: str, k: int = 5) -> pd.DataFrame:
+    """mbti에 추천 점수가 높은 언어 k개 (점수 내림차순)
+
+    컬럼: language, score, affinity, popularity, growth, rank
+    """
+    matrix = score_matrix()
+    i = matrix.types.index(mbti)
+    picked = matrix.order[i, :k]
+    return pd.DataFrame({
+        "language": matrix.languages[picked],
+        "score": matrix.scores[i, picked],
+        "affinity": matrix.affinity[i, picked],
+        "popularity": matrix.popularity[picked],
+        "growth": matrix.growth[picked],
+        "rank": np.arange(1, len(picked) + 1),
+    })
+
+
+# 10·12번 페이지(chatgpt_trend, claude_trend)의 추천 카드
+CARD_VARIANTS = ("chatgpt_trend", "claude_trend")
+
+
+def type_weights(percentages) -> np.ndarray:
+    """축 비율(%) → 16유형 가중치
+
+    percentages: (4,) 또는 (학생 수, 4), AXES 순서로 앞 글자(E, N, T, J) 비율 0~100
+    반환: (학생 수, 16) MBTI_TYPES 순서, 각 행의 합은 1
+    """
+    share = np.clip(np.atleast_2d(np.asarray(percentages, dtype=float)) / 100, 0, 1)
+    first_letter = np.stack([mbti_vector(t) for t in MBTI_TYPES]) > 0  # (16, 4)
+    per_axis = np.where(first_letter, share[:, None, :], 1 - share[:, None, :])
+    return per_axis.prod(axis=2)
+
+
+def dominant_types(percentages) -> np.ndarray:
+    """축 비율(%) → 가장 가까운 유형 이름 (50%는 앞 글자로)"""
+    return np.array(MBTI_TYPES)[type_weights(percentages).argmax(axis=1)]
+
+
+def recommend_batch(percentages, k: int = 3) -> pd.DataFrame:
+    """학생마다 점수표를 유형 가중치로 섞은 추천 상위 k개 (입력 행 순서 그대로)
+
+    컬럼: type(가장 가까운 유형), language_1 … language_k, score_1 … score_k
+    """
+    matrix = score_matrix()
+    weights = type_weights(percentages)
+    scores = weights @ matrix.scores  # (학생 수, 언어 수)
+
+    k = min(k, scores.shape[1])
+    top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    top = np.take_along_axis(top, order, axis=1)
+    top_scores = np.take_along_axis(top_scores, order, axis=1)
+
+    result = {"type": np.array(MBTI_TYPES)[weights.argmax(axis=1)]}
+    for n in range(k):
+        result[f"language_{n + 1}"] = matrix.languages[top[:, n]]
+    for n in range(k):
+        result[f"score_{n + 1}"] = top_scores[:, n]
+    return pd.DataFrame(result)
+
+
+def card_mix(percentages, variants=CARD_VARIANTS) -> pd.DataFrame:
+    """추천 카드(registry)의 언어마다 유형 가중치를 더한 비중 (학생 × 언어, 행 합 1)
+
+    여러 variant를 주면 각 variant의 비중을 평균합니다.
+    """
+    columns = sorted({
+        entry["column"] for (variant, _), entry in load_registry().items()
+        if variant in variants and entry["column"] is not None
+    })
+    onehot = np.zeros((len(MBTI_TYPES), len(columns)))
+    for (variant, mbti), entry in load_registry().items():
+        if variant in variants and entry["column"] is not None:
+            onehot[MBTI_TYPES.index(mbti), columns.index(entry["column"])] += 1
+    onehot /= onehot.sum(axis=1, keepdims=True)
+    return pd.DataFrame(type_weights(percentages) @ onehot, columns=columns)
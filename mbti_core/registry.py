@@ -0,0 +1,85 @@
+"""MBTI → 추천 언어 목록 (모든 페이지가 함께 쓰는 한 곳)
+
+예전에는 추천 언어 딕셔너리가 8개 파일(루트의 두 스크립트, pages/01~03, 10~12)에
+따로 적혀 있었고, 다시 실행될 때마다 딕셔너리와 추천 카드 HTML을 새로 만들었습니다.
+이제 내용은 recommendations.json 한 파일에 페이지 버전(variant)별로 모아 두고,
+서버 프로세스에서 처음 한 번만 읽어서 다음을 미리 만들어 둡니다.
+
+- (variant, MBTI) → 추천 항목: 원래 딕셔너리의 값 그대로 + 아래 키
+  - "mbti", "variant"
+  - "language": 추천 언어 이름 (variant마다 다른 키 lang/col/language를 하나로)
+  - "column": 언어 인기도 CSV에서 그 언어의 컬럼 이름 (데이터에 없는 언어면 None)
+  - "<템플릿 이름>_html": 미리 채워 둔 HTML (예: "card_html")
+- 페이지는 다시 실행될 때 딕셔너리에서 꺼내 쓰기만 합니다.
+
+    info = recommendation("chatgpt", "INTJ")
+    st.markdown(info["card_html"], unsafe_allow_html=True)
+
+variant 이름: chatgpt(01), claude(02), gemini(03), chatgpt_trend(10), gemini_trend(11), claude_trend(12)
+추천 항목은 읽기 전용입니다 (모든 세션이 같이 씀).
+"""
+import csv
+import json
+import re
+from pathlib import Path
+from types import MappingProxyType
+from typing import Optional
+
+from mbti_core.cache import shared_resource
+from mbti_core.paths import POPULARITY_CSV
+
+REGISTRY_JSON = Path(__file__).with_name("recommendations.json")
+
+# 추천 화면에 쓰는 언어 이름 → 인기도 CSV 컬럼 이름이 다른 경우
+COLUMN_ALIASES = {
+    "C": "C/C++",
+    "C++": "C/C++",
+    "Go (Golang)": "Go",
+    "Dart (Flutter)": "Dart",
+}
+
+
+def popularity_columns() -> list:
+    """인기도 CSV의 언어 컬럼 이름 (첫 줄만 읽음, pandas 불필요)"""
+    with open(POPULARITY_CSV, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f))[1:]
+
+
+def resolve_column(language: str, columns) -> Optional[str]:
+    """'Rust 🦀', 'Go (Golang)' 같은 표시 이름 → 인기도 CSV 컬럼 이름 (없으면 None)"""
+    match = re.match(r"[A-Za-z0-9+#/ ().-]+", language)
+    name = match.group().strip() if match else language
+    name = COLUMN_ALIASES.get(name, name)
+    return name if name in columns else None
+
+
+@shared_resource
+def load_registry() -> dict:
+    """{(variant, MBTI): 추천 항목} 전체 (variant 안의 MBTI 순서는 JSON 파일 순서)"""
+    with open(REGISTRY_JSON, encoding="utf-8") as f:
+        variants = json.load(f)
+    columns = set(popularity_columns())
+
+    registry = {}
+    for variant, spec in variants.items():
+        templates = {name: "\n".join(lines) for name, lines in spec["templates"].items()}
+        for mbti, fields in spec["types"].items():
+            entry = dict(fields, mbti=mbti, variant=variant, language=fields[spec["language_field"]])
+            entry["column"] = resolve_column(entry["language"], columns)
+            for name, template in templates.items():
+                entry[f"{name}_html"] = template.format(**entry)
+            registry[(variant, mbti)] = MappingProxyType(entry)
+    return registry
+
+
+@shared_resource
+def recommendations(variant: str) -> MappingProxyType:
+    """variant의 {MBTI: 추천 항목} (원래 페이지의 딕셔너리와 같은 순서)"""
+    return MappingProxyType({
+        mbti: entry for (name, mbti), entry in load_registry().items() if name == variant
+    })
+
+
+def recommendation(variant: str, mbti: str) -> MappingProxyType:
+    """(variant, MBTI)의 추천 항목. 없으면 KeyError"""
+    return load_registry()[(variant, mbti)]
@@ -0,0 +1,234 @@
+"""학생별 HTML 상담 보고서 만들기 (여러 프로세스로 나눠서)
+
+보고서 한 장 = 추천 기준(variant) 페이지의 추천 카드·특성 + 추천 언어의 20년 인기도 그래프.
+명단 CSV와 같은 variant를 쓰므로 CSV의 추천 언어와 보고서의 언어가 항상 같습니다.
+학년 전체(수백 명)를 Streamlit 실행 한 번 안에서 차례로 만들면 그래프를 HTML로 바꾸는 데
+오래 걸리므로, 다음처럼 나눕니다.
+
+1. (서버 프로세스) 추천 언어가 같은 학생끼리 묶고, 언어마다 12번 페이지와 같은 그래프를
+   figures 캐시(page_figure)에서 꺼내 JSON으로 한 번만 바꿉니다. (학생 수가 아니라 언어 수만큼)
+2. (프로세스 풀) 묶음마다 그래프를 HTML 조각으로 한 번만 그리고, 그 묶음 학생들의 보고서에
+   같이 넣습니다. 묶음이 너무 크면 REPORTS_PER_TASK명씩 나눠서 일을 고르게 나눕니다.
+3. (서버 프로세스) 끝난 묶음부터 zip에 넣으면서 progress(끝난 학생 수, 전체 학생 수)를 부릅니다.
+
+    data = build_report_zip(roster, "chatgpt", progress=lambda done, total: ...)   # roster: name, mbti 컬럼
+
+- 작업 프로세스는 spawn으로 띄웁니다 (스레드가 많은 Streamlit 서버를 fork하지 않도록).
+  이 모듈은 맨 위에서 streamlit·pandas를 불러오지 않아서 작업 프로세스가 가볍게 뜹니다.
+- 프로세스 수는 환경 변수 MBTI_REPORT_WORKERS (기본: CPU 수, 1이면 풀 없이 차례로)
+  학생이 MIN_PARALLEL_STUDENTS명보다 적으면 프로세스를 띄우지 않고 차례로 만듭니다.
+- 보고서의 Plotly 자바스크립트는 CDN에서 불러옵니다 (보고서마다 3MB씩 넣지 않도록).
+"""
+import html
+import io
+import multiprocessing
+import os
+import re
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+
+# 보고서를 만들 수 있는 variant (카드를 만드는 방법은 _report_card)
+REPORT_VARIANTS = ("chatgpt", "claude", "gemini", "claude_trend")
+REPORT_VARIANT = "claude_trend"
+# 인기도 그래프는 variant와 상관없이 12번 페이지의 추이 그래프를 씀 (figures 캐시 공유)
+REPORT_PAGE = "12_lang_claude"
+REPORTS_PER_TASK = 50
+# 작업 프로세스를 띄우는 비용(프로세스마다 1~2초)보다 일이 적으면 풀 없이 차례로 만듦
+MIN_PARALLEL_STUDENTS = 100
+
+REPORT_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{name} - 프로그래밍 언어 추천 보고서</title>
+<style>
+    body {{ font-family: sans-serif; max-width: 960px; margin: 2rem auto; color: #333; }}
+    .recommendation-box {{
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem;
+        border-radius: 15px;
+        color: white;
+        text-align: center;
+        margin: 2rem 0;
+    }}
+    .traits {{ display: flex; gap: 1rem; }}
+    .stat-card {{
+        flex: 1;
+        padding: 1.5rem;
+        border-radius: 10px;
+        box-shadow: 0 5px 15px rgba(0,0,0,0.1);
+        text-align: center;
+        font-weight: bold;
+    }}
+    /* 1번 페이지(chatgpt) 카드 */
+    .recommend-card {{
+        border-radius: 18px;
+        padding: 1.5rem 1.8rem;
+        border: 1px solid #eeeeee;
+        background: linear-gradient(135deg, #ffffff, #f7f9ff);
+        box-shadow: 0 8px 18px rgba(15, 23, 42, 0.08);
+    }}
+    .pill {{
+        display: inline-block;
+        padding: 0.2rem 0.7rem;
+        border-radius: 999px;
+        font-size: 0.75rem;
+        font-weight: 600;
+        background-color: #eef2ff;
+        color: #4f46e5;
+        margin-bottom: 0.6rem;
+    }}
+    .language-title {{ font-size: 1.8rem; font-weight: 800; margin-bottom: 0.2rem; }}
+    .mbti-tag {{ font-size: 0.95rem; color: #6b7280; margin-bottom: 0.8rem; }}
+    .reason-title {{ font-weight: 700; margin-top: 0.7rem; }}
+    /* 2번 페이지(claude) 카드 */
+    .result-card {{
+        padding: 2rem;
+        border-radius: 15px;
+        background: linear-gradient(135deg, #f093fb 0%, #f5576c 100%);
+        color: white;
+        margin: 2rem 0;
+        box-shadow: 0 10px 30px rgba(0,0,0,0.2);
+    }}
+    footer {{ margin-top: 3rem; color: #999; font-size: 0.9rem; text-align: center; }}
+</style>
+</head>
+<body>
+<h1>🎯 {name} 학생의 프로그래밍 언어 추천</h1>
+<p>MBTI: <strong>{mbti}</strong></p>
+{card_html}
+<h3>🌟 MBTI 특성</h3>
+<div class="traits">{traits_html}</div>
+<h3>📈 {language} 20년 인기도 추이</h3>
+{trend_html}
+<footer>{today} 생성 · 데이터 출처: TIOBE Index (2004-2024)</footer>
+</body>
+</html>
+"""
+
+MISSING_TREND = "<p>인기도 데이터에 이 언어가 없어서 그래프를 넣지 못했어요.</p>"
+
+# 3번 페이지(gemini)에는 카드 HTML이 없어서 아이콘 + 언어 + 설명으로 만듦 (페이지 화면과 같은 내용)
+GEMINI_CARD = """{icon_html}
+<h2 style="text-align: center;">{language}</h2>
+<p style="text-align: center;">{desc}</p>"""
+
+
+def _file_name(index: int, name: str) -> str:
+    """zip 안의 파일 이름 (순번 + 파일 이름에 못 쓰는 글자를 뺀 학생 이름)"""
+    safe = re.sub(r'[\\/:*?"<>|\s]+', "_", name).strip("_") or "student"
+    return f"{index + 1:04d}_{safe}.html"
+
+
+def _report_card(entry) -> dict:
+    """추천 항목 → 보고서에 넣을 {"card_html", "traits", "language"} (variant 페이지의 카드 그대로)"""
+    variant = entry["variant"]
+    if variant == "chatgpt":
+        card_html, traits = entry["card_html"], entry["roles"].split(", ")
+    elif variant == "claude":
+        card_html, traits = entry["card_html"], [t.strip() for t in entry["traits"].split("•")]
+    elif variant == "gemini":
+        card_html = GEMINI_CARD.format(
+            icon_html=entry["icon_html"], language=html.escape(entry["language"]), desc=html.escape(entry["desc"]),
+        )
+        traits = [entry["tag"]]
+    elif variant == "claude_trend":
+        card_html, traits = entry["card_html"], list(entry["traits"])
+    else:
+        raise ValueError(f"보고서를 만들 수 없는 추천 기준입니다: {variant}")
+    return {"card_html": card_html, "traits": traits, "language": entry["language"]}
+
+
+def render_group(task: dict) -> list:
+    """같은 언어를 추천받은 학생 묶음의 보고서들 → [(파일 이름, HTML), ...]
+
+    task: {"figure_json": 그래프 JSON 또는 None, "cards": {MBTI: 추천 항목}, "students": [(순번, 이름, MBTI)]}
+    프로세스 풀의 작업 함수라서 인자·반환값은 모두 pickle할 수 있는 기본 타입입니다.
+    """
+    if task["figure_json"] is None:
+        trend_html = MISSING_TREND
+    else:
+        import plotly.io as pio
+
+        fig = pio.from_json(task["figure_json"], skip_invalid=True)
+        trend_html = fig.to_html(full_html=False, include_plotlyjs="cdn")
+
+    today = date.today().isoformat()
+    reports = []
+    for index, name, mbti in task["students"]:
+        card = task["cards"][mbti]
+        reports.append((_file_name(index, name), REPORT_TEMPLATE.format(
+            name=html.escape(name),
+            mbti=html.escape(mbti),
+            card_html=card["card_html"],
+            traits_html="".join(f'<div class="stat-card">✨ {html.escape(t)}</div>' for t in card["traits"]),
+            language=html.escape(card["language"]),
+            trend_html=trend_html,
+            today=today,
+        )))
+    return reports
+
+
+def _tasks(roster, variant: str) -> list:
+    """명단 → 언어별 학생 묶음 작업 목록 (그래프 JSON은 언어마다 한 번만)"""
+    from mbti_core.charts import page_figure
+    from mbti_core.registry import recommendations
+
+    cards = recommendations(variant)
+    groups = {}
+    for index, (name, mbti) in enumerate(zip(roster["name"], roster["mbti"])):
+        if mbti in cards:
+            groups.setdefault(cards[mbti]["language"], []).append((index, str(name), mbti))
+
+    tasks = []
+    for language, students in groups.items():
+        column = cards[students[0][2]]["column"]
+        figure_json = page_figure(REPORT_PAGE, "trend", column).to_json() if column is not None else None
+        used = {mbti for _, _, mbti in students}
+        group_cards = {mbti: _report_card(cards[mbti]) for mbti in used}
+        for start in range(0, len(students), REPORTS_PER_TASK):
+            tasks.append({
+                "figure_json": figure_json,
+                "cards": group_cards,
+                "students": students[start:start + REPORTS_PER_TASK],
+            })
+    return tasks
+
+
+def _workers() -> int:
+    return int(os.environ.get("MBTI_REPORT_WORKERS", os.cpu_count() or 1))
+
+
+def build_report_zip(roster, variant: str = REPORT_VARIANT, progress=None) -> bytes:
+    """명단(name, mbti 컬럼)의 학생별 HTML 보고서를 zip 파일 내용으로 만든다.
+
+    variant: 추천 기준 (REPORT_VARIANTS 중 하나, 명단 CSV를 만든 것과 같은 값을 넘겨 주세요)
+    16유형이 아닌 학생은 건너뜁니다. progress(끝난 학생 수, 전체 학생 수)는 서버 프로세스에서 불립니다.
+    """
+    if variant not in REPORT_VARIANTS:
+        raise ValueError(f"보고서를 만들 수 없는 추천 기준입니다: {variant}")
+    tasks = _tasks(roster, variant)
+    total = sum(len(task["students"]) for task in tasks)
+    done = 0
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        def collect(reports):
+            nonlocal done
+            for file_name, content in reports:
+                archive.writestr(file_name, content)
+            done += len(reports)
+            if progress is not None:
+                progress(done, total)
+
+        workers = min(_workers(), len(tasks))
+        if workers <= 1 or total < MIN_PARALLEL_STUDENTS:
+            for task in tasks:
+                collect(render_group(task))
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                for future in as_completed([pool.submit(render_group, task) for task in tasks]):
+                    collect(future.result())
+    return buffer.getvalue()
@@ -0,0 +1,107 @@
+"""학급 명단(이름, MBTI) 한꺼번에 추천하기
+
+선생님이 학생을 한 명씩 고르는 대신 명단 CSV를 올리면, 명단 전체를 추천 목록(registry)과
+한 번에 합쳐서(merge) 학생마다 추천 언어를 붙입니다. 학생 수만큼 딕셔너리를 찾지 않고
+variant의 16개 추천을 작은 표로 만들어 두고 pandas merge 한 번으로 붙입니다.
+
+큰 파일은 CHUNK_ROWS줄씩 나눠 읽고 나눠 합치므로, 한 번에 전체를 파싱하느라
+서버가 오래 멈추지 않고 화면에 진행률을 보여줄 수 있습니다.
+
+    for chunk in read_roster(file):
+        result = recommend_chunk(chunk, "chatgpt")
+
+명단 CSV: 이름 컬럼(이름/name/student 등, 없으면 첫 컬럼)과 MBTI 컬럼(mbti/유형, 없으면 이름 컬럼이 아닌 첫 컬럼)
+MBTI는 대소문자·앞뒤 공백을 정리하고, 16유형이 아니면 추천 언어가 빈칸(NaN)입니다.
+UTF-8로 읽을 수 없는 파일(엑셀에서 저장한 한글 CSV)은 cp949로 다시 읽습니다.
+"""
+import codecs
+import os
+from typing import Iterator
+
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.registry import recommendations
+
+CHUNK_ROWS = 20_000
+
+NAME_COLUMNS = ("이름", "학생", "name", "student")
+MBTI_COLUMNS = ("mbti", "유형")
+
+RESULT_COLUMNS = ["name", "mbti", "language", "column"]
+
+
+@shared_resource
+def registry_frame(variant: str) -> pd.DataFrame:
+    """variant의 추천을 merge용 표로 (mbti, language, column / 16행)"""
+    return pd.DataFrame(
+        [(mbti, entry["language"], entry["column"]) for mbti, entry in recommendations(variant).items()],
+        columns=["mbti", "language", "column"],
+    )
+
+
+def _find_column(columns: list, candidates: tuple, exclude: tuple = ()) -> str:
+    """candidates와 이름이 같은 컬럼, 없으면 exclude를 뺀 첫 컬럼. 고를 컬럼이 없으면 ValueError"""
+    remaining = [col for col in columns if col not in exclude]
+    for col in remaining:
+        if col.strip().lower() in candidates:
+            return col
+    if not remaining:
+        raise ValueError("MBTI 컬럼을 찾을 수 없어요. 명단에는 이름과 MBTI 두 컬럼이 있어야 합니다.")
+    return remaining[0]
+
+
+def _encoding(file) -> str:
+    """명단 파일의 인코딩: UTF-8(BOM 포함)로 끝까지 읽히면 utf-8-sig, 아니면 cp949
+
+    청크를 나눠 읽다 보면 디코딩 오류가 뒤쪽 청크에서야 나므로, 청크를 내보내기 전에
+    파일 전체를 한 번 디코딩해 보고 처음 위치로 되돌립니다. (글자로 된 파일은 그대로)
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return _encoding(f)
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    start = file.tell()
+    try:
+        while block := file.read(1 << 20):
+            if isinstance(block, str):
+                break
+            decoder.decode(block)
+        else:
+            decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        return "cp949"
+    finally:
+        file.seek(start)
+    return "utf-8-sig"
+
+
+def read_roster(file, chunk_rows: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """명단 CSV를 chunk_rows줄씩 읽어 (name, mbti) 표로 돌려준다.
+
+    이름과 MBTI는 서로 다른 컬럼입니다. 이름 컬럼을 먼저 고르고, MBTI 컬럼은 나머지에서 고릅니다.
+    UTF-8이 아니면 cp949로 읽습니다 (둘 다 아니면 UnicodeDecodeError, ValueError의 하위 클래스).
+    """
+    reader = pd.read_csv(
+        file, chunksize=chunk_rows, dtype=str, keep_default_na=False, encoding=_encoding(file),
+    )
+    with reader:
+        for chunk in reader:
+            columns = list(chunk.columns)
+            name_col = _find_column(columns, NAME_COLUMNS)
+            mbti_col = _find_column(columns, MBTI_COLUMNS, exclude=(name_col,))
+            yield pd.DataFrame({
+                "name": chunk[name_col].str.strip(),
+                "mbti": chunk[mbti_col].str.strip().str.upper(),
+            })
+
+
+def recommend_chunk(chunk: pd.DataFrame, variant: str) -> pd.DataFrame:
+    """(name, mbti) 표에 variant의 추천 언어를 붙인다 (명단 순서 그대로, 모르는 유형은 NaN)"""
+    return chunk.merge(registry_frame(variant), on="mbti", how="left", validate="many_to_one")[RESULT_COLUMNS]
+
+
+def language_counts(result: pd.DataFrame) -> pd.DataFrame:
+    """추천 언어별 학생 수 (많은 순, 모르는 유형은 제외)"""
+    counts = result["language"].value_counts()
+    return pd.DataFrame({"language": counts.index, "students": counts.to_numpy()})
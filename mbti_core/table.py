@@ -0,0 +1,125 @@
+"""큰 표를 한 쪽(page)씩 잘라 보내기 (서버에서 정렬·검색)
+
+"전체 데이터 보기"에서 st.dataframe(df)로 표 전체를 넘기면 다시 실행할 때마다 모든 행이
+Arrow로 직렬화되어 모든 브라우저로 갑니다. 지역 단위 데이터처럼 행이 많아지면 그만큼 느려지므로,
+정렬·검색은 서버에서 하고 지금 보이는 한 쪽(page_size행)만 잘라서 돌려줍니다.
+
+    page = table_page("country_mbti", sort="INTJ", ascending=False, query="kor", page=0)
+    page.rows      # 보여줄 행 (원래 컬럼 그대로)
+    page.total     # 검색 조건에 맞는 전체 행 수
+    page.pages     # 전체 쪽 수
+
+- 표는 TABLES에 이름으로 등록합니다 (불러오는 함수, 데이터셋 이름, 검색할 컬럼).
+  불러오는 함수는 이미 캐시된 공유 DataFrame을 돌려주므로 표를 다시 읽지 않습니다.
+- 컬럼별 정렬 순서(argsort)는 데이터셋 버전마다 한 번만 계산해서 모든 세션이 같이 씁니다.
+- 검색은 검색 컬럼의 부분 일치(대소문자 무시)이고, 행마다 파이썬 루프를 돌지 않고 pandas 문자열
+  연산(str.contains) 한 번으로 모든 행을 봅니다.
+- 최근에 요청된 쪽은 functools.lru_cache에 보관합니다 (쪽은 작아서 따로 캐시 클래스를 두지 않음).
+"""
+import functools
+import math
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from mbti_core.cache import shared_resource
+from mbti_core.data import dataset_versions, load_country_mbti
+from mbti_core.language import language_summary
+
+PAGE_SIZE = 50
+PAGE_CACHE_SIZE = 256
+
+# 이름 → (불러오는 함수, dataset_versions()의 데이터셋 이름, 검색할 컬럼)
+TABLES = {
+    "country_mbti": (load_country_mbti, "country", "Country"),
+    "language_summary": (language_summary, "popularity", "language"),
+}
+
+@dataclass(frozen=True)
+class TablePage:
+    """표의 한 쪽"""
+
+    rows: pd.DataFrame
+    total: int  # 검색 조건에 맞는 전체 행 수
+    page: int  # 0부터
+    page_size: int
+
+    @property
+    def pages(self) -> int:
+        return max(1, math.ceil(self.total / self.page_size))
+
+    @property
+    def first_row(self) -> int:
+        """이 쪽 첫 행의 번호 (1부터, 행이 없으면 0)"""
+        return self.page * self.page_size + 1 if len(self.rows) else 0
+
+    @property
+    def last_row(self) -> int:
+        return self.page * self.page_size + len(self.rows)
+
+
+def load_table(name: str) -> pd.DataFrame:
+    """TABLES에 등록된 표 전체 (공유 DataFrame이므로 고치면 안 됨). 없는 이름이면 KeyError"""
+    loader, _, _ = TABLES[name]
+    return loader()
+
+
+def _version(name: str) -> str:
+    return dataset_versions()[TABLES[name][1]]
+
+
+@shared_resource
+def _sort_order(name: str, version: str, column, ascending: bool) -> np.ndarray:
+    """column 기준 정렬 순서 (행 위치 배열, 같은 값은 원래 순서 유지). column이 None이면 원래 순서"""
+    df = load_table(name)
+    if column is None:
+        order = np.arange(len(df))
+    else:
+        # 내림차순도 같은 값끼리는 원래 순서가 되도록 pandas의 안정 정렬을 씀 (NaN은 맨 뒤)
+        order = df[column].reset_index(drop=True).sort_values(ascending=ascending, kind="stable").index.to_numpy()
+    order.setflags(write=False)
+    return order
+
+
+@shared_resource
+def _search_keys(name: str, version: str) -> pd.Series:
+    """검색 컬럼을 소문자 문자열로 (검색할 때마다 바꾸지 않도록, 공유 Series이므로 고치면 안 됨)"""
+    _, _, column = TABLES[name]
+    return load_table(name)[column].astype(str).str.lower().reset_index(drop=True)
+
+
+@functools.lru_cache(maxsize=PAGE_CACHE_SIZE)
+def _build_page(name: str, version: str, sort, ascending: bool, query: str, page: int, page_size: int) -> TablePage:
+    order = _sort_order(name, version, sort, ascending)
+    if query:
+        keys = _search_keys(name, version)
+        matches = keys.str.contains(query, regex=False).to_numpy(dtype=bool, na_value=False)
+        order = order[matches[order]]
+    total = len(order)
+    pages = max(1, math.ceil(total / page_size))
+    page = min(max(page, 0), pages - 1)
+    window = order[page * page_size:(page + 1) * page_size]
+    return TablePage(load_table(name).iloc[window], total, page, page_size)
+
+
+def table_page(name: str, sort=None, ascending: bool = True, query: str = "",
+               page: int = 0, page_size: int = PAGE_SIZE) -> TablePage:
+    """name 표를 sort 컬럼으로 정렬하고 query로 검색한 결과의 page번째 쪽 (0부터)
+
+    page가 범위를 벗어나면 가장 가까운 쪽을 돌려줍니다 (검색으로 행 수가 줄었을 때 등).
+    rows의 index는 원래 표의 index 그대로입니다.
+    """
+    if name not in TABLES:
+        raise KeyError(name)
+    if page_size < 1:
+        raise ValueError("page_size는 1 이상이어야 합니다.")
+    version = _version(name)
+    query = query.strip().lower()
+    return _build_page(name, version, sort, ascending, query, page, page_size)
+
+
+def page_cache_stats() -> dict:
+    """{"hits", "misses", "size", "maxsize"} 쪽 캐시 상태"""
+    info = _build_page.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "size": info.currsize, "maxsize": info.maxsize}
@@ -0,0 +1,52 @@
+"""쪽 단위 표 화면 (mbti_core/table.py의 Streamlit 위젯)
+
+    paged_table(PAGE, "country_mbti", key="country_table")
+
+검색어·정렬 컬럼·방향·쪽 번호 위젯을 그리고, table_page()로 받은 한 쪽만 st.dataframe으로 보냅니다.
+st.fragment라서 쪽을 넘기거나 정렬을 바꾸면 페이지 전체가 아니라 이 표만 다시 실행됩니다.
+
+- format_rows: 보여주기 전에 한 쪽의 행을 꾸미는 함수 (DataFrame → DataFrame 또는 Styler)
+- labels: 정렬 선택 상자에 보여줄 컬럼 이름 {컬럼: 표시 이름}
+- sort_columns: 정렬 선택 상자에 넣을 컬럼 (None이면 모든 컬럼, 화면에 안 보이는 컬럼을 빼고 싶을 때)
+- 나머지 키워드 인자는 st.dataframe에 그대로 넘깁니다 (column_config 등).
+"""
+import streamlit as st
+
+from mbti_core.metrics import span
+from mbti_core.table import PAGE_SIZE, load_table, table_page
+
+ORIGINAL_ORDER = "(원래 순서)"
+
+
+@st.fragment
+def paged_table(page_name: str, name: str, key: str, page_size: int = PAGE_SIZE,
+                format_rows=None, labels=None, sort_columns=None, **dataframe_kwargs):
+    labels = labels or {}
+    columns = [ORIGINAL_ORDER, *(load_table(name).columns if sort_columns is None else sort_columns)]
+
+    col_query, col_sort, col_order = st.columns([2, 2, 1])
+    query = col_query.text_input("🔎 검색", key=f"{key}_query", placeholder="이름 일부")
+    sort = col_sort.selectbox(
+        "정렬 기준", columns, key=f"{key}_sort",
+        format_func=lambda column: labels.get(column, column),
+    )
+    descending = col_order.toggle("내림차순", key=f"{key}_desc")
+
+    # 정렬·검색이 바뀌면 첫 쪽으로
+    view = (query, sort, descending)
+    if st.session_state.get(f"{key}_view") != view:
+        st.session_state[f"{key}_view"] = view
+        st.session_state[f"{key}_page"] = 1
+
+    with span(page_name, "compute"):
+        current = table_page(name, None if sort == ORIGINAL_ORDER else sort, not descending,
+                             query, st.session_state.get(f"{key}_page", 1) - 1, page_size)
+    # 데이터가 바뀌어 쪽 수가 줄었으면 table_page가 고른 가장 가까운 쪽으로 맞춤
+    st.session_state[f"{key}_page"] = current.page + 1
+    st.number_input("쪽", min_value=1, max_value=current.pages, step=1, key=f"{key}_page")
+
+    with span(page_name, "render"):
+        rows = current.rows if format_rows is None else format_rows(current.rows)
+        st.dataframe(rows, **dataframe_kwargs)
+    st.caption(f"전체 {current.total:,}행 중 {current.first_row:,}–{current.last_row:,}행 "
+               f"({current.page + 1}/{current.pages}쪽)")
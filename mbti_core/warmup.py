@@ -0,0 +1,65 @@
+"""서버가 뜨자마자 캐시를 미리 채워 두는 warm-up
+
+첫 학생이 각 MBTI를 고를 때 데이터 로드·계산·그래프 생성 비용을 모두 치르지 않도록,
+두 데이터셋과 순위표·언어 요약·추천 점수표, 그리고 charts.FIGURES에 등록된 모든 그래프를
+16개 유형(언어 그래프는 모든 언어)에 대해 미리 만들어 캐시에 넣습니다.
+
+Streamlit에는 "서버 시작" 훅이 없으므로, 첫 세션이 페이지를 열 때 start_warmup()이
+백그라운드 스레드를 한 번만 띄웁니다. 그 세션은 기다리지 않고 바로 화면을 그립니다.
+환경 변수 MBTI_WARMUP=0 이면 warm-up을 하지 않습니다 (벤치마크에서 캐시가 빈 상태를 잴 때 등).
+"""
+import logging
+import os
+import threading
+import time
+
+from mbti_core.cache import shared_resource
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up():
+    """데이터셋과 계산 결과, 모든 페이지 그래프를 캐시에 채운다 (오래 걸릴 수 있음)."""
+    # pandas·Plotly는 여기서(백그라운드 스레드에서) 불러와서 start_warmup()을 부르는 페이지를 느리게 만들지 않음
+    from mbti_core.charts import FIGURES, FIXED_SELECTIONS, page_figure
+    from mbti_core.country import load_rank_index
+    from mbti_core.data import load_country_matrix, load_country_mbti, load_language_popularity
+    from mbti_core.language import language_summary
+    from mbti_core.recommender import score_matrix
+
+    started = time.perf_counter()
+    load_country_mbti()
+    matrix = load_country_matrix()
+    load_rank_index()
+    popularity = load_language_popularity()
+    language_summary()
+    score_matrix()
+
+    selections = {
+        "country": list(matrix.types),
+        "popularity": popularity.columns.drop("Date").tolist(),
+    }
+    count = 0
+    for (page, name), (dataset, _) in FIGURES.items():
+        for selection in FIXED_SELECTIONS.get((page, name), selections[dataset]):
+            page_figure(page, name, selection)
+            count += 1
+    logger.info("warm-up 완료: 그래프 %d개, %.1f초", count, time.perf_counter() - started)
+
+
+def _run():
+    try:
+        warm_up()
+    except Exception:
+        # warm-up이 실패해도 페이지는 평소처럼(필요할 때 계산해서) 동작하면 됨
+        logger.exception("warm-up 실패")
+
+
+@shared_resource
+def start_warmup():
+    """warm-up 스레드를 프로세스당 한 번만 띄운다 (두 번째 호출부터는 아무 일도 하지 않음)."""
+    if os.environ.get("MBTI_WARMUP", "1") == "0":
+        return None
+    thread = threading.Thread(target=_run, name="mbti-warmup", daemon=True)
+    thread.start()
+    return thread
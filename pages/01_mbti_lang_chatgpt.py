@@ -1,5 +1,7 @@
 import streamlit as st
 
+from mbti_core.registry import recommendations
+
 # 기본 페이지 설정
 st.set_page_config(
     page_title="MBTI 코딩 진로 컨설턴트",
@@ -65,121 +67,8 @@ st.markdown(
     unsafe_allow_html=True,
 )
 
-# ---- 데이터 정의: MBTI별 추천 언어 ----
-MBTI_LANG_MAP = {
-    "INTJ": {
-        "lang": "Rust 🦀",
-        "tagline": "완벽주의 전략가에게 어울리는, 안정성과 효율성 끝판왕 언어",
-        "why": "메모리 안정성과 성능을 동시에 잡는 언어라, 구조를 치밀하게 설계하는 걸 좋아하는 INTJ에게 찰떡이야. 대규모 시스템, 백엔드, 시스템 프로그래밍에 강해.",
-        "roles": "시스템 개발자, 백엔드 개발자, 인프라/플랫폼 엔지니어",
-        "emoji": "♟️"
-    },
-    "INTP": {
-        "lang": "Python 🐍",
-        "tagline": "아이디어 실험 천국, 생각을 바로 코드로 옮기고 싶은 탐구형에게",
-        "why": "문법이 단순해서 실험과 프로토타이핑에 최고야. 데이터 분석, AI, 자동화 등 새로운 걸 파고들기 좋은 생태계를 갖고 있어.",
-        "roles": "데이터 사이언티스트, AI 엔지니어, 자동화/툴 개발자",
-        "emoji": "🔬"
-    },
-    "ENTP": {
-        "lang": "JavaScript ⚡",
-        "tagline": "생각나는 대로 만들고 부숴보는 아이디어 폭발형에게",
-        "why": "웹에서 할 수 있는 건 거의 다 할 수 있어. 프론트, 백엔드, 앱, 게임까지 제대로 놀이터 같은 언어라 ENTP 스타일과 잘 맞아.",
-        "roles": "프론트엔드 개발자, 풀스택 개발자, 프로토타입/스타트업 개발자",
-        "emoji": "💡"
-    },
-    "ENTJ": {
-        "lang": "C# 🧱",
-        "tagline": "프로젝트를 밀어붙이는 리더형에게 어울리는 탄탄한 언어",
-        "why": "대규모 서비스, 기업용 프로그램, 게임(유니티)까지 체계적으로 설계하기 좋은 언어야. 팀 단위 개발에도 강해서 리더십 발휘하기 좋지.",
-        "roles": "백엔드/기업용 SW 개발자, 테크 리드, 게임 개발자(유니티)",
-        "emoji": "🚀"
-    },
-    "INFJ": {
-        "lang": "Python 🕊️",
-        "tagline": "사람과 세상에 도움이 되는 서비스를 만들고 싶은 조용한 이상가에게",
-        "why": "데이터 분석, AI, 교육용 도구, 사회 문제 해결 프로젝트에 자주 쓰여. 배워두면 ‘의미 있는 프로젝트’를 만들 무기가 돼.",
-        "roles": "교육용 SW 개발자, 데이터 분석가, 비영리/소셜 임팩트 분야 개발자",
-        "emoji": "🌱"
-    },
-    "INFP": {
-        "lang": "Kotlin 🎨",
-        "tagline": "감성 있고 섬세한 창작자 타입에게 어울리는 모던 언어",
-        "why": "안드로이드 앱 개발에서 사랑받는 언어로, 표현력이 좋고 코드가 예뻐. 나만의 앱, 감성적인 프로젝트를 만들기 좋지.",
-        "roles": "모바일 앱 개발자(안드로이드), 크리에이티브 앱 제작자",
-        "emoji": "📱"
-    },
-    "ENFP": {
-        "lang": "JavaScript 🎉",
-        "tagline": "아이디어를 바로 웹으로 터뜨리고 싶은 자유로운 영혼에게",
-        "why": "웹 서비스, 인터랙티브 페이지, 크리에이티브한 UI/UX 실험에 최적. 사람들이 직접 쓰는 걸 보는 재미가 큰 언어야.",
-        "roles": "프론트엔드 개발자, UX 프로토타이퍼, 크리에이티브 테크 개발자",
-        "emoji": "✨"
-    },
-    "ENFJ": {
-        "lang": "Python 🤝",
-        "tagline": "사람과 협업하고, 교육하고, 리딩하는 조율자에게",
-        "why": "교육 자료가 풍부하고 입문자 친화적이라, 다른 사람을 가르치거나 함께 배우기에 좋아. 데이터/AI 쪽에서 팀을 이끌기도 좋아.",
-        "roles": "에듀테크 개발자, 데이터 기반 서비스 기획/리드, 멘토형 개발자",
-        "emoji": "📚"
-    },
-    "ISTJ": {
-        "lang": "C 🔧",
-        "tagline": "정확함과 원리를 중시하는 현실주의자에게",
-        "why": "운영체제, 임베디드, 하드웨어 가까운 영역에서 쓰이는 기초 언어야. 컴퓨터의 ‘진짜 원리’를 알고 싶어하는 ISTJ와 잘 맞아.",
-        "roles": "임베디드 개발자, 시스템/펌웨어 개발자, 저수준 SW 엔지니어",
-        "emoji": "🧱"
-    },
-    "ISFJ": {
-        "lang": "Java 🧵",
-        "tagline": "안정적인 서비스와 꼼꼼한 관리에 강한 수호자 타입에게",
-        "why": "대기업, 금융, 공공기관 등 안정성이 중요한 곳에서 널리 쓰여. 꼼꼼함과 책임감을 살리기 좋은 언어야.",
-        "roles": "엔터프라이즈 백엔드 개발자, 유지보수/운영 개발자",
-        "emoji": "🛡️"
-    },
-    "ESTJ": {
-        "lang": "Java 🏗️",
-        "tagline": "규칙과 구조를 중시하는 실행력 갑 조직가에게",
-        "why": "명확한 규칙과 탄탄한 프레임워크로 대규모 시스템을 운영하기 좋지. 리더십 발휘하며 팀 개발하기에 딱.",
-        "roles": "백엔드 개발자, 기술 PM, 시스템 설계자",
-        "emoji": "📊"
-    },
-    "ESFJ": {
-        "lang": "SQL 🍽️",
-        "tagline": "사람들이 쓰는 데이터를 정리하고 서비스로 연결하는 호스트 타입에게",
-        "why": "데이터를 정리하고 꺼내 쓰는 언어로, 서비스 운영/분석에 필수야. 사람들의 행동 데이터를 이해하는 데 강점이 있어.",
-        "roles": "데이터 분석가, 서비스 운영/기획, BI 담당자",
-        "emoji": "📈"
-    },
-    "ISTP": {
-        "lang": "C++ 🛠️",
-        "tagline": "기계, 성능, 최적화를 좋아하는 장인형에게",
-        "why": "게임 엔진, 성능이 중요한 프로그램에 많이 쓰여. ‘튜닝’하고 손으로 만지는 느낌의 개발을 즐기는 ISTP에게 잘 맞아.",
-        "roles": "게임 엔진/그래픽스 개발자, 성능 튜닝 엔지니어",
-        "emoji": "🎮"
-    },
-    "ISFP": {
-        "lang": "Swift 🍎",
-        "tagline": "감각적인 iOS 앱과 디자인에 끌리는 예술가 타입에게",
-        "why": "iPhone, iPad, Mac용 앱을 만드는 언어야. 디자인, 인터랙션, 감성적인 UI를 살리기 딱 좋아.",
-        "roles": "iOS 앱 개발자, 크리에이티브 앱 디자이너/개발자",
-        "emoji": "🎨"
-    },
-    "ESTP": {
-        "lang": "Go 🏎️",
-        "tagline": "빠른 실행과 실전형 프로젝트를 좋아하는 액션파에게",
-        "why": "문법이 단순하고 속도가 빨라서, 서버/클라우드 쪽에서 ‘바로 써먹기’ 좋은 언어야. 스타트업, 실전 프로젝트에 강함.",
-        "roles": "백엔드/클라우드 개발자, DevOps, 스타트업 엔지니어",
-        "emoji": "⚙️"
-    },
-    "ESFP": {
-        "lang": "JavaScript 🌈",
-        "tagline": "사람들이 바로 ‘와!’ 할 만한 화면을 만들고 싶은 엔터테이너에게",
-        "why": "애니메이션, 인터랙티브 페이지, 화려한 웹사이트를 만들기 딱. 결과가 눈에 바로 보여서 재미를 많이 느낄 수 있어.",
-        "roles": "프론트엔드 개발자, 웹디자이너/웹퍼블리셔, 인터랙티브 미디어 개발자",
-        "emoji": "🎭"
-    },
-}
+# ---- 데이터: MBTI별 추천 언어 (mbti_core/recommendations.json, 카드 HTML까지 미리 만들어 둠) ----
+MBTI_LANG_MAP = recommendations("chatgpt")
 
 MBTI_LIST = list(MBTI_LANG_MAP.keys())
 
@@ -236,22 +125,7 @@ if clicked:
     info = MBTI_LANG_MAP.get(selected_mbti)
 
     st.markdown("### 상담 결과 카드 💌")
-    st.markdown(
-        f"""
-        <div class="recommend-card">
-            <div class="pill">MBTI 기반 추천 언어</div>
-            <div class="language-title">{info['lang']} {info['emoji']}</div>
-            <div class="mbti-tag">for <b>{selected_mbti}</b> 타입</div>
-            <div class="reason-title">💡 한 줄 소개</div>
-            <p>{info['tagline']}</p>
-            <div class="reason-title">🧠 왜 잘 맞을까?</div>
-            <p>{info['why']}</p>
-            <div class="reason-title">🛤️ 이런 진로와 잘 어울려요</div>
-            <p>{info['roles']}</p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(info["card_html"], unsafe_allow_html=True)
 
     # 분위기에 따라 한 줄 조언
     if mood == "차분하게":
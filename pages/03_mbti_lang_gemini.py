@@ -1,5 +1,7 @@
 import streamlit as st
 
+from mbti_core.registry import recommendations
+
 # 1. 페이지 설정 (브라우저 탭 타이틀 및 아이콘)
 st.set_page_config(
     page_title="MBTI 코딩 진로 상담소",
@@ -7,26 +9,9 @@ st.set_page_config(
     layout="wide"  # 테이블을 넓게 보여주기 위해 wide 모드 설정
 )
 
-# 2. 데이터 정의 (별도 DB나 파일 없이 딕셔너리로 관리)
+# 2. 데이터 정의 (mbti_core/recommendations.json에서 한 번만 읽어 옴)
 # 16가지 MBTI 유형과 매칭되는 언어, 설명, 이모지
-mbti_db = {
-    "INTJ": {"lang": "Rust", "icon": "🦀", "tag": "전략가", "desc": "안전하고 효율적인 시스템 설계"},
-    "INTP": {"lang": "Python", "icon": "🐍", "tag": "논리술사", "desc": "AI와 데이터의 본질 탐구"},
-    "ENTJ": {"lang": "C++", "icon": "⚡", "tag": "지배자", "desc": "압도적인 성능과 시스템 장악"},
-    "ENTP": {"lang": "Go (Golang)", "icon": "🐹", "tag": "혁명가", "desc": "빠르고 실용적인 구글의 언어"},
-    "INFJ": {"lang": "Swift", "icon": "🍎", "tag": "예언자", "desc": "우아한 구조의 iOS 앱 개발"},
-    "INFP": {"lang": "Kotlin", "icon": "🤖", "tag": "몽상가", "desc": "자유로운 안드로이드 세상 창조"},
-    "ENFJ": {"lang": "Ruby", "icon": "💎", "tag": "언변가", "desc": "개발자의 행복을 위한 코딩"},
-    "ENFP": {"lang": "JavaScript", "icon": "✨", "tag": "스파크", "desc": "웹 프론트엔드의 화려한 마법"},
-    "ISTJ": {"lang": "Java", "icon": "☕", "tag": "관리자", "desc": "견고하고 안정적인 대규모 백엔드"},
-    "ISFJ": {"lang": "SQL", "icon": "🗃️", "tag": "수호자", "desc": "데이터의 질서와 보존을 담당"},
-    "ESTJ": {"lang": "C#", "icon": "🎯", "tag": "감독관", "desc": "체계적인 윈도우/.NET 생태계"},
-    "ESFJ": {"lang": "PHP", "icon": "🐘", "tag": "도우미", "desc": "웹의 역사와 함께하는 친근함"},
-    "ISTP": {"lang": "C", "icon": "🔌", "tag": "장인", "desc": "하드웨어를 제어하는 극한의 효율"},
-    "ISFP": {"lang": "Dart (Flutter)", "icon": "🦋", "tag": "예술가", "desc": "하나의 코드로 그리는 예쁜 UI"},
-    "ESTP": {"lang": "Solidity", "icon": "⛓️", "tag": "사업가", "desc": "블록체인이라는 기회의 땅"},
-    "ESFP": {"lang": "HTML/CSS", "icon": "🎨", "tag": "연예인", "desc": "눈에 보이는 즉각적인 결과물"}
-}
+mbti_db = recommendations("gemini")
 
 # 3. 사이드바: 사용자 입력
 with st.sidebar:
@@ -54,7 +39,7 @@ with container:
     
     with col1:
         # 이모지를 아주 크게 표시
-        st.markdown(f"<div style='font-size: 80px; text-align: center; line-height: 1.2;'>{selected_data['icon']}</div>", unsafe_allow_html=True)
+        st.markdown(selected_data["icon_html"], unsafe_allow_html=True)
     
     with col2:
         st.subheader(f"{selected_data['lang']}")
@@ -1,19 +1,29 @@
-import pandas as pd
 import streamlit as st
 import altair as alt
 
+from mbti_core.country import bottom_countries, top_countries
+from mbti_core.data import load_country_matrix
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "04_country_chatgpt"
+timer = PhaseTimer(PAGE)
+
 # ======================
 # 데이터 로드
 # ======================
-@st.cache_data
-def load_data():
-    df = pd.read_csv("countriesMBTI_16types.csv")
-    return df
-
-df = load_data()
+timer.begin("load")
+matrix = load_country_matrix()
+timer.end()
 
 # MBTI 컬럼 목록 (Country 제외)
-mbti_cols = [c for c in df.columns if c != "Country"]
+mbti_cols = list(matrix.types)
 
 # ======================
 # UI
@@ -28,11 +38,11 @@ selected_mbti = st.selectbox("MBTI 유형을 선택하세요:", mbti_cols)
 # ======================
 # 선택된 MBTI 기준 상위 / 하위 10개 나라 계산
 # ======================
-top10 = df.nlargest(10, selected_mbti)[["Country", selected_mbti]].copy()
-top10 = top10.rename(columns={selected_mbti: "ratio"})
+timer.begin("compute")
+top10 = top_countries(selected_mbti, 10).rename(columns={selected_mbti: "ratio"})
 
-bottom10 = df.nsmallest(10, selected_mbti)[["Country", selected_mbti]].copy()
-bottom10 = bottom10.rename(columns={selected_mbti: "ratio"})
+bottom10 = bottom_countries(selected_mbti, 10).rename(columns={selected_mbti: "ratio"})
+timer.end()
 
 # 값이 0~1 비율이면 퍼센트로 바꿔서 보여주고 싶다면 아래처럼 사용해도 됨
 # top10["ratio_percent"] = top10["ratio"] * 100
@@ -43,6 +53,7 @@ bottom10 = bottom10.rename(columns={selected_mbti: "ratio"})
 # ======================
 st.subheader(f"{selected_mbti} 비율이 **가장 높은 10개 나라**")
 
+timer.begin("figure")
 top_chart = (
     alt.Chart(top10)
     .mark_bar()
@@ -56,14 +67,18 @@ top_chart = (
     )
     .properties(width=700, height=400)
 )
+timer.end()
 
+timer.begin("render")
 st.altair_chart(top_chart, use_container_width=True)
+timer.end()
 
 # ======================
 # 하위 10개 나라 막대 그래프 (인터랙티브)
 # ======================
 st.subheader(f"{selected_mbti} 비율이 **가장 낮은 10개 나라** (인터랙티브)")
 
+timer.begin("figure")
 # Altair 인터랙션: 클릭해서 강조하는 selection
 selection = alt.selection_single(fields=["Country"], on="click", empty="none")
 
@@ -87,5 +102,8 @@ bottom_chart = (
     .properties(width=700, height=400)
     .interactive()  # 줌/팬 등 기본 인터랙션 추가
 )
+timer.end()
 
+timer.begin("render")
 st.altair_chart(bottom_chart, use_container_width=True)
+timer.end()
@@ -1,7 +1,20 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
 
+from mbti_core.country import bottom_countries, top_countries
+from mbti_core.data import load_country_matrix
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "05_country_claude"
+timer = PhaseTimer(PAGE)
+
 # 페이지 설정
 st.set_page_config(
     page_title="MBTI 국가별 분포",
@@ -14,15 +27,12 @@ st.title("🌍 국가별 MBTI 유형 분포 분석")
 st.markdown("---")
 
 # 데이터 로드
-@st.cache_data
-def load_data():
-    df = pd.read_csv('countriesMBTI_16types.csv')
-    return df
-
-df = load_data()
+timer.begin("load")
+matrix = load_country_matrix()
+timer.end()
 
 # MBTI 유형 목록 (Country 컬럼 제외)
-mbti_types = df.columns[1:].tolist()
+mbti_types = list(matrix.types)
 
 # MBTI 유형별 설명
 mbti_descriptions = {
@@ -55,33 +65,40 @@ selected_mbti = st.sidebar.selectbox(
 # 선택된 MBTI에 대한 설명
 st.sidebar.info(f"**{selected_mbti}**\n\n{mbti_descriptions.get(selected_mbti, '')}")
 
+# 상위 / 하위 10개 국가 (행렬에서 한 번만 계산해서 통계·그래프·표에 같이 사용)
+timer.begin("compute")
+top_10_display = top_countries(selected_mbti, 10)
+bottom_10_display = bottom_countries(selected_mbti, 10)
+timer.end()
+
 # 통계 정보
 col1, col2, col3 = st.columns(3)
 with col1:
-    avg_value = df[selected_mbti].mean()
+    avg_value = matrix.column(selected_mbti).mean()
     st.metric("전 세계 평균 비율", f"{avg_value:.2%}")
 with col2:
-    max_country = df.loc[df[selected_mbti].idxmax(), 'Country']
-    max_value = df[selected_mbti].max()
+    max_country, max_value = top_10_display.iloc[0]
     st.metric("최고 비율 국가", max_country, f"{max_value:.2%}")
 with col3:
-    min_country = df.loc[df[selected_mbti].idxmin(), 'Country']
-    min_value = df[selected_mbti].min()
+    min_country, min_value = bottom_10_display.iloc[0]
     st.metric("최저 비율 국가", min_country, f"{min_value:.2%}")
 
 st.markdown("---")
 
+timer.begin("compute")
 # 상위 10개 국가 데이터
-top_10 = df.nlargest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-top_10['Rank'] = range(1, 11)
+top_10 = top_10_display.copy()
+top_10['Rank'] = range(1, len(top_10) + 1)
 
 # 하위 10개 국가 데이터
-bottom_10 = df.nsmallest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-bottom_10['Rank'] = range(1, 11)
+bottom_10 = bottom_10_display.copy()
+bottom_10['Rank'] = range(1, len(bottom_10) + 1)
+timer.end()
 
 # 상위 10개 국가 그래프
 st.subheader(f"📊 {selected_mbti} 비율이 가장 높은 10개 국가")
 
+timer.begin("figure")
 chart_top = alt.Chart(top_10).mark_bar().encode(
     x=alt.X(f'{selected_mbti}:Q', 
             title=f'{selected_mbti} 비율',
@@ -106,14 +123,18 @@ chart_top = alt.Chart(top_10).mark_bar().encode(
     labelFontSize=12,
     titleFontSize=14
 ).interactive()
+timer.end()
 
+timer.begin("render")
 st.altair_chart(chart_top, use_container_width=True)
+timer.end()
 
 st.markdown("---")
 
 # 하위 10개 국가 그래프
 st.subheader(f"📉 {selected_mbti} 비율이 가장 낮은 10개 국가")
 
+timer.begin("figure")
 # 인터랙티브한 선택 기능 추가
 selection = alt.selection_point(fields=['Country'], on='mouseover', nearest=True)
 
@@ -148,8 +169,11 @@ chart_bottom = alt.Chart(bottom_10).mark_bar().encode(
     labelFontSize=12,
     titleFontSize=14
 ).interactive()
+timer.end()
 
+timer.begin("render")
 st.altair_chart(chart_bottom, use_container_width=True)
+timer.end()
 
 # 데이터 테이블 (옵션)
 with st.expander("📋 상세 데이터 보기"):
@@ -157,19 +181,23 @@ with st.expander("📋 상세 데이터 보기"):
     
     with col1:
         st.markdown("**상위 10개 국가**")
+        timer.begin("render")
         st.dataframe(
             top_10.style.format({selected_mbti: '{:.2%}'}),
             hide_index=True,
             use_container_width=True
         )
+        timer.end()
     
     with col2:
         st.markdown("**하위 10개 국가**")
+        timer.begin("render")
         st.dataframe(
             bottom_10.style.format({selected_mbti: '{:.2%}'}),
             hide_index=True,
             use_container_width=True
         )
+        timer.end()
 
 # 푸터
 st.markdown("---")
@@ -1,7 +1,21 @@
 import streamlit as st
-import pandas as pd
 import altair as alt
 
+from mbti_core.country import bottom_countries, top_countries
+from mbti_core.data import load_country_mbti
+from mbti_core.metrics import PhaseTimer, span
+from mbti_core.profiling import profile_page
+from mbti_core.table_view import paged_table
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "06_country_gemini"
+timer = PhaseTimer(PAGE)
+
 # 1. 페이지 기본 설정
 st.set_page_config(
     page_title="MBTI 국가별 비율 분석",
@@ -9,15 +23,11 @@ st.set_page_config(
     layout="wide"
 )
 
-# 2. 데이터 로드 함수 (캐싱 적용)
-@st.cache_data
-def load_data():
-    # csv 파일이 같은 폴더에 있다고 가정
-    df = pd.read_csv('countriesMBTI_16types.csv')
-    return df
-
+# 2. 데이터 로드 (공통 모듈에서 캐싱)
 try:
-    df = load_data()
+    timer.begin("load")
+    df = load_country_mbti()
+    timer.end()
 except FileNotFoundError:
     st.error("CSV 파일을 찾을 수 없습니다. 'countriesMBTI_16types.csv' 파일이 같은 폴더에 있는지 확인해주세요.")
     st.stop()
@@ -36,13 +46,16 @@ with st.sidebar:
     st.write(f"선택된 MBTI: **{selected_mbti}**")
 
 # 4. 데이터 필터링 및 정렬
+timer.begin("compute")
 # 상위 10개국 (내림차순 정렬)
-top_10 = df[['Country', selected_mbti]].sort_values(by=selected_mbti, ascending=False).head(10)
+top_10 = top_countries(selected_mbti, 10)
 # 하위 10개국 (오름차순 정렬)
-bottom_10 = df[['Country', selected_mbti]].sort_values(by=selected_mbti, ascending=True).head(10)
+bottom_10 = bottom_countries(selected_mbti, 10)
+timer.end()
 
 # 5. Altair 그래프 생성
 
+timer.begin("figure")
 # [그래프 1] 상위 10개국 (Top 10)
 chart_top = alt.Chart(top_10).mark_bar().encode(
     x=alt.X(f'{selected_mbti}:Q', title='비율', axis=alt.Axis(format='%')),
@@ -64,16 +77,18 @@ chart_bottom = alt.Chart(bottom_10).mark_bar().encode(
     title=f"📉 {selected_mbti} 비율이 가장 낮은 나라 Bottom 10 (확대/축소 가능)",
     height=400
 ).interactive() # 요청하신 대로 인터랙티브 기능 활성화 (줌/팬)
+timer.end()
 
 # 6. 화면 출력
 col1, col2 = st.columns(2)
 
-with col1:
+with col1, span(PAGE, "render"):
     st.altair_chart(chart_top, use_container_width=True)
 
-with col2:
+with col2, span(PAGE, "render"):
     st.altair_chart(chart_bottom, use_container_width=True)
 
 # 데이터 미리보기 (옵션)
 with st.expander("전체 데이터 원본 보기"):
-    st.dataframe(df)
+    # 한 쪽(50행)씩만 보냄, 정렬·검색은 서버에서 (mbti_core/table.py)
+    paged_table(PAGE, "country_mbti", key="country_table", hide_index=True)
@@ -1,6 +1,18 @@
-import pandas as pd
 import streamlit as st
-import plotly.express as px
+
+from mbti_core.charts import page_figure
+from mbti_core.data import load_country_matrix
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "07_country_plotly_chatgpt"
+timer = PhaseTimer(PAGE)
 
 # 페이지 설정
 st.set_page_config(
@@ -11,15 +23,12 @@ st.set_page_config(
 # ======================
 # 데이터 로드
 # ======================
-@st.cache_data
-def load_data():
-    df = pd.read_csv("countriesMBTI_16types.csv")
-    return df
-
-df = load_data()
+timer.begin("load")
+matrix = load_country_matrix()
+timer.end()
 
 # MBTI 컬럼 목록 (Country 제외)
-mbti_cols = [c for c in df.columns if c != "Country"]
+mbti_cols = list(matrix.types)
 
 # ======================
 # UI
@@ -39,42 +48,19 @@ st.write(
 
 selected_mbti = st.selectbox("MBTI 유형을 선택하세요:", mbti_cols)
 
-# ======================
-# 선택된 MBTI 기준 상위 / 하위 10개 나라 계산
-# ======================
-top10 = df.nlargest(10, selected_mbti)[["Country", selected_mbti]].copy()
-top10 = top10.sort_values(selected_mbti, ascending=False)
-
-bottom10 = df.nsmallest(10, selected_mbti)[["Country", selected_mbti]].copy()
-bottom10 = bottom10.sort_values(selected_mbti, ascending=True)
-
 # ======================
 # 상위 10개 나라 막대 그래프 (Plotly)
 # ======================
 st.subheader(f"📈 {selected_mbti} 비율이 가장 높은 10개 나라")
 
-fig_top = px.bar(
-    top10,
-    x="Country",
-    y=selected_mbti,
-    title=f"{selected_mbti} 비율이 높은 10개 나라",
-    labels={
-        "Country": "Country",
-        selected_mbti: f"{selected_mbti} 비율"
-    },
-    hover_data={
-        "Country": True,
-        selected_mbti: ":.3f"
-    }
-)
-
-fig_top.update_layout(
-    xaxis_title="Country",
-    yaxis_title=f"{selected_mbti} 비율",
-    hovermode="x unified"
-)
+# (그래프 코드는 mbti_core/charts.py, 같은 유형의 그래프는 캐시에서 재사용)
+timer.begin("figure")
+fig_top = page_figure(PAGE, "top", selected_mbti)
+timer.end()
 
+timer.begin("render")
 st.plotly_chart(fig_top, use_container_width=True)
+timer.end()
 
 st.markdown("---")
 
@@ -83,36 +69,13 @@ st.markdown("---")
 # ======================
 st.subheader(f"📉 {selected_mbti} 비율이 가장 낮은 10개 나라 (인터랙티브)")
 
-fig_bottom = px.bar(
-    bottom10,
-    x="Country",
-    y=selected_mbti,
-    title=f"{selected_mbti} 비율이 낮은 10개 나라",
-    labels={
-        "Country": "Country",
-        selected_mbti: f"{selected_mbti} 비율"
-    },
-    hover_data={
-        "Country": True,
-        selected_mbti: ":.3f"
-    }
-)
-
-# 카테고리 정렬 & 약간의 인터랙션 튜닝
-fig_bottom.update_layout(
-    xaxis_title="Country",
-    yaxis_title=f"{selected_mbti} 비율",
-    xaxis=dict(categoryorder="total ascending"),
-    hovermode="x unified"
-)
-
-# 막대에 값 표시 옵션 (원하면 주석 처리 풀어도 됨)
-fig_bottom.update_traces(
-    hovertemplate="<b>%{x}</b><br>" +
-                  selected_mbti + " 비율: %{y:.3f}<extra></extra>"
-)
+timer.begin("figure")
+fig_bottom = page_figure(PAGE, "bottom", selected_mbti)
+timer.end()
 
+timer.begin("render")
 st.plotly_chart(fig_bottom, use_container_width=True)
+timer.end()
 
 st.info(
     "그래프 위에서 마우스 휠로 줌, 드래그로 이동, 상단 툴바로 영역 확대/리셋 등이 가능합니다."
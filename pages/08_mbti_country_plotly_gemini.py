@@ -1,6 +1,19 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from mbti_core.charts import page_figure
+from mbti_core.data import load_country_mbti
+from mbti_core.metrics import PhaseTimer, span
+from mbti_core.profiling import profile_page
+from mbti_core.table_view import paged_table
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "08_country_plotly_gemini"
+timer = PhaseTimer(PAGE)
 
 # 1. 페이지 기본 설정
 st.set_page_config(
@@ -9,19 +22,12 @@ st.set_page_config(
     layout="wide"
 )
 
-# 2. 데이터 로드 함수
-@st.cache_data
-def load_data():
-    try:
-        # 같은 폴더에 있는 csv 파일 읽기
-        df = pd.read_csv('countriesMBTI_16types.csv')
-        return df
-    except FileNotFoundError:
-        return None
-
-df = load_data()
-
-if df is None:
+# 2. 데이터 로드 (공통 모듈에서 캐싱)
+try:
+    timer.begin("load")
+    df = load_country_mbti()
+    timer.end()
+except FileNotFoundError:
     st.error("🚨 'countriesMBTI_16types.csv' 파일을 찾을 수 없습니다. 같은 폴더에 파일을 넣어주세요.")
     st.stop()
 
@@ -37,59 +43,27 @@ with st.sidebar:
     selected_mbti = st.selectbox("분석할 MBTI 유형을 선택하세요:", mbti_options)
     st.info(f"현재 선택된 유형: **{selected_mbti}**")
 
-# 4. 데이터 필터링 및 정렬 로직
-# 상위 10개국 (비율이 높은 순)
-# Plotly bar(h)는 데이터프레임의 순서대로 아래->위로 그립니다.
-# 따라서 가장 높은 값이 그래프 상단에 오게 하려면, 값을 오름차순 정렬해야 합니다.
-top_10 = df.nlargest(10, selected_mbti).sort_values(by=selected_mbti, ascending=True)
-
-# 하위 10개국 (비율이 낮은 순)
-# 가장 낮은 값이 그래프 상단에 오게 하려면, 값을 내림차순 정렬해야 합니다.
-bottom_10 = df.nsmallest(10, selected_mbti).sort_values(by=selected_mbti, ascending=False)
-
-
-# 5. 시각화 (Plotly Express)
-
-# [그래프 1] Top 10 막대 그래프
-fig_top = px.bar(
-    top_10,
-    x=selected_mbti,
-    y='Country',
-    orientation='h',
-    title=f"🏆 {selected_mbti} 비율이 가장 높은 나라 Top 10",
-    text_auto='.3%',  # 막대 끝에 퍼센트 표시
-    color=selected_mbti, # 값에 따라 색상 진하기 변경
-    color_continuous_scale='Blues'
-)
-fig_top.update_layout(xaxis_title="비율", yaxis_title="국가", height=500)
-fig_top.update_traces(textposition='outside') # 텍스트를 막대 바깥으로
-
-
-# [그래프 2] Bottom 10 막대 그래프 (인터랙티브)
-fig_bottom = px.bar(
-    bottom_10,
-    x=selected_mbti,
-    y='Country',
-    orientation='h',
-    title=f"📉 {selected_mbti} 비율이 가장 낮은 나라 Bottom 10",
-    text_auto='.3%',
-    color=selected_mbti,
-    color_continuous_scale='Reds' # 하위권은 붉은색 계열
-)
-fig_bottom.update_layout(xaxis_title="비율", yaxis_title="국가", height=500)
-fig_bottom.update_traces(textposition='outside')
+# 4~5. 데이터 필터링·정렬 및 시각화 (Plotly Express)
+# 그래프 코드는 mbti_core/charts.py에 있고, 같은 유형의 그래프는 캐시에서 재사용합니다.
+timer.begin("figure")
+fig_top = page_figure(PAGE, "top", selected_mbti)
+fig_bottom = page_figure(PAGE, "bottom", selected_mbti)
+timer.end()
 
 
 # 6. 화면 레이아웃 배치
 col1, col2 = st.columns(2)
 
-with col1:
+with col1, span(PAGE, "render"):
     st.plotly_chart(fig_top, use_container_width=True)
 
 with col2:
+    timer.begin("render")
     st.plotly_chart(fig_bottom, use_container_width=True)
+    timer.end()
     st.caption("※ 그래프 위에 마우스를 올리면 확대/축소 및 상세 정보를 볼 수 있습니다.")
 
 # 데이터 미리보기
 with st.expander("📋 전체 데이터 보기"):
-    st.dataframe(df)
+    # 한 쪽(50행)씩만 보냄, 정렬·검색은 서버에서 (mbti_core/table.py)
+    paged_table(PAGE, "country_mbti", key="country_table", hide_index=True)
@@ -1,7 +1,19 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+
+from mbti_core.country import bottom_countries, top_countries
+from mbti_core.data import load_country_matrix
+from mbti_core.charts import page_figure
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "09_country_plotly_claude"
+timer = PhaseTimer(PAGE)
 
 # 페이지 설정
 st.set_page_config(
@@ -15,15 +27,12 @@ st.title("🌍 국가별 MBTI 유형 분포 분석")
 st.markdown("---")
 
 # 데이터 로드
-@st.cache_data
-def load_data():
-    df = pd.read_csv('countriesMBTI_16types.csv')
-    return df
-
-df = load_data()
+timer.begin("load")
+matrix = load_country_matrix()
+timer.end()
 
 # MBTI 유형 목록 (Country 컬럼 제외)
-mbti_types = df.columns[1:].tolist()
+mbti_types = list(matrix.types)
 
 # MBTI 유형별 설명
 mbti_descriptions = {
@@ -56,130 +65,77 @@ selected_mbti = st.sidebar.selectbox(
 # 선택된 MBTI에 대한 설명
 st.sidebar.info(f"**{selected_mbti}**\n\n{mbti_descriptions.get(selected_mbti, '')}")
 
+# 상위 / 하위 10개 국가 (행렬에서 한 번만 계산해서 통계·그래프·표에 같이 사용)
+timer.begin("compute")
+top_10_display = top_countries(selected_mbti, 10)
+bottom_10_display = bottom_countries(selected_mbti, 10)
+timer.end()
+
 # 통계 정보
 col1, col2, col3 = st.columns(3)
 with col1:
-    avg_value = df[selected_mbti].mean()
+    avg_value = matrix.column(selected_mbti).mean()
     st.metric("전 세계 평균 비율", f"{avg_value:.2%}")
 with col2:
-    max_country = df.loc[df[selected_mbti].idxmax(), 'Country']
-    max_value = df[selected_mbti].max()
+    max_country, max_value = top_10_display.iloc[0]
     st.metric("최고 비율 국가", max_country, f"{max_value:.2%}")
 with col3:
-    min_country = df.loc[df[selected_mbti].idxmin(), 'Country']
-    min_value = df[selected_mbti].min()
+    min_country, min_value = bottom_10_display.iloc[0]
     st.metric("최저 비율 국가", min_country, f"{min_value:.2%}")
 
 st.markdown("---")
 
-# 상위 10개 국가 데이터
-top_10 = df.nlargest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-top_10['Rank'] = range(1, 11)
-top_10 = top_10.sort_values(selected_mbti, ascending=True)  # Plotly 가로 막대를 위해 오름차순
-
 # 상위 10개 국가 그래프
 st.subheader(f"📊 {selected_mbti} 비율이 가장 높은 10개 국가")
 
-fig_top = px.bar(
-    top_10,
-    x=selected_mbti,
-    y='Country',
-    orientation='h',
-    title=f'{selected_mbti} 비율 상위 10개 국가',
-    labels={selected_mbti: f'{selected_mbti} 비율', 'Country': '국가'},
-    color=selected_mbti,
-    color_continuous_scale='Blues',
-    hover_data={
-        'Rank': True,
-        'Country': True,
-        selected_mbti: ':.2%'
-    }
-)
-
-fig_top.update_layout(
-    height=500,
-    showlegend=False,
-    xaxis_title=f'{selected_mbti} 비율',
-    yaxis_title='국가',
-    xaxis_tickformat='.0%',
-    hovermode='closest',
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-)
-
-fig_top.update_traces(
-    hovertemplate='<b>%{y}</b><br>비율: %{x:.2%}<extra></extra>'
-)
+# (그래프 코드는 mbti_core/charts.py, 같은 유형의 그래프는 캐시에서 재사용)
+timer.begin("figure")
+fig_top = page_figure(PAGE, "top", selected_mbti)
+timer.end()
 
+timer.begin("render")
 st.plotly_chart(fig_top, use_container_width=True)
+timer.end()
 
 st.markdown("---")
 
-# 하위 10개 국가 데이터
-bottom_10 = df.nsmallest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-bottom_10['Rank'] = range(1, 11)
-bottom_10 = bottom_10.sort_values(selected_mbti, ascending=True)  # Plotly 가로 막대를 위해 오름차순
 
 # 하위 10개 국가 그래프 (인터랙티브)
 st.subheader(f"📉 {selected_mbti} 비율이 가장 낮은 10개 국가")
 
-fig_bottom = px.bar(
-    bottom_10,
-    x=selected_mbti,
-    y='Country',
-    orientation='h',
-    title=f'{selected_mbti} 비율 하위 10개 국가 (인터랙티브)',
-    labels={selected_mbti: f'{selected_mbti} 비율', 'Country': '국가'},
-    color=selected_mbti,
-    color_continuous_scale='Oranges',
-    hover_data={
-        'Rank': True,
-        'Country': True,
-        selected_mbti: ':.2%'
-    }
-)
-
-fig_bottom.update_layout(
-    height=500,
-    showlegend=False,
-    xaxis_title=f'{selected_mbti} 비율',
-    yaxis_title='국가',
-    xaxis_tickformat='.0%',
-    hovermode='closest',
-    plot_bgcolor='rgba(0,0,0,0)',
-    paper_bgcolor='rgba(0,0,0,0)',
-)
-
-fig_bottom.update_traces(
-    hovertemplate='<b>%{y}</b><br>비율: %{x:.2%}<extra></extra>'
-)
+timer.begin("figure")
+fig_bottom = page_figure(PAGE, "bottom", selected_mbti)
+timer.end()
 
+timer.begin("render")
 st.plotly_chart(fig_bottom, use_container_width=True)
+timer.end()
 
 # 데이터 테이블 (옵션)
 with st.expander("📋 상세 데이터 보기"):
     col1, col2 = st.columns(2)
     
-    # 다시 내림차순으로 정렬하여 표시
-    top_10_display = df.nlargest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-    top_10_display.index = range(1, 11)
-    
-    bottom_10_display = df.nsmallest(10, selected_mbti)[['Country', selected_mbti]].reset_index(drop=True)
-    bottom_10_display.index = range(1, 11)
+    # 위에서 계산한 내림차순/오름차순 표를 1부터 번호 매겨 표시
+    top_10_display = top_10_display.set_axis(range(1, len(top_10_display) + 1))
+    bottom_10_display = bottom_10_display.set_axis(range(1, len(bottom_10_display) + 1))
     
     with col1:
         st.markdown("**상위 10개 국가**")
+        timer.begin("render")
         st.dataframe(
             top_10_display.style.format({selected_mbti: '{:.2%}'}),
             use_container_width=True
         )
+        timer.end()
     
     with col2:
         st.markdown("**하위 10개 국가**")
+        timer.begin("render")
         st.dataframe(
             bottom_10_display.style.format({selected_mbti: '{:.2%}'}),
             use_container_width=True
         )
+        timer.end()
 
 # 푸터
 st.markdown("---")
@@ -1,6 +1,21 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
+
+from mbti_core.charts import page_figure
+from mbti_core.data import load_language_popularity
+from mbti_core.language import language_stats
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.recommender import top_languages
+from mbti_core.registry import recommendations
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "10_lang_chatgpt"
+timer = PhaseTimer(PAGE)
 
 # =========================
 # 기본 세팅
@@ -12,20 +27,12 @@ st.set_page_config(
 )
 
 # =========================
-# 데이터 불러오기 (pandas)
+# 데이터 불러오기 (공통 모듈, 날짜 변환·정렬 포함)
 # =========================
-CSV_PATH = "Popularity_of_Programming_Languages_from_2004_to_2024.csv"
-
-@st.cache_data
-def load_language_popularity(path: str):
-    df = pd.read_csv(path)
-    # 'July 2004' 같은 형식 → datetime
-    df["Date"] = pd.to_datetime(df["Date"], format="%B %Y")
-    df = df.sort_values("Date")
-    return df
-
 try:
-    popularity_df = load_language_popularity(CSV_PATH)
+    timer.begin("load")
+    popularity_df = load_language_popularity()
+    timer.end()
     data_loaded = True
 except Exception as e:
     popularity_df = None
@@ -33,154 +40,9 @@ except Exception as e:
     st.error(f"언어 인기 데이터(CSV)를 불러오는 중 오류가 발생했어요 😢\n\n에러: {e}")
 
 # =========================
-# MBTI → 언어 매핑 (이전 버전 + 약간 리팩토링)
+# MBTI → 언어 매핑 (mbti_core/recommendations.json, 카드 HTML·CSV 컬럼 이름까지 미리 계산됨)
 # =========================
-mbti_to_language = {
-    "INTJ": {
-        "display": "Rust 🦀",
-        "col": "Rust",
-        "tagline": "완벽주의 전략가에게 어울리는 안정성과 성능!",
-        "reason": [
-            "메모리 안전성, 고성능 등 '깔끔한 설계'를 좋아하는 타입과 잘 맞아요.",
-            "복잡한 시스템을 설계하고 최적화하는 데 큰 재미를 느낄 수 있어요.",
-        ],
-    },
-    "INTP": {
-        "display": "Haskell 🧠",
-        "col": "Haskell",
-        "tagline": "개념 덕후 논리왕에게 어울리는 함수형 언어!",
-        "reason": [
-            "수학적 사고, 추상화, 우아한 코드에 매력을 느끼는 타입에게 찰떡.",
-            "현실보다는 개념과 구조를 탐구하는 걸 좋아한다면 잘 맞는 언어예요.",
-        ],
-    },
-    "ENTJ": {
-        "display": "Java ☕",
-        "col": "Java",
-        "tagline": "리더십 있는 기획·관리형에게 어울리는 산업 표준 언어!",
-        "reason": [
-            "대규모 서비스, 기업용 시스템 등 '현실에서 강한' 언어.",
-            "팀 프로젝트, 아키텍처 설계, 역할 분담이 중요한 환경과 잘 맞아요.",
-        ],
-    },
-    "ENTP": {
-        "display": "JavaScript ⚡",
-        "col": "JavaScript",
-        "tagline": "아이디어 폭발, 실험 정신 가득한 타입에게 어울리는 웹의 언어!",
-        "reason": [
-            "프론트엔드부터 백엔드까지, 브라우저만 있으면 뭐든 실험 가능.",
-            "새로운 프레임워크와 기술을 만지는 걸 좋아한다면 최고의 놀이터!",
-        ],
-    },
-    "INFJ": {
-        "display": "Python 🐍",
-        "col": "Python",
-        "tagline": "사람과 세상을 돕고 싶은 이상주의자에게 어울리는 친절한 언어!",
-        "reason": [
-            "문법이 직관적이라, 문제 해결 아이디어에 집중하기 좋아요.",
-            "데이터 분석, AI, 교육용 등 '사람에게 도움 되는 분야'에 강점.",
-        ],
-    },
-    "INFP": {
-        "display": "Python 🐍",
-        "col": "Python",
-        "tagline": "감성 넘치는 크리에이터에게 어울리는 따뜻한 첫 언어!",
-        "reason": [
-            "간단한 문법으로 나만의 앱, 봇, 도구를 금방 만들 수 있어요.",
-            "자유로운 실험과 취미 프로젝트에 딱 맞는 분위기의 언어예요.",
-        ],
-    },
-    "ENFJ": {
-        "display": "Kotlin 💜",
-        "col": "Kotlin",
-        "tagline": "함께 성장하고 싶은 리더형에게 어울리는 모던 안드로이드 언어!",
-        "reason": [
-            "안드로이드 앱 개발의 핵심 언어로, 사람들에게 직접 가치를 줄 수 있어요.",
-            "깔끔한 문법으로 팀 협업과 코드 리뷰에도 강점이 있어요.",
-        ],
-    },
-    "ENFP": {
-        "display": "JavaScript 🌈",
-        "col": "JavaScript",
-        "tagline": "아이디어 부자, 즉흥적인 실험러에게 딱 맞는 웹 언어!",
-        "reason": [
-            "웹 페이지, 게임, 인터랙티브 아트 등 무엇이든 빠르게 만들어볼 수 있어요.",
-            "결과가 바로 브라우저에 보이니 동기부여도 💯.",
-        ],
-    },
-    "ISTJ": {
-        "display": "C 🧱",
-        "col": "C/C++",  # 데이터는 'C/C++' 컬럼으로 들어있음
-        "tagline": "원칙과 구조를 중시하는 관리자형에게 어울리는 기본기 끝판왕!",
-        "reason": [
-            "운영체제, 임베디드 등 컴퓨터의 바닥부터 이해할 수 있어요.",
-            "탄탄한 기본기를 쌓고 싶은 타입에게 최고의 훈련 언어.",
-        ],
-    },
-    "ISFJ": {
-        "display": "Python 🤝",
-        "col": "Python",
-        "tagline": "성실하고 배려 깊은 조력자형에게 어울리는 안정적인 언어!",
-        "reason": [
-            "교육, 자동화 스크립트, 실무 보조 도구 등에 잘 쓰이는 실용적인 언어예요.",
-            "팀에서 '묵묵히 잘 돌아가게 만드는 사람'이 되고 싶다면 추천!",
-        ],
-    },
-    "ESTJ": {
-        "display": "C# 🏗️",
-        "col": "C#",
-        "tagline": "체계적인 조직가형에게 어울리는 윈도우·게임·백엔드 만능 언어!",
-        "reason": [
-            "엔터프라이즈 개발, 데스크톱, 게임(유니티) 등 현업에서 강력.",
-            "도구와 프레임워크가 잘 정리되어 있어 관리형 성향과 잘 맞아요.",
-        ],
-    },
-    "ESFJ": {
-        "display": "TypeScript 🤗",
-        "col": "TypeScript",
-        "tagline": "협업과 커뮤니케이션을 중시하는 타입에게 어울리는 안전한 JS!",
-        "reason": [
-            "팀 프로젝트에서 실수 줄이고, 읽기 쉬운 코드를 쓰는 데 큰 도움.",
-            "프론트엔드 협업 환경에서 빛나는 언어예요.",
-        ],
-    },
-    "ISTP": {
-        "display": "C++ 🛠️",
-        "col": "C/C++",  # 동일 컬럼 사용
-        "tagline": "손으로 만지고 튜닝하는 걸 좋아하는 장인형에게 어울리는 언어!",
-        "reason": [
-            "게임 엔진, 고성능 앱, 하드웨어 가까운 영역에 강해요.",
-            "최적화와 성능 튜닝에서 '직접 만지는 손맛'을 느낄 수 있어요.",
-        ],
-    },
-    "ISFP": {
-        "display": "Swift 🎨",
-        "col": "Swift",
-        "tagline": "감성적인 아티스트형에게 어울리는 iOS·macOS 앱 언어!",
-        "reason": [
-            "디자인 감성을 살린 iOS 앱을 만드는 데 최적.",
-            "Apple 생태계에서 깔끔하고 예쁜 결과물을 만들 수 있어요.",
-        ],
-    },
-    "ESTP": {
-        "display": "Go 🚀",
-        "col": "Go",
-        "tagline": "직설적이고 실행력 강한 타입에게 어울리는 단순·고속 언어!",
-        "reason": [
-            "문법이 단순해서 바로 서버 만들고 성능 테스트 해볼 수 있어요.",
-            "클라우드·백엔드·인프라 쪽에서 특히 강력한 언어예요.",
-        ],
-    },
-    "ESFP": {
-        "display": "JavaScript 🎉",
-        "col": "JavaScript",
-        "tagline": "무대 체질 엔터테이너형에게 어울리는 화려한 인터랙션 언어!",
-        "reason": [
-            "애니메이션, 이펙트, 인터랙티브 웹 등 즐거운 결과물 위주로 배우기 좋아요.",
-            "사람들 반응을 바로 볼 수 있어 즐겁게 개발할 수 있어요.",
-        ],
-    },
-}
+mbti_to_language = recommendations("chatgpt_trend")
 
 language_summary = [
     {
@@ -307,21 +169,7 @@ st.divider()
 info = mbti_to_language[selected_mbti]
 
 st.markdown(f"### 🎯 {selected_mbti} 타입에게 어울리는 언어는 바로…")
-st.markdown(
-    f"""
-    <div style="
-        border-radius: 16px;
-        padding: 16px 20px;
-        background: linear-gradient(135deg, #111827, #1f2937);
-        color: white;
-        margin-bottom: 10px;
-    ">
-        <h2 style="margin:0; font-size: 1.6rem;">🏆 {info['display']}</h2>
-        <p style="margin-top:4px; color:#e5e7eb;">{info['tagline']}</p>
-    </div>
-    """,
-    unsafe_allow_html=True,
-)
+st.markdown(info["card_html"], unsafe_allow_html=True)
 
 st.markdown("#### 💡 왜 이 언어가 잘 맞을까요?")
 for r in info["reason"]:
@@ -329,6 +177,28 @@ for r in info["reason"]:
 
 st.caption("※ MBTI는 재미로 보는 가이드일 뿐, 어떤 언어든 충분히 잘할 수 있어요 😉")
 
+# 궁합 + 현재 인기도 + 최근 성장세를 합친 점수 순위 (mbti_core/recommender.py, 미리 계산된 점수표에서 꺼내 옴)
+if data_loaded:
+    st.markdown("#### 🏅 데이터로 본 추천 순위 Top 5")
+    timer.begin("compute")
+    ranked = top_languages(selected_mbti, k=5)
+    timer.end()
+    timer.begin("render")
+    st.dataframe(
+        ranked[["rank", "language", "score", "affinity", "popularity", "growth"]],
+        column_config={
+            "rank": "순위",
+            "language": "언어",
+            "score": st.column_config.ProgressColumn("추천 점수", format="%.2f", min_value=-1, max_value=1),
+            "affinity": st.column_config.NumberColumn("성향 궁합", format="%.2f"),
+            "popularity": st.column_config.NumberColumn("현재 인기", format="%.2f"),
+            "growth": st.column_config.NumberColumn("최근 5년 성장", format="%+.2f"),
+        },
+        hide_index=True,
+        use_container_width=True,
+    )
+    timer.end()
+
 st.divider()
 
 # =========================
@@ -337,26 +207,23 @@ st.divider()
 st.markdown("## 📈 추천 언어의 실제 인기 추이 (2004~2024)")
 
 if data_loaded:
-    lang_col = info["col"]
-    if lang_col not in popularity_df.columns:
+    lang_col = info["column"]  # CSV에 없는 언어면 None
+    if lang_col is None:
         st.warning(
-            f"🙇‍♂️ 죄송! 현재 CSV 데이터에 **{lang_col}** 컬럼이 없어서 그래프를 그릴 수 없어요."
+            f"🙇‍♂️ 죄송! 현재 CSV 데이터에 **{info['col']}** 컬럼이 없어서 그래프를 그릴 수 없어요."
         )
     else:
+        timer.begin("compute")
         df_lang = popularity_df[["Date", lang_col]].dropna()
 
-        # 요약 정보 계산
-        latest_row = df_lang.iloc[-1]
-        latest_date = latest_row["Date"]
-        latest_value = latest_row[lang_col]
-
-        peak_idx = df_lang[lang_col].idxmax()
-        peak_row = df_lang.loc[peak_idx]
-        peak_date = peak_row["Date"]
-        peak_value = peak_row[lang_col]
-
-        start_value = df_lang.iloc[0][lang_col]
-        change = latest_value - start_value
+        # 요약 정보 (mbti_core/language.py에서 모든 언어를 한 번에 계산해 둔 값)
+        stats = language_stats(lang_col)
+        latest_date = df_lang["Date"].iloc[-1]
+        latest_value = stats["current"]
+        peak_date = stats["peak_date"]
+        peak_value = stats["max"]
+        change = stats["change"]
+        timer.end()
 
         c1, c2, c3 = st.columns(3)
         with c1:
@@ -378,19 +245,15 @@ if data_loaded:
                 help="첫 데이터 시점과 비교한 변화량",
             )
 
-        # Plotly 라인 그래프
-        fig = px.line(
-            df_lang,
-            x="Date",
-            y=lang_col,
-            title=f"{info['display']} 인기 추이",
-            labels={"Date": "연도", lang_col: "인기 지수(%)"},
-        )
-        fig.update_layout(
-            hovermode="x unified",
-        )
+        # Plotly 라인 그래프 (mbti_core/charts.py, 언어마다 한 번만 만들어 캐시)
+        st.markdown(f"##### {info['display']} 인기 추이")
+        timer.begin("figure")
+        fig = page_figure(PAGE, "trend", lang_col)
+        timer.end()
 
+        timer.begin("render")
         st.plotly_chart(fig, use_container_width=True)
+        timer.end()
 
         st.caption(
             "※ 데이터는 제공된 CSV 기준이며, 값은 상대적인 **인기 지수(%)**로 보면 돼요."
@@ -406,11 +269,13 @@ st.divider()
 st.markdown("## 📚 다른 프로그래밍 언어 한눈에 보기")
 st.markdown("주니어 프로그래머용 **언어 분위기·난이도 요약 테이블**이에요:")
 
+timer.begin("render")
 st.dataframe(
     language_summary,
     use_container_width=True,
     hide_index=True,
 )
+timer.end()
 
 st.markdown(
     """
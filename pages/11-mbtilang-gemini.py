@@ -1,6 +1,21 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+
+from mbti_core.charts import page_figure
+from mbti_core.language import language_summary
+from mbti_core.metrics import PhaseTimer, span
+from mbti_core.popularity import latest_date, year_bounds
+from mbti_core.profiling import profile_page
+from mbti_core.registry import recommendations
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "11_lang_gemini"
+timer = PhaseTimer(PAGE)
 
 # -----------------------------------------------------------------------------
 # 1. 페이지 설정 및 디자인
@@ -18,19 +33,12 @@ st.markdown("""
 st.divider()
 
 # -----------------------------------------------------------------------------
-# 2. 데이터 로드 (Pandas)
+# 2. 데이터 로드 (공통 모듈 mbti_core/popularity.py, 여기서는 기간 슬라이더의 첫 해·마지막 해만 씀)
 # -----------------------------------------------------------------------------
-@st.cache_data
-def load_data():
-    # CSV 파일이 현재 폴더에 있다고 가정
-    file_path = 'Popularity_of_Programming_Languages_from_2004_to_2024.csv'
-    df = pd.read_csv(file_path)
-    # 날짜 컬럼을 datetime 형식으로 변환
-    df['Date'] = pd.to_datetime(df['Date'])
-    return df
-
 try:
-    df = load_data()
+    timer.begin("load")
+    first_year, last_year = year_bounds()
+    timer.end()
 except FileNotFoundError:
     st.error("⚠️ CSV 파일을 찾을 수 없습니다. 'Popularity_of_Programming_Languages_from_2004_to_2024.csv' 파일을 같은 폴더에 넣어주세요.")
     st.stop()
@@ -38,32 +46,8 @@ except FileNotFoundError:
 # -----------------------------------------------------------------------------
 # 3. MBTI와 언어 매핑 로직
 # -----------------------------------------------------------------------------
-# CSV의 컬럼명과 정확히 일치해야 그래프가 그려집니다.
-mbti_mapping = {
-    # 분석가형
-    "INTJ": {"lang": "Rust", "desc": "치밀한 설계와 안정성을 사랑하는 전략가! 🏗️", "trait": "시스템 프로그래밍, 고성능"},
-    "INTP": {"lang": "Python", "desc": "논리적이고 호기심 많은 사색가! 🐍", "trait": "데이터 사이언스, AI, 백엔드"},
-    "ENTJ": {"lang": "C/C++", "desc": "효율성을 극대화하는 대담한 통솔자! ⚡", "trait": "게임 엔진, 임베디드, 고성능 컴퓨팅"},
-    "ENTP": {"lang": "JavaScript", "desc": "새로운 가능성을 탐구하는 발명가! 🌐", "trait": "웹 프론트엔드/백엔드, 풀스택"},
-    
-    # 외교관형
-    "INFJ": {"lang": "Java", "desc": "사람을 돕는 깊은 통찰력의 옹호자! ☕", "trait": "대규모 엔터프라이즈 시스템, 안드로이드"},
-    "INFP": {"lang": "Kotlin", "desc": "우아하고 간결한 코드를 꿈꾸는 중재자! 🎨", "trait": "모던 안드로이드 앱, 간결한 문법"},
-    "ENFJ": {"lang": "Swift", "desc": "사용자 경험을 중요시하는 정의로운 사회운동가! 🍎", "trait": "iOS 앱 개발, 애플 생태계"},
-    "ENFP": {"lang": "Ruby", "desc": "자유롭고 창의적인 활동가! 💎", "trait": "웹 개발(Rails), 빠른 프로토타이핑"},
-    
-    # 관리자형
-    "ISTJ": {"lang": "C#", "desc": "사실에 근거하여 사고하는 현실주의자! 🎯", "trait": "윈도우 앱, 유니티 게임 개발"},
-    "ISFJ": {"lang": "PHP", "desc": "꾸준하고 성실하게 웹을 지키는 수호자! 🐘", "trait": "웹 서버, 워드프레스"},
-    "ESTJ": {"lang": "Go", "desc": "직설적이고 효율적인 사업가! 🐹", "trait": "클라우드 시스템, 마이크로서비스"},
-    "ESFJ": {"lang": "TypeScript", "desc": "협력을 중요시하며 실수를 방지하는 친선도모형! 🛡️", "trait": "대규모 웹 프로젝트, 안정성"},
-    
-    # 탐험가형
-    "ISTP": {"lang": "C/C++", "desc": "도구를 능숙하게 다루는 만능 재주꾼! 🛠️", "trait": "하드웨어 제어, 성능 최적화"},
-    "ISFP": {"lang": "Dart", "desc": "예술적 감각이 뛰어난 모험가! 🎯", "trait": "플러터(Flutter) 크로스 플랫폼 앱"},
-    "ESTP": {"lang": "R", "desc": "데이터를 통해 문제를 해결하는 사업가! 📊", "trait": "통계 분석, 데이터 시각화"},
-    "ESFP": {"lang": "Visual Basic", "desc": "즉각적인 결과와 실용성을 추구하는 연예인! 🎬", "trait": "오피스 자동화, 레거시 시스템"}
-}
+# mbti_core/recommendations.json에서 한 번만 읽어 옴 ("column"은 미리 찾아 둔 CSV 컬럼 이름, 없으면 None)
+mbti_mapping = recommendations("gemini_trend")
 
 # -----------------------------------------------------------------------------
 # 4. 사용자 입력 (사이드바)
@@ -95,19 +79,18 @@ if selected_mbti:
         
     with col2:
         # 5-2. Plotly 그래프 (선택된 언어의 인기도 변화)
-        st.markdown(f"#### 📈 {lang_name} 인기도 변화 (2004-2024)")
+        st.markdown(f"#### 📈 {lang_name} 인기도 변화 ({first_year}-{last_year})")
         
         # 데이터에 해당 언어 컬럼이 있는지 확인
-        if lang_name in df.columns:
-            fig = px.line(
-                df, 
-                x='Date', 
-                y=lang_name,
-                labels={'value': 'Popularity (%)', 'Date': 'Year'},
-                template="plotly_white"
-            )
-            fig.update_traces(line_color='#FF4B4B', line_width=3) # 스트림릿 색상 테마
+        if result["column"] is not None:
+            years = st.slider("📅 기간", first_year, last_year, (first_year, last_year), key="trend_years")
+            # 같은 언어를 추천받는 MBTI끼리는 캐시된 그래프를 같이 사용 (그래프 코드는 mbti_core/charts.py)
+            timer.begin("figure")
+            fig = page_figure(PAGE, "trend", result["column"], years)
+            timer.end()
+            timer.begin("render")
             st.plotly_chart(fig, use_container_width=True)
+            timer.end()
         else:
             st.warning(f"데이터셋에 {lang_name}에 대한 정보가 부족합니다.")
 
@@ -118,30 +101,28 @@ if selected_mbti:
     # -----------------------------------------------------------------------------
     st.subheader("📊 현재 프로그래밍 언어 트렌드 요약")
     
-    # 가장 최신 날짜의 데이터만 추출
-    latest_date = df['Date'].max()
-    latest_data = df[df['Date'] == latest_date].iloc[0]
-    
-    # 시리즈를 데이터프레임으로 변환하고 정렬
+    timer.begin("compute")
+    # 가장 최신 날짜 (날짜순으로 정렬된 인덱스의 마지막 값, mbti_core/popularity.py)
+    latest = latest_date()
+
+    # 최신 인기도 순위 (mbti_core/language.py에서 현재 인기도 높은 순으로 미리 계산됨)
+    summary = language_summary()
     summary_df = pd.DataFrame({
-        'Language': latest_data.index[1:], # Date 제외
-        'Popularity (%)': latest_data.values[1:]
+        'Language': summary['language'],
+        'Popularity (%)': summary['current'],
     })
-    
-    # 인기도 순으로 정렬 (내림차순)
-    summary_df['Popularity (%)'] = pd.to_numeric(summary_df['Popularity (%)'])
-    summary_df = summary_df.sort_values(by='Popularity (%)', ascending=False).reset_index(drop=True)
+    timer.end()
     
     # 상위 5개만 강조, 나머지는 스크롤 가능한 데이터프레임으로
     top_col, table_col = st.columns([1, 2])
     
     with top_col:
-        st.markdown(f"**📅 기준: {latest_date.strftime('%Y년 %m월')}**")
+        st.markdown(f"**📅 기준: {latest.strftime('%Y년 %m월')}**")
         st.write("🔥 **Top 3 Languages**")
         for i in range(3):
             st.write(f"{i+1}. **{summary_df.iloc[i]['Language']}** ({summary_df.iloc[i]['Popularity (%)']}%)")
             
-    with table_col:
+    with table_col, span(PAGE, "render"):
         st.dataframe(
             summary_df, 
             column_config={
@@ -0,0 +1,163 @@
+import streamlit as st
+import pandas as pd
+
+from mbti_core.metrics import PhaseTimer
+from mbti_core.profiling import profile_page
+from mbti_core.reports import build_report_zip
+from mbti_core.roster import CHUNK_ROWS, language_counts, read_roster, recommend_chunk
+from mbti_core.warmup import start_warmup
+
+start_warmup()
+# 주소에 ?profile=1 을 붙이면 이 실행을 cProfile로 측정 (mbti_core/profiling.py)
+profile_page(__file__)
+
+# 단계별 실행 시간 기록용 이름 (mbti_core/metrics.py)
+PAGE = "13_roster_batch"
+timer = PhaseTimer(PAGE)
+
+st.set_page_config(
+    page_title="학급 명단으로 한 번에 추천",
+    page_icon="🏫",
+    layout="wide"
+)
+
+st.title("🏫 우리 반 전체 언어 추천")
+st.markdown(
+    "학생을 한 명씩 고르지 말고, **이름과 MBTI가 적힌 명단 CSV**를 올리면 "
+    "반 전체의 추천 언어를 한 번에 만들어 드려요. 결과는 CSV로 받을 수 있어요."
+)
+
+# 어느 페이지의 추천을 쓸지 (mbti_core/recommendations.json의 variant)
+VARIANTS = {
+    "💻 ChatGPT 버전 (1번 페이지)": "chatgpt",
+    "🎯 Claude 버전 (2번 페이지)": "claude",
+    "💎 Gemini 버전 (3번 페이지)": "gemini",
+}
+
+SAMPLE_ROSTER = "이름,MBTI\n김코딩,INTJ\n이파이,ENFP\n박자바,ISTJ\n최러스트,intj\n"
+
+col1, col2 = st.columns([2, 1])
+with col1:
+    uploaded = st.file_uploader("명단 CSV 올리기 (이름, MBTI)", type="csv")
+with col2:
+    variant_label = st.selectbox("추천 기준", list(VARIANTS))
+    st.download_button(
+        "📄 예시 명단 받기",
+        data=SAMPLE_ROSTER.encode("utf-8-sig"),
+        file_name="roster_example.csv",
+        mime="text/csv",
+    )
+
+if uploaded is None:
+    st.info("👆 명단 파일을 올리면 결과가 여기에 나와요.")
+    st.stop()
+
+variant = VARIANTS[variant_label]
+
+# 같은 파일·같은 기준이면 다시 실행될 때(다운로드 버튼 등) 다시 계산하지 않음
+key = (uploaded.file_id, variant)
+if st.session_state.get("roster_key") != key:
+    progress = st.progress(0.0, text="명단을 읽는 중…")
+    parts = []
+    try:
+        timer.begin("compute")
+        for chunk in read_roster(uploaded):
+            parts.append(recommend_chunk(chunk, variant))
+            done = min(uploaded.tell() / max(uploaded.size, 1), 1.0)
+            progress.progress(done, text=f"{sum(len(p) for p in parts):,}명 처리 중…")
+        timer.end()
+    except (ValueError, pd.errors.ParserError) as e:
+        progress.empty()
+        st.error(f"명단 파일을 읽지 못했어요 😢\n\n에러: {e}")
+        st.stop()
+    progress.empty()
+
+    result = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=["name", "mbti", "language", "column"])
+    st.session_state["roster_key"] = key
+    st.session_state["roster_result"] = result
+
+result = st.session_state["roster_result"]
+unknown = result["language"].isna()
+
+c1, c2, c3 = st.columns(3)
+c1.metric("👩‍🎓 학생 수", f"{len(result):,}명")
+c2.metric("💻 추천된 언어 종류", f"{result['language'].nunique()}개")
+c3.metric("❓ MBTI를 알 수 없는 학생", f"{int(unknown.sum()):,}명")
+
+if unknown.any():
+    st.warning("MBTI가 16가지 유형이 아닌 학생은 추천 언어가 비어 있어요. 명단을 확인해 주세요.")
+
+st.download_button(
+    "📥 추천 결과 CSV 받기",
+    data=result.rename(columns={"name": "이름", "mbti": "MBTI", "language": "추천 언어", "column": "인기도 데이터 컬럼"})
+    .to_csv(index=False)
+    .encode("utf-8-sig"),  # 엑셀에서 한글이 깨지지 않도록
+    file_name="roster_recommendations.csv",
+    mime="text/csv",
+)
+
+st.divider()
+
+left, right = st.columns([1, 1])
+with left:
+    st.subheader("📊 우리 반 추천 언어 분포")
+    timer.begin("compute")
+    counts = language_counts(result)
+    timer.end()
+    timer.begin("figure")
+    # 업로드한 명단마다 다른 그래프라 캐시하지 않음 → plotly.express는 여기까지 왔을 때만 불러옴
+    import plotly.express as px
+
+    fig = px.bar(
+        counts,
+        x="students",
+        y="language",
+        orientation="h",
+        labels={"students": "학생 수", "language": "추천 언어"},
+        text="students",
+    )
+    fig.update_layout(yaxis={"categoryorder": "total ascending"}, height=max(300, 40 * len(counts)))
+    timer.end()
+    timer.begin("render")
+    st.plotly_chart(fig, use_container_width=True)
+    timer.end()
+
+with right:
+    st.subheader("👀 결과 미리보기")
+    st.caption(f"처음 100명만 보여줘요. 전체는 CSV로 받아 주세요. (큰 파일은 {CHUNK_ROWS:,}줄씩 나눠 읽어요)")
+    timer.begin("render")
+    st.dataframe(
+        result.head(100),
+        column_config={"name": "이름", "mbti": "MBTI", "language": "추천 언어", "column": None},
+        hide_index=True,
+        use_container_width=True,
+    )
+    timer.end()
+
+st.divider()
+
+# 학생별 상담 보고서 (고른 추천 기준 페이지의 추천 카드 + 추천 언어 20년 그래프, 여러 프로세스로 만듦)
+st.subheader("📦 학생별 상담 보고서 (HTML)")
+st.caption("고른 추천 기준 페이지의 추천 카드와 언어 인기도 그래프를 학생마다 한 장씩 만들어 zip으로 묶어요.")
+
+if st.session_state.get("report_key") != key:
+    if st.button("📝 보고서 만들기"):
+        progress = st.progress(0.0, text="보고서를 만드는 중…")
+        timer.begin("compute")
+        data = build_report_zip(
+            result[["name", "mbti"]],
+            variant,
+            progress=lambda done, total: progress.progress(done / total, text=f"{done:,} / {total:,}명 완료"),
+        )
+        timer.end()
+        progress.empty()
+        st.session_state["report_key"] = key
+        st.session_state["report_zip"] = data
+
+if st.session_state.get("report_key") == key:
+    st.download_button(
+        "📥 보고서 zip 받기",
+        data=st.session_state["report_zip"],
+        file_name="student_reports.zip",
+        mime="application/zip",
+    )
@@ -0,0 +1,18 @@
+import pytest
+
+import mbti_core.data
+import mbti_core.disk_cache
+import mbti_core.paths
+
+
+@pytest.fixture(autouse=True, scope="session")
+def cache_dir(tmp_path_factory):
+    """테스트가 만드는 캐시 파일(.arrow·.npy·results/)을 저장소의 .cache가 아니라 임시 폴더에 쓴다."""
+    path = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as patch:
+        # 하위 프로세스(보고서 작업 프로세스 등)도 같은 폴더를 쓰도록 환경 변수도 바꿈
+        patch.setenv("MBTI_CACHE_DIR", str(path))
+        patch.setattr(mbti_core.paths, "CACHE_DIR", path)
+        patch.setattr(mbti_core.data, "CACHE_DIR", path)
+        patch.setattr(mbti_core.disk_cache, "RESULTS_DIR", path / "results")
+        yield path
@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from mbti_core.cache import shared_resource
+
+
+def test_shared_resource_builds_once_under_concurrent_calls():
+    calls = []
+
+    @shared_resource
+    def build(key):
+        calls.append(key)
+        time.sleep(0.05)
+        return object()
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(build("a"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["a"]
+    assert all(result is results[0] for result in results)
+
+
+def test_shared_resource_caches_per_argument():
+    @shared_resource
+    def build(key):
+        return [key]
+
+    assert build("a") is build("a")
+    assert build("a") is not build("b")
+
+
+def test_shared_resource_does_not_store_exceptions():
+    attempts = []
+
+    @shared_resource
+    def build(key):
+        attempts.append(key)
+        if len(attempts) == 1:
+            raise RuntimeError("first build fails")
+        return key
+
+    with pytest.raises(RuntimeError):
+        build("a")
+    assert build("a") == "a"
+    assert attempts == ["a", "a"]
+
+
+def test_shared_resource_clear():
+    @shared_resource
+    def build(key):
+        return object()
+
+    first = build("a")
+    build.clear()
+    assert build("a") is not first
@@ -0,0 +1,36 @@
+import pandas as pd
+import pytest
+
+from mbti_core.country import bottom_countries, country_rank, top_countries
+from mbti_core.paths import COUNTRY_CSV
+
+BASELINE = pd.read_csv(COUNTRY_CSV)
+TYPES = BASELINE.columns[1:].tolist()
+
+
+@pytest.mark.parametrize("mbti", TYPES)
+@pytest.mark.parametrize("k", [10, len(BASELINE)])
+def test_top_countries_matches_pandas_nlargest(mbti, k):
+    expected = BASELINE.nlargest(k, mbti)
+    result = top_countries(mbti, k)
+    assert result["Country"].tolist() == expected["Country"].tolist()
+    assert result[mbti].to_numpy() == pytest.approx(expected[mbti].to_numpy(), abs=1e-6)
+
+
+@pytest.mark.parametrize("mbti", TYPES)
+@pytest.mark.parametrize("k", [10, len(BASELINE)])
+def test_bottom_countries_matches_pandas_nsmallest(mbti, k):
+    expected = BASELINE.nsmallest(k, mbti)
+    result = bottom_countries(mbti, k)
+    assert result["Country"].tolist() == expected["Country"].tolist()
+    assert result[mbti].to_numpy() == pytest.approx(expected[mbti].to_numpy(), abs=1e-6)
+
+
+def test_country_rank_matches_top_countries():
+    top = top_countries("INFP", 5)["Country"].tolist()
+    assert [country_rank(country, "INFP") for country in top] == [1, 2, 3, 4, 5]
+
+
+def test_country_rank_unknown_country():
+    with pytest.raises(KeyError):
+        country_rank("Atlantis", "INFP")
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import mbti_core.data as data
+from mbti_core.data import _load_columnar, _parse_country_csv, _publish, file_hash, load_country_mbti
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(data, "CACHE_DIR", path)
+    return path
+
+
+@pytest.fixture
+def country_csv(tmp_path):
+    path = tmp_path / "countries.csv"
+    path.write_text("Country,INTJ,ENFP\nA,0.1,0.9\nB,0.30000000000000004,0.7\n")
+    return path
+
+
+def test_file_hash_follows_file_content(country_csv):
+    first = file_hash(country_csv)
+    assert len(first) == 16
+    assert file_hash(country_csv) == first
+
+    country_csv.write_text("Country,INTJ,ENFP\nA,0.2,0.8\n")
+    assert file_hash(country_csv) != first
+
+
+def test_publish_replaces_stale_versions(cache_dir):
+    old = cache_dir / "countries-aaaa.arrow"
+    assert _publish(old, lambda tmp: tmp.write_bytes(b"old"))
+    _publish(cache_dir / "countries-aaaa.values.npy", lambda tmp: tmp.write_bytes(b"old"))
+    _publish(cache_dir / "other-aaaa.arrow", lambda tmp: tmp.write_bytes(b"other"))
+
+    assert _publish(cache_dir / "countries-bbbb.arrow", lambda tmp: tmp.write_bytes(b"new"))
+    # 같은 CSV의 예전 키 파일은 모두 지우고, 다른 CSV 파일과 임시 파일은 남기지 않음
+    assert sorted(p.name for p in cache_dir.iterdir()) == ["countries-bbbb.arrow", "other-aaaa.arrow"]
+    assert (cache_dir / "countries-bbbb.arrow").read_bytes() == b"new"
+
+
+def test_publish_reports_unwritable_cache(tmp_path, monkeypatch):
+    blocker = tmp_path / "file"
+    blocker.write_text("")
+    monkeypatch.setattr(data, "CACHE_DIR", blocker / "cache")
+    assert not _publish(blocker / "cache" / "x-1.arrow", lambda tmp: tmp.write_bytes(b""))
+
+
+def test_load_columnar_round_trips_through_arrow(cache_dir, country_csv):
+    parsed = _load_columnar(country_csv, _parse_country_csv)
+    [artifact] = cache_dir.iterdir()
+    assert artifact.suffix == ".arrow"
+
+    loaded = _load_columnar(country_csv, _parse_country_csv)
+    pd.testing.assert_frame_equal(loaded, parsed)
+    assert loaded["INTJ"].dtype == np.float32
+    # 바뀐 CSV는 새 키로 다시 만들고 예전 파일은 지움
+    country_csv.write_text("Country,INTJ,ENFP\nC,0.5,0.5\n")
+    assert _load_columnar(country_csv, _parse_country_csv)["Country"].tolist() == ["C"]
+    [new_artifact] = cache_dir.iterdir()
+    assert new_artifact.name != artifact.name
+
+
+def test_shared_frames_are_read_only():
+    df = load_country_mbti()
+    with pytest.raises(ValueError):
+        df[df.columns[1]].to_numpy()[0] = 1.0
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pytest
+
+import mbti_core.disk_cache as disk_cache
+from mbti_core.disk_cache import disk_cached
+
+
+@pytest.fixture
+def results_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(disk_cache, "RESULTS_DIR", tmp_path)
+    return tmp_path
+
+
+def test_disk_cached_reads_the_stored_result(results_dir):
+    calls = []
+
+    def build():
+        calls.append(1)
+        return {"value": 1}
+
+    assert disk_cached("table", "v1", build) == {"value": 1}
+    assert disk_cached("table", "v1", build) == {"value": 1}
+    assert len(calls) == 1
+    # 잠금 파일은 만드는 동안에만 있음
+    assert [p.name for p in results_dir.iterdir()] == ["table-v1.pkl"]
+
+
+def test_disk_cached_removes_stale_versions(results_dir):
+    disk_cached("table", "v1", lambda: 1)
+    disk_cached("other", "v1", lambda: 2)
+    assert disk_cached("table", "v2", lambda: 3) == 3
+    assert sorted(p.name for p in results_dir.iterdir()) == ["other-v1.pkl", "table-v2.pkl"]
+
+
+def test_disk_cached_can_be_turned_off(results_dir, monkeypatch):
+    monkeypatch.setenv("MBTI_SHARED_CACHE", "0")
+    calls = []
+    disk_cached("table", "v1", lambda: calls.append(1))
+    disk_cached("table", "v1", lambda: calls.append(1))
+    assert len(calls) == 2
+    assert list(results_dir.iterdir()) == []
+
+
+def _run_together(target, count=6, stagger=0.0):
+    threads = [threading.Thread(target=target) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+        time.sleep(stagger)
+    for thread in threads:
+        thread.join()
+
+
+def test_disk_cached_builds_once_under_concurrent_calls(results_dir):
+    calls, results = [], []
+
+    def build():
+        calls.append(1)
+        time.sleep(0.05)
+        return "built"
+
+    _run_together(lambda: results.append(disk_cached("table", "v1", build)))
+    assert calls == [1]
+    assert results == ["built"] * 6
+
+
+def test_disk_cached_never_builds_twice_at_once_after_a_failed_build(results_dir):
+    # 먼저 잠근 쪽이 실패하고 잠금 파일을 지워도, 기다리던 쪽과 새로 온 쪽이 동시에 만들면 안 됨
+    state = {"active": 0, "peak": 0, "calls": 0}
+    guard = threading.Lock()
+
+    def build():
+        with guard:
+            state["calls"] += 1
+            first = state["calls"] == 1
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+        time.sleep(0.05)
+        with guard:
+            state["active"] -= 1
+        if first:
+            raise RuntimeError("build failed")
+        return "built"
+
+    results = []
+
+    def call():
+        try:
+            results.append(disk_cached("table", "v1", build))
+        except RuntimeError:
+            results.append("failed")
+
+    # 먼저 온 쪽이 실패한 뒤에 오는 호출도 있도록 조금씩 늦게 시작
+    _run_together(call, stagger=0.02)
+    assert state["peak"] == 1
+    assert sorted(results) == ["built"] * 5 + ["failed"]
+    assert [p.name for p in results_dir.iterdir()] == ["table-v1.pkl"]
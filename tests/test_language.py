@@ -0,0 +1,34 @@
+import pytest
+
+from mbti_core.data import load_language_popularity
+from mbti_core.language import language_stats, language_summary
+
+
+def test_language_summary_matches_per_language_pandas():
+    df = load_language_popularity()
+    summary = language_summary().set_index("language")
+    assert len(summary) == len(df.columns) - 1
+    for language in df.columns.drop("Date"):
+        column = df[language]
+        row = summary.loc[language]
+        assert row["current"] == column.iloc[-1]
+        assert row["mean"] == pytest.approx(column.mean())
+        assert row["max"] == column.max()
+        assert row["min"] == column.min()
+        assert row["peak_date"] == df["Date"][column.idxmax()]
+        assert row["change"] == pytest.approx(column.iloc[-1] - column.iloc[0])
+
+
+def test_language_summary_is_ranked_by_current_popularity():
+    summary = language_summary()
+    assert summary["rank"].tolist() == list(range(1, len(summary) + 1))
+    assert summary["current"].is_monotonic_decreasing
+
+
+def test_language_stats_returns_one_row():
+    first = language_summary().iloc[0]
+    stats = language_stats(first["language"])
+    assert stats["rank"] == 1
+    assert stats["current"] == first["current"]
+    with pytest.raises(KeyError):
+        language_stats("Brainfuck")
@@ -0,0 +1,74 @@
+import pytest
+
+from mbti_core.metrics import BUCKETS, Histogram, MetricsRegistry, PhaseTimer, metrics_registry, span
+
+
+def test_histogram_counts_values_into_buckets():
+    histogram = Histogram()
+    for seconds in (0.0001, 0.0005, 0.003, 20.0):
+        histogram.observe(seconds)
+    # 경계값은 그 구간에 들어가고(le), 10초를 넘으면 마지막 칸
+    assert histogram.counts[0] == 2
+    assert histogram.counts[BUCKETS.index(0.005)] == 1
+    assert histogram.counts[-1] == 1
+    assert histogram.count == 4
+    assert histogram.total == pytest.approx(20.0036)
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    histogram = Histogram()
+    assert histogram.quantile(0.5) == 0.0
+    for _ in range(4):
+        histogram.observe(0.03)  # 0.025 ~ 0.05 구간
+    assert histogram.quantile(0.5) == pytest.approx(0.0375)
+    assert histogram.quantile(1.0) == pytest.approx(0.05)
+    histogram.observe(60.0)
+    assert histogram.quantile(1.0) == BUCKETS[-1]
+
+
+def test_prometheus_text_has_cumulative_buckets_and_escaped_labels():
+    registry = MetricsRegistry()
+    registry.observe('page "a"', "load", 0.002)
+    registry.observe('page "a"', "load", 0.2)
+    lines = registry.prometheus_text().splitlines()
+
+    assert lines[0].startswith("# HELP mbti_phase_seconds")
+    assert lines[1] == "# TYPE mbti_phase_seconds histogram"
+    labels = 'page="page \\"a\\"",phase="load"'
+    buckets = [line for line in lines if line.startswith("mbti_phase_seconds_bucket")]
+    assert len(buckets) == len(BUCKETS) + 1
+    assert f'mbti_phase_seconds_bucket{{{labels},le="0.001"}} 0' in lines
+    assert f'mbti_phase_seconds_bucket{{{labels},le="0.0025"}} 1' in lines
+    assert f'mbti_phase_seconds_bucket{{{labels},le="0.25"}} 2' in lines
+    assert f'mbti_phase_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"mbti_phase_seconds_sum{{{labels}}} 0.202000" in lines
+    assert f"mbti_phase_seconds_count{{{labels}}} 2" in lines
+
+
+def test_summary_reports_milliseconds():
+    registry = MetricsRegistry()
+    registry.observe("page", "compute", 0.004)
+    [(key, stats)] = registry.summary().items()
+    assert key == ("page", "compute")
+    assert stats["count"] == 1
+    assert stats["mean_ms"] == 4.0
+    assert 2.5 <= stats["p50_ms"] <= 5.0
+
+
+def test_span_and_phase_timer_record_into_shared_registry():
+    registry = metrics_registry()
+    registry.clear()
+
+    with pytest.raises(RuntimeError):
+        with span("test_page", "compute"):
+            raise RuntimeError  # 예외가 나도 기록
+
+    timer = PhaseTimer("test_page")
+    timer.begin("render")
+    timer.end()
+    timer.end()  # begin 없이 부른 end는 무시
+
+    summary = registry.summary()
+    assert summary[("test_page", "compute")]["count"] == 1
+    assert summary[("test_page", "render")]["count"] == 1
+    registry.clear()
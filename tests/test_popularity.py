@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from mbti_core.data import load_language_popularity
+from mbti_core.popularity import latest_date, popularity_between, year_bounds, year_span
+
+
+@pytest.mark.parametrize("start, end", [
+    ("2019-01-01", None),
+    (None, "2010-06-15"),
+    ("2010", "2014-12-31"),
+    ("2004-07-01", "2004-07-01"),
+    ("2030-01-01", None),
+])
+def test_popularity_between_matches_boolean_mask(start, end):
+    df = load_language_popularity()
+    mask = pd.Series(True, index=df.index)
+    if start is not None:
+        mask &= df["Date"] >= pd.Timestamp(start)
+    if end is not None:
+        mask &= df["Date"] <= pd.Timestamp(end)
+    expected = df[mask].set_index("Date")
+
+    rows = popularity_between(start, end)
+    pd.testing.assert_frame_equal(rows, expected, check_freq=False)
+
+
+def test_popularity_between_selects_columns():
+    rows = popularity_between("2020", columns=["Python", "Java"])
+    assert list(rows.columns) == ["Python", "Java"]
+    assert rows.index[0] >= pd.Timestamp("2020-01-01")
+
+
+def test_latest_date_and_year_bounds():
+    dates = load_language_popularity()["Date"]
+    assert latest_date() == dates.max()
+    assert year_bounds() == (dates.min().year, dates.max().year)
+
+
+def test_year_span_covers_whole_years():
+    start, end = year_span(2010, 2012)
+    assert start == pd.Timestamp("2010-01-01")
+    assert end == pd.Timestamp("2012-12-31")
+    assert popularity_between(start, end).index.year.unique().tolist() == [2010, 2011, 2012]
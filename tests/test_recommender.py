@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+from mbti_core.recommender import MBTI_TYPES, recommend_batch, score_matrix, top_languages, type_weights
+
+
+def test_type_weights_rows_sum_to_one():
+    weights = type_weights([[52, 80, 30, 65], [10, 45, 90, 20], [50, 50, 50, 50]])
+    assert weights.shape == (3, 16)
+    assert weights.sum(axis=1) == pytest.approx([1, 1, 1])
+    assert weights[2] == pytest.approx(np.full(16, 1 / 16))
+
+
+@pytest.mark.parametrize("mbti", MBTI_TYPES)
+def test_type_weights_pure_type(mbti):
+    percentages = [100 if letter in "ENTJ" else 0 for letter in mbti]
+    weights = type_weights(percentages)
+    assert weights.shape == (1, 16)
+    assert MBTI_TYPES[weights.argmax()] == mbti
+    assert weights.max() == pytest.approx(1)
+
+
+def test_type_weights_clips_out_of_range():
+    assert type_weights([150, -20, 100, 0]) == pytest.approx(type_weights([100, 0, 100, 0]))
+
+
+def test_recommend_batch_columns_and_rows():
+    result = recommend_batch([[52, 80, 30, 65], [10, 45, 90, 20]], k=3)
+    assert result.columns.tolist() == [
+        "type", "language_1", "language_2", "language_3", "score_1", "score_2", "score_3",
+    ]
+    assert len(result) == 2
+    scores = result[["score_1", "score_2", "score_3"]].to_numpy()
+    assert (np.diff(scores, axis=1) <= 0).all()
+
+
+def test_recommend_batch_matches_full_sort():
+    percentages = [[52, 80, 30, 65], [10, 45, 90, 20], [0, 100, 100, 0]]
+    matrix = score_matrix()
+    scores = type_weights(percentages) @ matrix.scores
+    result = recommend_batch(percentages, k=5)
+    for row, expected in zip(result.itertuples(index=False), scores):
+        top = np.sort(expected)[::-1][:5]
+        assert [getattr(row, f"score_{n}") for n in range(1, 6)] == pytest.approx(top)
+
+
+@pytest.mark.parametrize("mbti", ["INTJ", "ESFP"])
+def test_recommend_batch_pure_type_matches_top_languages(mbti):
+    percentages = [100 if letter in "ENTJ" else 0 for letter in mbti]
+    result = recommend_batch(percentages, k=3)
+    assert result.loc[0, "type"] == mbti
+    expected = top_languages(mbti, 3)
+    assert [result.loc[0, f"score_{n}"] for n in (1, 2, 3)] == pytest.approx(expected["score"].tolist())
+
+
+def test_recommend_batch_k_larger_than_languages():
+    languages = len(score_matrix().languages)
+    result = recommend_batch([50, 50, 50, 50], k=languages + 5)
+    assert f"language_{languages}" in result.columns
+    assert f"language_{languages + 1}" not in result.columns
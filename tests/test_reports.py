@@ -0,0 +1,50 @@
+import io
+import zipfile
+
+import pandas as pd
+import pytest
+
+from mbti_core.registry import recommendations
+from mbti_core.reports import build_report_zip, render_group
+
+
+def _unzip(data: bytes) -> dict:
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {name: archive.read(name).decode("utf-8") for name in archive.namelist()}
+
+
+def test_build_report_zip_writes_one_report_per_known_student(monkeypatch):
+    monkeypatch.setenv("MBTI_REPORT_WORKERS", "1")
+    roster = pd.DataFrame({"name": ["김민준", "이 서/연", "박지호"], "mbti": ["INTJ", "ENFP", "XXXX"]})
+    progress = []
+
+    reports = _unzip(build_report_zip(roster, "gemini", progress=lambda done, total: progress.append((done, total))))
+
+    # 16유형이 아닌 학생은 건너뛰고, 파일 이름에 못 쓰는 글자는 _로 바꿈
+    assert sorted(reports) == ["0001_김민준.html", "0002_이_서_연.html"]
+    cards = recommendations("gemini")
+    assert "MBTI: <strong>INTJ</strong>" in reports["0001_김민준.html"]
+    assert cards["INTJ"]["language"] in reports["0001_김민준.html"]
+    assert cards["ENFP"]["language"] in reports["0002_이_서_연.html"]
+    assert progress[-1] == (2, 2)
+
+
+def test_build_report_zip_rejects_unknown_variant():
+    with pytest.raises(ValueError):
+        build_report_zip(pd.DataFrame({"name": [], "mbti": []}), "unknown")
+
+
+def test_render_group_escapes_text_fields():
+    task = {
+        "figure_json": None,
+        "cards": {"INTJ": {"card_html": "<div>card</div>", "traits": ["<b>"], "language": "C<++>"}},
+        "students": [(0, "<script>", "INTJ")],
+    }
+    [(file_name, content)] = render_group(task)
+    assert file_name == "0001_script.html"
+    assert "<script>" not in content
+    assert "&lt;script&gt;" in content
+    assert "C&lt;++&gt;" in content
+    assert "<b>" not in content
+    # 카드 HTML은 페이지에서 만든 그대로 넣음
+    assert "<div>card</div>" in content
@@ -0,0 +1,66 @@
+import io
+
+import pandas as pd
+import pytest
+
+from mbti_core.registry import recommendations
+from mbti_core.roster import read_roster, recommend_chunk
+
+
+def _read(text: str, chunk_rows: int = 20_000) -> pd.DataFrame:
+    return pd.concat(read_roster(io.StringIO(text), chunk_rows), ignore_index=True)
+
+
+def test_read_roster_finds_named_columns_and_normalises_mbti():
+    roster = _read("번호,MBTI,이름\n1, infp ,김민준\n2,ENTJ,이서연\n")
+    assert roster["name"].tolist() == ["김민준", "이서연"]
+    assert roster["mbti"].tolist() == ["INFP", "ENTJ"]
+
+
+def test_read_roster_falls_back_to_first_two_columns():
+    roster = _read("a,b\n김민준,intj\n")
+    assert roster.to_dict("records") == [{"name": "김민준", "mbti": "INTJ"}]
+
+
+def test_read_roster_mbti_fallback_skips_name_column():
+    # 이름 컬럼이 둘째에 있으면 MBTI는 남은 첫 컬럼
+    roster = _read("code,name\nestp,김민준\n")
+    assert roster.to_dict("records") == [{"name": "김민준", "mbti": "ESTP"}]
+
+
+def test_read_roster_without_mbti_column():
+    with pytest.raises(ValueError, match="MBTI"):
+        _read("이름\n김민준\n")
+
+
+def test_read_roster_chunks():
+    text = "이름,MBTI\n" + "".join(f"학생{i},INTP\n" for i in range(25))
+    chunks = list(read_roster(io.StringIO(text), chunk_rows=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+
+
+def test_recommend_chunk_keeps_order_and_unknown_types():
+    chunk = pd.DataFrame({"name": ["가", "나", "다"], "mbti": ["ESFJ", "XXXX", "INTJ"]})
+    result = recommend_chunk(chunk, "chatgpt")
+    expected = recommendations("chatgpt")
+    assert result["name"].tolist() == ["가", "나", "다"]
+    assert result.loc[0, "language"] == expected["ESFJ"]["language"]
+    assert result.loc[2, "language"] == expected["INTJ"]["language"]
+    assert pd.isna(result.loc[1, "language"])
+    assert result.columns.tolist() == ["name", "mbti", "language", "column"]
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-8-sig", "cp949"])
+def test_read_roster_reads_utf8_and_cp949_bytes(encoding):
+    data = "이름,MBTI\n김민준,intj\n이서연,enfp\n".encode(encoding)
+    chunks = list(read_roster(io.BytesIO(data), chunk_rows=1))
+    roster = pd.concat(chunks, ignore_index=True)
+    assert roster.to_dict("records") == [{"name": "김민준", "mbti": "INTJ"}, {"name": "이서연", "mbti": "ENFP"}]
+
+
+def test_read_roster_detects_cp949_after_the_first_chunk():
+    # 디코딩 오류가 둘째 청크에서야 나는 파일도 처음부터 cp949로 읽음
+    data = ("name,mbti\n" + "kim,intj\n" * 50 + "이서연,enfp\n").encode("cp949")
+    roster = pd.concat(read_roster(io.BytesIO(data), chunk_rows=10), ignore_index=True)
+    assert len(roster) == 51
+    assert roster["name"].iloc[-1] == "이서연"
@@ -0,0 +1,55 @@
+import pytest
+
+from mbti_core.table import load_table, table_page
+
+
+def test_first_page():
+    table = load_table("country_mbti")
+    page = table_page("country_mbti", page_size=10)
+    assert page.rows.index.tolist() == table.index[:10].tolist()
+    assert page.total == len(table)
+    assert (page.first_row, page.last_row) == (1, 10)
+
+
+def test_page_out_of_range_clamps_to_last_page():
+    table = load_table("country_mbti")
+    page = table_page("country_mbti", page=10_000, page_size=10)
+    assert page.page == page.pages - 1
+    assert page.last_row == len(table)
+    assert page.rows.index.tolist() == table.index[page.page * 10:].tolist()
+    assert table_page("country_mbti", page=-3, page_size=10).page == 0
+
+
+def test_sort_descending_matches_pandas():
+    table = load_table("country_mbti")
+    page = table_page("country_mbti", sort="INTJ", ascending=False, page=1, page_size=20)
+    expected = table.sort_values("INTJ", ascending=False, kind="stable").iloc[20:40]
+    assert page.rows["Country"].tolist() == expected["Country"].tolist()
+
+
+def test_search_is_case_insensitive_substring():
+    table = load_table("country_mbti")
+    page = table_page("country_mbti", query="  KOR ", page_size=len(table))
+    expected = table[table["Country"].str.lower().str.contains("kor", regex=False)]
+    assert page.rows["Country"].tolist() == expected["Country"].tolist()
+    assert page.total == len(expected) > 0
+
+
+def test_search_without_matches():
+    page = table_page("country_mbti", query="no such country")
+    assert page.total == 0
+    assert page.pages == 1
+    assert (page.first_row, page.last_row) == (0, 0)
+
+
+def test_search_then_sort_language_summary():
+    page = table_page("language_summary", sort="current", ascending=False, query="java")
+    assert sorted(page.rows["language"]) == ["Java", "JavaScript"]
+    assert page.rows["current"].is_monotonic_decreasing
+
+
+def test_invalid_arguments():
+    with pytest.raises(KeyError):
+        table_page("no_such_table")
+    with pytest.raises(ValueError):
+        table_page("country_mbti", page_size=0)